@@ -1,10 +1,44 @@
 from general_solver_functions_access import calculate_board_fitness_report
+from general_solver_functions_access import solver_functions_backend
 
 from genetic_algorithm import solve_using_genetic_algorithm
 
+from island_model import close_island_executor
+from island_model import open_island_executor
+
+from solver_functions_session import close_solver_functions_session
+from solver_functions_session import open_solver_functions_session
+
+from compute_executor import close_compute_executor
+from compute_executor import open_compute_executor
+
+from solver_jobs import submit_solver_job
+from solver_jobs import delete_solver_job
+from solver_jobs import close_solver_jobs
+from solver_jobs import open_solver_jobs
+from solver_jobs import get_solver_job
+from solver_jobs import get_jobs_queue_size
+from solver_jobs import JobsQueueFull
+from solver_jobs import solver_jobs
+
+from metrics import METRICS_CONTENT_TYPE
+from metrics import metrics_middleware
+from metrics import measure_duration
+from metrics import describe_metric
+from metrics import render_metrics
+from metrics import set_gauge
+
+from request_timings import request_timings_middleware
+from request_timings import round_request_timings
+from request_timings import is_profile_requested
+from request_timings import get_request_timings
+from request_timings import profile_awaitable
+from request_timings import measure_phase
+
 from logger import setup_logger
 
 from aiohttp.web_request import Request
+from functools import partial
 from http import HTTPStatus
 from aiohttp import web
 import json
@@ -12,7 +46,9 @@ import os
 
 logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
 api_routes = web.RouteTableDef()
-api = web.Application()
+api = web.Application(middlewares=[metrics_middleware, request_timings_middleware])
+
+NDJSON_CONTENT_TYPE = r"application/x-ndjson"
 
 
 @api_routes.get(r"/health_test")
@@ -35,6 +71,423 @@ async def health_test(_: Request) -> web.Response:
     )
 
 
+async def read_request_body(request: Request) -> dict:
+
+    """Read Request Body
+
+    This function deserializes the json body of a request made to any path of this api.
+
+    Args:
+        request (aiohttp.web_request.Request): An http request made from the middle proxy.
+
+    Returns:
+        dict: The deserialized request body.
+    """
+
+    raw_body = await request.read()
+
+    with measure_duration(r"request_body_parse_seconds"), measure_phase(r"parse"):
+        return json.loads(raw_body)
+
+
+async def build_solution_response_dict(
+    solution_board: list,
+    stop_reason: str,
+    generations_run: int,
+    zone_height: int,
+    zone_length: int,
+) -> dict:
+
+    """Build Solution Response Dict
+
+    This function calculates the fitness report of the solution board and packages it with the solution board and the solving
+    stop details in the response body dict.
+
+    Args:
+        solution_board (list): The best board found by the genetic algorithm.
+        stop_reason (str): The reason why the genetic algorithm stopped.
+        generations_run (int): The number of generations that were evolved.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        dict: The response body dict.
+    """
+
+    with measure_phase(r"report"):
+        (
+            total_collisions,
+            column_collisions,
+            row_collisions,
+            zone_collisions,
+        ) = await calculate_board_fitness_report(
+            zone_height=zone_height,
+            zone_length=zone_length,
+            board=solution_board,
+        )
+
+    return {
+        "totalCollisions": total_collisions,
+        "columnCollisions": column_collisions,
+        "rowCollisions": row_collisions,
+        "zoneCollisions": zone_collisions,
+        "solutionBoard": solution_board,
+        "stopReason": stop_reason,
+        "generationsRun": generations_run,
+    }
+
+
+def check_puzzle_parameters(board: list, zone_height: int, zone_length: int) -> bool:
+
+    """Check Puzzle Parameters
+
+    This function checks that the zones measures are positive integers and that the initial board is a square list of rows with a
+    cell for every number of the board, where every cell is an integer between zero and the board size.
+
+    Args:
+        board (list): The initial board representation.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        bool: Indicates if the puzzle parameters are valid.
+    """
+
+    if not type(zone_height) is int or not type(zone_length) is int or not min(zone_height, zone_length) > 0:
+        return False
+
+    board_size = zone_height * zone_length
+
+    if not type(board) is list or not len(board) == board_size:
+        return False
+
+    return all(
+        type(row) is list
+        and len(row) == board_size
+        and all(type(number) is int and 0 <= number <= board_size for number in row)
+        for row in board
+    )
+
+
+def build_solver_parameters(request_body: dict) -> dict:
+
+    """Build Solver Parameters
+
+    This function extracts the mandatory parameters of a puzzle from a request body and validates its optional solver parameters,
+    the optional parameters that are not given or not valid take their default values, the mandatory parameters must be valid.
+
+    Args:
+        request_body (dict): The request body of a puzzle with the initial board, the zones measures and the optional solver
+        parameters.
+
+    Returns:
+        dict: The solve using genetic algorithm function parameters.
+
+    Raises:
+        KeyError: If a mandatory parameter is not given.
+        ValueError: If the mandatory parameters are not a valid puzzle.
+    """
+
+    generations_validator, population_validator = True, True
+    mutation_validator, crossover_validator = True, True
+    deadline_validator, target_fitness_validator = True, True
+    islands_validator, migration_interval_validator = True, True
+
+    generations, population = 10, 10
+    mutation, crossover = 0.2, 0.8
+    deadline, target_fitness = None, 0
+    islands, migration_interval = 1, 10
+
+    sudoku_initial_board = request_body["initial_board"]
+    sudoku_zone_height = request_body["zone_height"]
+    sudoku_zone_length = request_body["zone_length"]
+
+    if not check_puzzle_parameters(
+        board=sudoku_initial_board, zone_height=sudoku_zone_height, zone_length=sudoku_zone_length
+    ):
+        raise ValueError(r"the initial board and the zones measures aren't a valid puzzle")
+
+    logger.debug(
+        msg=r"request body successfully parsed and mandatory parameters successfully extracted"
+    )
+
+    logger.debug(
+        msg=r"request body successfully parsed and mandatory parameters successfully extracted"
+    )
+
+    logger.debug(msg=r"generating body keys array")
+
+    request_body_keys = [key for key in request_body.keys()]
+
+    logger.debug(msg=r"searching optional solver parameters")
+
+    # Validation and search of specific solver parameters.
+
+    if "generations" in request_body_keys:
+
+        logger.info(msg=r"generations key found")
+
+        if not type(request_body["generations"]) is int:
+            logger.info(msg=r"generations value not valid, using default")
+            generations_validator = False
+
+        elif not request_body["generations"] > 0:
+            logger.info(msg=r"generations value not valid, using default")
+            generations_validator = False
+
+        if generations_validator is True:
+            logger.info(msg=r"generations value valid, establishing generations value")
+            generations = request_body["generations"]
+
+    if "population" in request_body_keys:
+
+        logger.info(msg=r"population key found")
+
+        if not type(request_body["population"]) is int:
+            logger.info(msg=r"population value not valid, using default")
+            population_validator = False
+
+        elif not request_body["population"] > 0:
+            logger.info(msg=r"population value not valid, using default")
+            population_validator = False
+
+        if population_validator is True:
+            logger.info(msg=r"population value valid, establishing population value")
+            population = request_body["population"]
+
+    if "mutation" in request_body_keys:
+
+        logger.info(msg=r"mutation key found")
+
+        if not type(request_body["mutation"]) is float:
+            logger.info(msg=r"mutation value not valid, using default")
+            mutation_validator = False
+
+        elif not 0 < request_body["mutation"] <= 1:
+            logger.info(msg=r"mutation value not valid, using default")
+            mutation_validator = False
+
+        if mutation_validator is True:
+            logger.info(msg=r"mutation value valid, establishing mutation value")
+            mutation = request_body["mutation"]
+
+    if "crossover" in request_body_keys:
+
+        logger.info(msg=r"crossover key found")
+
+        if not type(request_body["crossover"]) is float:
+            logger.info(msg=r"crossover value not valid, using default")
+            crossover_validator = False
+
+        elif not 0 < request_body["crossover"] <= 1:
+            logger.info(msg=r"crossover value not valid, using default")
+            crossover_validator = False
+
+        if crossover_validator is True:
+            logger.info(msg=r"crossover value valid, establishing crossover value")
+            crossover = request_body["crossover"]
+
+    if "deadlineMs" in request_body_keys:
+
+        logger.info(msg=r"deadline key found")
+
+        if not type(request_body["deadlineMs"]) is int:
+            logger.info(msg=r"deadline value not valid, solving without deadline")
+            deadline_validator = False
+
+        elif not request_body["deadlineMs"] > 0:
+            logger.info(msg=r"deadline value not valid, solving without deadline")
+            deadline_validator = False
+
+        if deadline_validator is True:
+            logger.info(msg=r"deadline value valid, establishing deadline value")
+            deadline = request_body["deadlineMs"]
+
+    if "targetFitness" in request_body_keys:
+
+        logger.info(msg=r"target fitness key found")
+
+        if not type(request_body["targetFitness"]) is int:
+            logger.info(msg=r"target fitness value not valid, using default")
+            target_fitness_validator = False
+
+        elif not request_body["targetFitness"] >= 0:
+            logger.info(msg=r"target fitness value not valid, using default")
+            target_fitness_validator = False
+
+        if target_fitness_validator is True:
+            logger.info(msg=r"target fitness value valid, establishing target fitness value")
+            target_fitness = request_body["targetFitness"]
+
+    if "islands" in request_body_keys:
+
+        logger.info(msg=r"islands key found")
+
+        if not type(request_body["islands"]) is int:
+            logger.info(msg=r"islands value not valid, using default")
+            islands_validator = False
+
+        elif not request_body["islands"] > 0:
+            logger.info(msg=r"islands value not valid, using default")
+            islands_validator = False
+
+        if islands_validator is True:
+            logger.info(msg=r"islands value valid, establishing islands value")
+            islands = request_body["islands"]
+
+    if "migrationInterval" in request_body_keys:
+
+        logger.info(msg=r"migration interval key found")
+
+        if not type(request_body["migrationInterval"]) is int:
+            logger.info(msg=r"migration interval value not valid, using default")
+            migration_interval_validator = False
+
+        elif not request_body["migrationInterval"] > 0:
+            logger.info(msg=r"migration interval value not valid, using default")
+            migration_interval_validator = False
+
+        if migration_interval_validator is True:
+            logger.info(msg=r"migration interval value valid, establishing migration interval value")
+            migration_interval = request_body["migrationInterval"]
+
+    return {
+        "genetic_algorithm_generations": generations,
+        "genetic_algorithm_population": population,
+        "genetic_algorithm_crossover": crossover,
+        "genetic_algorithm_mutation": mutation,
+        "zone_height": sudoku_zone_height,
+        "zone_length": sudoku_zone_length,
+        "board": sudoku_initial_board,
+        "target_fitness": target_fitness,
+        "deadline_ms": deadline,
+        "islands": islands,
+        "migration_interval": migration_interval,
+    }
+
+
+async def run_solver(request: Request, solver_parameters: dict, progress_callback=None) -> tuple:
+
+    """Run Solver
+
+    This function solves the board using the genetic algorithm, if the request asks for a profile in the debug timings header the
+    solving is profiled and the profile summary is returned with the solution.
+
+    Args:
+        request (aiohttp.web_request.Request): The http request verified for the middle proxy.
+        solver_parameters (dict): The solve using genetic algorithm function parameters.
+        progress_callback (Callable): An async function that recives the solving progress.
+
+    Returns:
+        tuple: The solution board, the stop reason and the number of generations that were evolved.
+        str: The profile summary or None if the profile was not requested.
+    """
+
+    solving = solve_using_genetic_algorithm(progress_callback=progress_callback, **solver_parameters)
+
+    if is_profile_requested(request) is False:
+        return await solving, None
+
+    logger.info(msg=r"profiling the solving")
+
+    return await profile_awaitable(solving)
+
+
+def add_debug_details(response_dict: dict, profile_summary: str) -> dict:
+
+    """Add Debug Details
+
+    This function adds the phase timings of the request to the response body dict if the request is being timed, and the profile
+    summary if the solving was profiled.
+
+    Args:
+        response_dict (dict): The response body dict.
+        profile_summary (str): The profile summary or None if the solving was not profiled.
+
+    Returns:
+        dict: The response body dict with the debug details.
+    """
+
+    timings = get_request_timings()
+
+    if timings is not None:
+        response_dict["timings"] = round_request_timings(timings)
+
+    if profile_summary is not None:
+        response_dict["profile"] = profile_summary
+
+    return response_dict
+
+
+async def stream_solver(request: Request, solver_parameters: dict) -> web.StreamResponse:
+
+    """Stream Solver
+
+    This function solves the board using the genetic algorithm and streams the solving progress as newline delimited json, every
+    line is a json object with a type key, one progress line is sent after the initialization and after every generation and the
+    last line is the solution, or an error line if something goes wrong, if the client disconnects the solving is abandoned.
+
+    Args:
+        request (aiohttp.web_request.Request): The http request verified for the middle proxy.
+        solver_parameters (dict): The solve using genetic algorithm function parameters.
+
+    Returns:
+        web.StreamResponse: A 200 status code and the streamed lines.
+    """
+
+    stream_response = web.StreamResponse(
+        reason=r"ok",
+        status=HTTPStatus.OK,
+        headers={"Content-Type": NDJSON_CONTENT_TYPE, "X-Accel-Buffering": "no"},
+    )
+    await stream_response.prepare(request)
+
+    async def send_line(line: dict) -> None:
+        await stream_response.write((json.dumps(obj=line, indent=None) + "\n").encode())
+
+    async def send_progress(progress: dict) -> None:
+        await send_line({"type": "progress", **progress})
+
+    try:
+
+        (
+            (
+                solution_board,
+                stop_reason,
+                generations_run,
+            ),
+            profile_summary,
+        ) = await run_solver(request=request, solver_parameters=solver_parameters, progress_callback=send_progress)
+
+        response_dict = await build_solution_response_dict(
+            zone_height=solver_parameters["zone_height"],
+            zone_length=solver_parameters["zone_length"],
+            generations_run=generations_run,
+            solution_board=solution_board,
+            stop_reason=stop_reason,
+        )
+
+        logger.info(msg=r"streaming solution to the middle proxy")
+
+        await send_line({"type": "solution", **add_debug_details(response_dict, profile_summary)})
+
+    except ConnectionResetError:
+
+        logger.info(msg=r"client disconnected, solving abandoned")
+
+        return stream_response
+
+    except:
+
+        logger.exception(msg=r"exception in the solver stream")
+
+        await send_line({"type": "error", "reason": r"internal error inside the solver server"})
+
+    await stream_response.write_eof()
+
+    return stream_response
+
+
 @api_routes.post(r"/solver")
 async def solver(request: Request) -> web.Response:
 
@@ -42,7 +495,8 @@ async def solver(request: Request) -> web.Response:
 
     This function is in charge to expose the solver functionality, this function receives the board solve parameters and initial
     board in the body of a json http request and returns response with the board best solution that this solver could find using a
-    genetic algorithm in the response body also using json format.
+    genetic algorithm in the response body also using json format, if the request has the debug timings header the response body
+    also includes the timings of the solving phases and a profile summary of the solving if the header value is profile.
 
     Args:
         request (aiohttp.web_request.Request): An http request verified for the middle proxy that contains in the body the solve
@@ -55,162 +509,359 @@ async def solver(request: Request) -> web.Response:
 
     try:
 
-        logger.debug(msg=r"validating middle proxy authorization")
+        if check_authorization(request) is True:
 
-        request_header_keys = [key for key in request.headers.keys()]
+            logger.debug(
+                msg=r"parsing the request body and extracting mandatory parameters"
+            )
 
-        if (
-            "Authorization" in request_header_keys
-            and request.headers["Authorization"] == os.environ["ACCESS_KEY"]
-        ):
+            request_body = await read_request_body(request)
 
-            logger.debug(msg=r"middle proxy authorization validated")
+            solver_parameters = build_solver_parameters(request_body=request_body)
 
-            generations_validator, population_validator = True, True
-            mutation_validator, crossover_validator = True, True
+            # The solving progress is streamed if the middle proxy accepts newline delimited json.
 
-            generations, population = 10, 10
-            mutation, crossover = 0.2, 0.8
+            if NDJSON_CONTENT_TYPE in request.headers.get("Accept", ""):
+                logger.info(msg=r"streaming solver progress to the middle proxy")
+                return await stream_solver(request=request, solver_parameters=solver_parameters)
 
-            logger.debug(
-                msg=r"parsing the request body and extracting mandatory parameters"
+            (
+                (
+                    solution_board,
+                    stop_reason,
+                    generations_run,
+                ),
+                profile_summary,
+            ) = await run_solver(request=request, solver_parameters=solver_parameters)
+
+            response_dict = await build_solution_response_dict(
+                zone_height=solver_parameters["zone_height"],
+                zone_length=solver_parameters["zone_length"],
+                generations_run=generations_run,
+                solution_board=solution_board,
+                stop_reason=stop_reason,
             )
 
-            request_body = await request.json()
-
-            sudoku_initial_board = request_body["initial_board"]
-            sudoku_zone_height = request_body["zone_height"]
-            sudoku_zone_length = request_body["zone_length"]
+            logger.info(msg=r"sending solution to the middle proxy")
 
-            logger.debug(
-                msg=r"request body successfully parsed and mandatory parameters successfully extracted"
+            return web.Response(
+                reason=r"ok",
+                body=json.dumps(obj=add_debug_details(response_dict, profile_summary), indent=None),
+                status=HTTPStatus.OK,
             )
 
-            logger.debug(
-                msg=r"request body successfully parsed and mandatory parameters successfully extracted"
+        else:
+
+            return web.Response(
+                reason=r"you aren't authorized to use this api",
+                status=HTTPStatus.UNAUTHORIZED,
             )
 
-            logger.debug(msg=r"generating body keys array")
+    except:
 
-            request_body_keys = [key for key in request_body.keys()]
+        logger.exception(msg=r"exception in the solver api")
 
-            logger.debug(msg=r"searching optional solver parameters")
+        return web.Response(
+            reason=r"internal error inside the solver server",
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+
+def check_authorization(request: Request) -> bool:
+
+    """Check Authorization
+
+    This function checks if a request made to the api has the access key of the middle proxy in the authorization header.
+
+    Args:
+        request (aiohttp.web_request.Request): An http request made from the middle proxy.
+
+    Returns:
+        bool: Indicates if the request is authorized.
+    """
 
-            # Validation and search of specific solver parameters.
+    logger.debug(msg=r"validating middle proxy authorization")
 
-            if "generations" in request_body_keys:
+    with measure_duration(r"authorization_check_seconds"), measure_phase(r"auth"):
+        authorized = request.headers.get("Authorization") == os.environ["ACCESS_KEY"]
 
-                logger.info(msg=r"generations key found")
+    if authorized is True:
+        logger.debug(msg=r"middle proxy authorization validated")
+        return True
 
-                if not type(request_body["generations"]) is int:
-                    logger.info(msg=r"generations value not valid, using default")
-                    generations_validator = False
+    logger.error(msg=r"middle proxy authorization invalid or not found")
 
-                if not request_body["generations"] > 0:
-                    logger.info(msg=r"generations value not valid, using default")
-                    generations_validator = False
+    return False
 
-                if generations_validator is True:
-                    logger.info(msg=r"generations value valid, establishing generations value")
-                    generations = request_body["generations"]
 
-            if "population" in request_body_keys:
+async def solve_job_puzzle(solver_parameters: dict) -> dict:
 
-                logger.info(msg=r"population key found")
+    """Solve Job Puzzle
 
-                if not type(request_body["population"]) is int:
-                    logger.info(msg=r"population value not valid, using default")
-                    population_validator = False
+    This function solves a puzzle of a job using the genetic algorithm and returns its solution with the same body of the solver
+    path response.
+
+    Args:
+        solver_parameters (dict): The solve using genetic algorithm function parameters.
+
+    Returns:
+        dict: The response body dict.
+    """
+
+    (
+        solution_board,
+        stop_reason,
+        generations_run,
+    ) = await solve_using_genetic_algorithm(**solver_parameters)
+
+    return await build_solution_response_dict(
+        zone_height=solver_parameters["zone_height"],
+        zone_length=solver_parameters["zone_length"],
+        generations_run=generations_run,
+        solution_board=solution_board,
+        stop_reason=stop_reason,
+    )
 
-                if not request_body["population"] > 0:
-                    logger.info(msg=r"population value not valid, using default")
-                    population_validator = False
 
-                if population_validator is True:
-                    logger.info(msg=r"population value valid, establishing population value")
-                    population = request_body["population"]
+def build_job_response_dict(job_id: str, job: dict, include_results: bool) -> dict:
 
-            if "mutation" in request_body_keys:
+    """Build Job Response Dict
 
-                logger.info(msg=r"mutation key found")
+    This function packages the status and the progress of a job in the response body dict, the results of the puzzles are included
+    if they are requested, the results of the puzzles that are not solved yet are null.
 
-                if not type(request_body["mutation"]) is float:
-                    logger.info(msg=r"mutation value not valid, using default")
-                    mutation_validator = False
+    Args:
+        job_id (str): The job id.
+        job (dict): The job data.
+        include_results (bool): Indicates if the results of the puzzles are included.
 
-                if not 0 < request_body["mutation"] <= 1:
-                    logger.info(msg=r"mutation value not valid, using default")
-                    mutation_validator = False
+    Returns:
+        dict: The response body dict.
+    """
 
-                if mutation_validator is True:
-                    logger.info(msg=r"mutation value valid, establishing mutation value")
-                    mutation = request_body["mutation"]
+    response_dict = {
+        "jobId": job_id,
+        "status": job["status"],
+        "priority": job["priority"],
+        "puzzles": len(job["results"]),
+        "completedPuzzles": job["completedPuzzles"],
+        "failedPuzzles": job["failedPuzzles"],
+    }
 
-            if "crossover" in request_body_keys:
+    if include_results is True:
+        response_dict["results"] = job["results"]
 
-                logger.info(msg=r"crossover key found")
+    return response_dict
 
-                if not type(request_body["crossover"]) is float:
-                    logger.info(msg=r"crossover value not valid, using default")
-                    crossover_validator = False
 
-                if not 0 < request_body["crossover"] <= 1:
-                    logger.info(msg=r"crossover value not valid, using default")
-                    crossover_validator = False
+@api_routes.post(r"/jobs")
+async def submit_job(request: Request) -> web.Response:
 
-                if crossover_validator is True:
-                    logger.info(msg=r"crossover value valid, establishing crossover value")
-                    crossover = request_body["crossover"]
+    """Submit Job
 
-            solution_board = await solve_using_genetic_algorithm(
-                genetic_algorithm_generations=generations,
-                genetic_algorithm_population=population,
-                genetic_algorithm_crossover=crossover,
-                genetic_algorithm_mutation=mutation,
-                zone_height=sudoku_zone_height,
-                zone_length=sudoku_zone_length,
-                board=sudoku_initial_board,
+    This function receives a list of puzzles in the body of a json http request, each puzzle with the same parameters of the
+    solver path body, and queues them for being solved in background by the jobs workers, the response is sent as soon as the job
+    is queued with the job id for polling its status and fetching its results later.
+
+    Args:
+        request (aiohttp.web_request.Request): An http request verified for the middle proxy that contains in the body the puzzles
+        list and optionally the job priority, the jobs with lower priority values are solved first.
+
+    Returns:
+        web.Response: A 202 status code and a json body with the job id if the job is queued, 400 if the body is not valid, 503 if
+        the jobs queue is full, 401 if the api key used by the middle proxy is wrong or 500 if something goes wrong.
+    """
+
+    try:
+
+        logger.debug(msg=r"new request recived at: /jobs path")
+
+        if check_authorization(request) is False:
+            return web.Response(
+                reason=r"you aren't authorized to use this api",
+                status=HTTPStatus.UNAUTHORIZED,
             )
 
-            (
-                total_collisions,
-                column_collisions,
-                row_collisions,
-                zone_collisions,
-            ) = await calculate_board_fitness_report(
-                zone_height=sudoku_zone_height,
-                zone_length=sudoku_zone_length,
-                board=solution_board,
+        request_body = await read_request_body(request)
+        puzzles, priority = request_body.get("puzzles"), request_body.get("priority", 0)
+
+        if not type(puzzles) is list or len(puzzles) == 0 or not all(type(puzzle) is dict for puzzle in puzzles):
+            logger.info(msg=r"puzzles value not valid")
+            return web.Response(
+                reason=r"the puzzles must be a non empty list of puzzles",
+                status=HTTPStatus.BAD_REQUEST,
             )
 
-            response_dict = {
-                "totalCollisions": total_collisions,
-                "columnCollisions": column_collisions,
-                "rowCollisions": row_collisions,
-                "zoneCollisions": zone_collisions,
-                "solutionBoard": solution_board,
-            }
+        if not type(priority) is int:
+            logger.info(msg=r"priority value not valid, using default")
+            priority = 0
 
-            logger.info(msg=r"sending solution to the middle proxy")
+        try:
+            puzzles_parameters = [build_solver_parameters(request_body=puzzle) for puzzle in puzzles]
+        except (KeyError, TypeError, ValueError):
+            logger.info(msg=r"puzzle without valid mandatory parameters")
+            return web.Response(
+                reason=r"every puzzle needs a valid initial board and zones measures",
+                status=HTTPStatus.BAD_REQUEST,
+            )
 
+        try:
+            job_id = submit_solver_job(puzzles=puzzles_parameters, priority=priority)
+        except JobsQueueFull:
+            logger.warning(msg=r"jobs queue full, job rejected")
             return web.Response(
-                reason=r"ok",
-                body=json.dumps(obj=response_dict, indent=None),
-                status=HTTPStatus.OK,
+                reason=r"the jobs queue is full, please submit the job later",
+                status=HTTPStatus.SERVICE_UNAVAILABLE,
             )
 
-        else:
+        logger.info(msg=f"job {job_id} queued with {len(puzzles_parameters)} puzzles")
+
+        return web.Response(
+            reason=r"accepted",
+            body=json.dumps(
+                obj=build_job_response_dict(job_id=job_id, job=get_solver_job(job_id), include_results=False),
+                indent=None,
+            ),
+            status=HTTPStatus.ACCEPTED,
+        )
+
+    except:
+
+        logger.exception(msg=r"exception in the jobs api")
+
+        return web.Response(
+            reason=r"internal error inside the solver server",
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+
+async def respond_job(request: Request, include_results: bool) -> web.Response:
+
+    """Respond Job
 
-            logger.error(msg=r"middle proxy authorization invalid or not found")
+    This function answers the requests that read a job, it returns the job status and optionally its results.
+
+    Args:
+        request (aiohttp.web_request.Request): An http request verified for the middle proxy with the job id in the path.
+        include_results (bool): Indicates if the results of the puzzles are included.
+
+    Returns:
+        web.Response: A 200 status code and a json body with the job, 404 if the job doesn't exists or expired, 401 if the api key
+        used by the middle proxy is wrong or 500 if something goes wrong.
+    """
 
+    try:
+
+        logger.debug(msg=f"new request recived at: {request.path} path")
+
+        if check_authorization(request) is False:
             return web.Response(
                 reason=r"you aren't authorized to use this api",
                 status=HTTPStatus.UNAUTHORIZED,
             )
 
+        job_id = request.match_info["job_id"]
+        job = get_solver_job(job_id)
+
+        if job is None:
+            return web.Response(
+                reason=r"the job doesn't exists or expired",
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+        return web.Response(
+            reason=r"ok",
+            body=json.dumps(
+                obj=build_job_response_dict(job_id=job_id, job=job, include_results=include_results),
+                indent=None,
+            ),
+            status=HTTPStatus.OK,
+        )
+
     except:
 
-        logger.exception(msg=r"exception in the solver api")
+        logger.exception(msg=r"exception in the jobs api")
+
+        return web.Response(
+            reason=r"internal error inside the solver server",
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+
+@api_routes.get(r"/jobs/{job_id}")
+async def get_job(request: Request) -> web.Response:
+
+    """Get Job
+
+    This function returns the status and the progress of a job for polling it.
+
+    Args:
+        request (aiohttp.web_request.Request): An http request verified for the middle proxy with the job id in the path.
+
+    Returns:
+        web.Response: The job status response.
+    """
+
+    return await respond_job(request=request, include_results=False)
+
+
+@api_routes.get(r"/jobs/{job_id}/results")
+async def get_job_results(request: Request) -> web.Response:
+
+    """Get Job Results
+
+    This function returns the status and the results of a job, the results of the puzzles that are not solved yet are null.
+
+    Args:
+        request (aiohttp.web_request.Request): An http request verified for the middle proxy with the job id in the path.
+
+    Returns:
+        web.Response: The job results response.
+    """
+
+    return await respond_job(request=request, include_results=True)
+
+
+@api_routes.delete(r"/jobs/{job_id}")
+async def delete_job(request: Request) -> web.Response:
+
+    """Delete Job
+
+    This function removes a job, the puzzles of the job that are still queued are not solved.
+
+    Args:
+        request (aiohttp.web_request.Request): An http request verified for the middle proxy with the job id in the path.
+
+    Returns:
+        web.Response: A 200 status code if the job was deleted, 404 if the job doesn't exists or expired, 401 if the api key used
+        by the middle proxy is wrong or 500 if something goes wrong.
+    """
+
+    try:
+
+        logger.debug(msg=f"new request recived at: {request.path} path")
+
+        if check_authorization(request) is False:
+            return web.Response(
+                reason=r"you aren't authorized to use this api",
+                status=HTTPStatus.UNAUTHORIZED,
+            )
+
+        if delete_solver_job(request.match_info["job_id"]) is False:
+            return web.Response(
+                reason=r"the job doesn't exists or expired",
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+        return web.Response(
+            reason=r"ok",
+            body=json.dumps(obj={"deleted": True}, indent=None),
+            status=HTTPStatus.OK,
+        )
+
+    except:
+
+        logger.exception(msg=r"exception in the jobs api")
 
         return web.Response(
             reason=r"internal error inside the solver server",
@@ -218,5 +869,46 @@ async def solver(request: Request) -> web.Response:
         )
 
 
+describe_metric(r"solver_jobs", r"gauge", r"Solver jobs stored in the api, queued, running or completed.")
+describe_metric(r"solver_jobs_queued_puzzles", r"gauge", r"Puzzles of the solver jobs waiting in the jobs queue.")
+
+
+@api_routes.get(r"/metrics")
+async def get_metrics(_: Request) -> web.Response:
+
+    """Get Metrics
+
+    This function exposes the api metrics using the prometheus text format, the solver jobs metrics are updated from their
+    current state before rendering them.
+
+    Returns:
+        web.Response: A 200 status code and the metrics exposition in the response body.
+    """
+
+    set_gauge(r"solver_jobs", len(solver_jobs))
+    set_gauge(r"solver_jobs_queued_puzzles", get_jobs_queue_size())
+
+    return web.Response(
+        body=render_metrics(),
+        headers={"Content-Type": METRICS_CONTENT_TYPE},
+        status=HTTPStatus.OK,
+    )
+
+
+# The compute executor runs the local solver functions out of the event loop, the http backend doesn't need it.
+
+if solver_functions_backend == "local":
+    api.on_startup.append(open_compute_executor)
+
+api.on_startup.append(open_island_executor)
+api.on_startup.append(open_solver_functions_session)
+api.on_startup.append(partial(open_solver_jobs, solve_puzzle=solve_job_puzzle))
+api.on_cleanup.append(close_solver_jobs)
+api.on_cleanup.append(close_solver_functions_session)
+api.on_cleanup.append(close_island_executor)
+
+if solver_functions_backend == "local":
+    api.on_cleanup.append(close_compute_executor)
+
 api.add_routes(api_routes)
 web.run_app(app=api, port=int(os.environ["ACCESS_PORT"]))
@@ -0,0 +1,89 @@
+from argparse import ArgumentParser
+from json import dumps
+import random
+
+CORPUS_SIZES = ((2, 2), (2, 3), (3, 3), (3, 4), (4, 4))
+GIVENS_RATIOS = (0.65, 0.5, 0.4)
+
+
+def build_solved_board(zone_height: int, zone_length: int) -> list:
+
+    """Build Solved Board
+
+    This function builds a random solved board, it starts from the shifted rows pattern, where every row is the previous one
+    shifted by the zones length and every band of zones is shifted by one, and shuffles it with the transformations that keep a
+    board solved, the numbers are relabeled, the rows are shuffled inside their bands, the columns inside their stacks and the
+    bands and the stacks between them.
+
+    Args:
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: A full filled board without collisions.
+    """
+
+    board_size = zone_height * zone_length
+    numbers = random.sample(range(1, board_size + 1), board_size)
+
+    bands = random.sample(range(zone_length), zone_length)
+    stacks = random.sample(range(zone_height), zone_height)
+    rows = [band * zone_height + row for band in bands for row in random.sample(range(zone_height), zone_height)]
+    columns = [stack * zone_length + column for stack in stacks for column in random.sample(range(zone_length), zone_length)]
+
+    return [
+        [numbers[(zone_length * (row % zone_height) + row // zone_height + column) % board_size] for column in columns]
+        for row in rows
+    ]
+
+
+def remove_numbers(board: list, givens: int) -> list:
+
+    """Remove Numbers
+
+    This function keeps just the given number of random cells of a solved board and empties the others.
+
+    Args:
+        board (list): A full filled board representation.
+        givens (int): The number of kept cells.
+
+    Returns:
+        list: A board representation that includes just the kept numbers.
+    """
+
+    board_size = len(board)
+    kept_cells = set(random.sample(range(board_size * board_size), givens))
+
+    return [
+        [number if row_index * board_size + column_index in kept_cells else 0 for column_index, number in enumerate(row)]
+        for row_index, row in enumerate(board)
+    ]
+
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser(description="end to end benchmark puzzle corpus builder")
+    parser.add_argument("--seed", type=int, default=2021)
+    parser.add_argument("--output", default="puzzle_corpus.json")
+    arguments = parser.parse_args()
+
+    random.seed(arguments.seed)
+
+    corpus = list()
+
+    for zone_height, zone_length in CORPUS_SIZES:
+        board_size = zone_height * zone_length
+        for givens_ratio in GIVENS_RATIOS:
+            givens = round(givens_ratio * board_size * board_size)
+            corpus.append(
+                {
+                    "id": f"{board_size}x{board_size}-{givens}",
+                    "zoneHeight": zone_height,
+                    "zoneLength": zone_length,
+                    "givens": givens,
+                    "initialBoard": remove_numbers(build_solved_board(zone_height, zone_length), givens),
+                }
+            )
+
+    with open(arguments.output, "w") as corpus_file:
+        corpus_file.write("[\n" + ",\n".join(dumps(puzzle) for puzzle in corpus) + "\n]\n")
@@ -0,0 +1,158 @@
+from argparse import ArgumentParser
+from random import randint
+from json import dumps
+import itertools
+import random
+import heapq
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from genetic_algorithm_functions import rank_tournament_members
+
+
+def build_random_population(population_size: int, max_fitness: int) -> list:
+
+    """Build Random Population
+
+    This function builds a population of individuals with random fitness scores, the boards are replaced by their index because
+    the selection and the truncation just compare the fitness scores.
+
+    Args:
+        population_size (int): The number of individuals.
+        max_fitness (int): The maximum fitness score.
+
+    Returns:
+        list: The random population as a list of tuples with the fitness score and the board of each individual.
+    """
+
+    return [(randint(0, max_fitness), individual_index) for individual_index in range(population_size)]
+
+
+def sorted_generation(population: list, offspring: list, selections: int) -> list:
+
+    """Sorted Generation
+
+    This function reproduces the previous ranking of a generation, the population is sorted on every tournament selection and the
+    extended population is sorted fully before the truncation.
+
+    Args:
+        population (list): The current population.
+        offspring (list): The crossed and mutated individuals.
+        selections (int): The number of tournament selections.
+
+    Returns:
+        list: The next population.
+    """
+
+    tournament_size = max(2, len(population) // 2)
+
+    for _ in range(selections):
+        random.choice(sorted(population, key=lambda individual: individual[0])[:tournament_size])
+
+    next_population = sorted(population + offspring, key=lambda individual: individual[0])
+
+    return next_population[: len(population)]
+
+
+def ranked_generation(population: list, offspring: list, selections: int) -> list:
+
+    """Ranked Generation
+
+    This function ranks the tournament members once per generation, draws all the selections from them and keeps the best
+    individuals of the extended population with a partial selection.
+
+    Args:
+        population (list): The current population.
+        offspring (list): The crossed and mutated individuals.
+        selections (int): The number of tournament selections.
+
+    Returns:
+        list: The next population.
+    """
+
+    tournament_members = rank_tournament_members(population=population)
+
+    for _ in range(selections):
+        random.choice(tournament_members)
+
+    return heapq.nsmallest(
+        len(population), itertools.chain(population, offspring), key=lambda individual: individual[0]
+    )
+
+
+def measure(generation_function, population: list, offspring: list, selections: int, repetitions: int) -> float:
+
+    """Measure
+
+    This function returns the best time of a generation ranking function in milliseconds.
+
+    Args:
+        generation_function (Callable): The generation ranking function.
+        population (list): The current population.
+        offspring (list): The crossed and mutated individuals.
+        selections (int): The number of tournament selections.
+        repetitions (int): The number of measures.
+
+    Returns:
+        float: The best measured time in milliseconds.
+    """
+
+    times = list()
+
+    for _ in range(repetitions):
+        start_time = time.perf_counter()
+        generation_function(population, offspring, selections)
+        times.append(time.perf_counter() - start_time)
+
+    return 1000 * min(times)
+
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser(description="genetic algorithm selection and truncation benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 1000, 3000, 10000])
+    parser.add_argument("--crossover", type=float, default=0.8)
+    parser.add_argument("--mutation", type=float, default=0.2)
+    parser.add_argument("--max-fitness", type=int, default=200)
+    parser.add_argument("--sampled-selections", type=int, default=200)
+    parser.add_argument("--repetitions", type=int, default=3)
+    arguments = parser.parse_args()
+
+    for population_size in arguments.sizes:
+
+        population = build_random_population(population_size, arguments.max_fitness)
+        population.sort(key=lambda individual: individual[0])
+        offspring = build_random_population(
+            int((arguments.crossover + arguments.mutation) * population_size), arguments.max_fitness
+        )
+        selections = int(arguments.crossover * population_size)
+
+        # Both rankings must keep the same fitness scores.
+
+        sampled_selections = min(selections, arguments.sampled_selections)
+        assert [individual[0] for individual in sorted_generation(population, offspring, 0)] == [
+            individual[0] for individual in ranked_generation(population, offspring, 0)
+        ]
+
+        # The sorted selections are sampled and scaled to the generation selections because sorting on every selection grows
+        # quadratically with the population size.
+
+        truncation_ms = measure(sorted_generation, population, offspring, 0, arguments.repetitions)
+        sampled_ms = measure(sorted_generation, population, offspring, sampled_selections, arguments.repetitions)
+        sorted_ms = truncation_ms + (sampled_ms - truncation_ms) * selections / max(1, sampled_selections)
+        ranked_ms = measure(ranked_generation, population, offspring, selections, arguments.repetitions)
+
+        print(
+            dumps(
+                {
+                    "population": population_size,
+                    "selections": selections,
+                    "sortedGenerationMs": round(sorted_ms, 3),
+                    "rankedGenerationMs": round(ranked_ms, 3),
+                    "speedup": round(sorted_ms / ranked_ms, 1),
+                }
+            )
+        )
@@ -0,0 +1,284 @@
+from argparse import ArgumentParser
+from statistics import median
+from functools import wraps
+from json import dumps
+from json import load
+import subprocess
+import tracemalloc
+import resource
+import logging
+import asyncio
+import random
+import time
+import sys
+import os
+
+BENCHMARKS_PATH = os.path.dirname(os.path.abspath(__file__))
+
+EVOLUTION_FUNCTIONS = (
+    "calculate_board_fitness_batch",
+    "board_random_mutation_delta",
+    "evolve_generation",
+)
+
+COUNTED_FUNCTIONS = EVOLUTION_FUNCTIONS + (
+    "board_random_initialization",
+    "create_puzzle_session",
+    "delete_puzzle_session",
+)
+
+
+def count_calls(module, function_name: str, calls: dict) -> None:
+
+    """Count Calls
+
+    This function replaces a solver function imported by a module with a wrapper that counts its calls, so the solver function
+    calls of every solving can be measured without changing the solver.
+
+    Args:
+        module (module): The module that imports the solver function.
+        function_name (str): The solver function name.
+        calls (dict): The calls count of every solver function.
+    """
+
+    function = getattr(module, function_name)
+
+    @wraps(function)
+    async def counted_function(*args, **kwargs):
+        calls[function_name] += 1
+        return await function(*args, **kwargs)
+
+    setattr(module, function_name, counted_function)
+
+
+def get_commit() -> str:
+
+    """Get Commit
+
+    This function returns the current git commit of the repository, so the results of different commits can be compared.
+
+    Returns:
+        str: The commit hash or None if it can't be read.
+    """
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, cwd=BENCHMARKS_PATH, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_puzzle(solve_function, fitness_function, puzzle: dict, calls: dict, arguments) -> dict:
+
+    """Run Puzzle
+
+    This function solves a corpus puzzle using the genetic algorithm and measures the solving, the solver function calls per
+    generation are counted from the initial population progress report, so the initialization calls are not included.
+
+    Args:
+        solve_function (Callable): The solve using genetic algorithm function.
+        fitness_function (Callable): The function that calculates the total collisions of a board.
+        puzzle (dict): The corpus puzzle.
+        calls (dict): The calls count of every solver function.
+        arguments (Namespace): The benchmark arguments.
+
+    Returns:
+        dict: The solving measures.
+    """
+
+    for function_name in calls:
+        calls[function_name] = 0
+
+    initialization_calls = 0
+
+    async def count_initialization_calls(progress: dict) -> None:
+        nonlocal initialization_calls
+        if progress["generation"] == 0:
+            initialization_calls = sum(calls[function_name] for function_name in EVOLUTION_FUNCTIONS)
+
+    if arguments.trace_memory is True:
+        tracemalloc.start()
+
+    start_time = time.perf_counter()
+
+    solution_board, stop_reason, generations_run = await solve_function(
+        genetic_algorithm_generations=arguments.generations,
+        genetic_algorithm_population=arguments.population,
+        genetic_algorithm_crossover=arguments.crossover,
+        genetic_algorithm_mutation=arguments.mutation,
+        zone_height=puzzle["zoneHeight"],
+        zone_length=puzzle["zoneLength"],
+        board=puzzle["initialBoard"],
+        deadline_ms=arguments.deadline_ms,
+        progress_callback=count_initialization_calls,
+    )
+
+    elapsed_ms = 1000 * (time.perf_counter() - start_time)
+
+    peak_traced_kb = None
+
+    if arguments.trace_memory is True:
+        peak_traced_kb = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        tracemalloc.stop()
+
+    evolution_calls = sum(calls[function_name] for function_name in EVOLUTION_FUNCTIONS) - initialization_calls
+    calls_per_generation = None
+
+    if generations_run > 0:
+        calls_per_generation = round(evolution_calls / generations_run, 2)
+
+    return {
+        "type": "run",
+        "puzzle": puzzle["id"],
+        "boardSize": puzzle["zoneHeight"] * puzzle["zoneLength"],
+        "givens": puzzle["givens"],
+        "timeMs": round(elapsed_ms, 3),
+        "finalCollisions": fitness_function(
+            board=solution_board, zone_height=puzzle["zoneHeight"], zone_length=puzzle["zoneLength"]
+        ),
+        "stopReason": stop_reason,
+        "generationsRun": generations_run,
+        "solverFunctionCalls": dict(calls),
+        "callsPerGeneration": calls_per_generation,
+        "peakTracedKb": peak_traced_kb,
+        "maxRssKb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def summarize_runs(runs: list) -> list:
+
+    """Summarize Runs
+
+    This function groups the runs by board size and summarizes the solve rate, the times, the collisions, the generations and the
+    solver function calls per generation of the runs that evolved at least one generation.
+
+    Args:
+        runs (list): The solving measures of every run.
+
+    Returns:
+        list: The summary of every board size.
+    """
+
+    summaries = list()
+
+    for board_size in sorted(set(run["boardSize"] for run in runs)):
+        size_runs = [run for run in runs if run["boardSize"] == board_size]
+        evolved_runs = [run for run in size_runs if run["callsPerGeneration"] is not None]
+        summaries.append(
+            {
+                "type": "summary",
+                "boardSize": board_size,
+                "runs": len(size_runs),
+                "solveRate": round(sum(run["finalCollisions"] == 0 for run in size_runs) / len(size_runs), 3),
+                "medianTimeMs": round(median(run["timeMs"] for run in size_runs), 3),
+                "meanFinalCollisions": round(sum(run["finalCollisions"] for run in size_runs) / len(size_runs), 3),
+                "meanGenerationsRun": round(sum(run["generationsRun"] for run in size_runs) / len(size_runs), 3),
+                "meanCallsPerGeneration": (
+                    round(sum(run["callsPerGeneration"] for run in evolved_runs) / len(evolved_runs), 3)
+                    if len(evolved_runs) > 0
+                    else None
+                ),
+            }
+        )
+
+    return summaries
+
+
+async def run_benchmark(arguments) -> None:
+
+    """Run Benchmark
+
+    This function solves every puzzle of the corpus the given repetitions and prints the measures of every run and the summary of
+    every board size as json lines.
+
+    Args:
+        arguments (Namespace): The benchmark arguments.
+    """
+
+    import genetic_algorithm
+
+    from general_solvers_functions import calculate_board_fitness_single_bitmask
+    from solver_functions_session import close_solver_functions_session
+
+    calls = {function_name: 0 for function_name in COUNTED_FUNCTIONS}
+
+    for function_name in COUNTED_FUNCTIONS:
+        count_calls(module=genetic_algorithm, function_name=function_name, calls=calls)
+
+    with open(arguments.corpus) as corpus_file:
+        corpus = [
+            puzzle
+            for puzzle in load(corpus_file)
+            if arguments.sizes is None or puzzle["zoneHeight"] * puzzle["zoneLength"] in arguments.sizes
+        ]
+
+    print(
+        dumps(
+            {
+                "type": "environment",
+                "commit": get_commit(),
+                "backend": os.environ["SOLVER_FUNCTIONS_BACKEND"],
+                "evolutionMode": os.environ.get("EVOLUTION_MODE", "generation"),
+                "constraintPropagation": os.environ.get("CONSTRAINT_PROPAGATION", "enabled"),
+                "generations": arguments.generations,
+                "population": arguments.population,
+                "crossover": arguments.crossover,
+                "mutation": arguments.mutation,
+                "deadlineMs": arguments.deadline_ms,
+                "repetitions": arguments.repetitions,
+                "seed": arguments.seed,
+            }
+        ),
+        flush=True,
+    )
+
+    runs = list()
+
+    try:
+        for puzzle in corpus:
+            for repetition in range(arguments.repetitions):
+                random.seed(f"{arguments.seed}-{puzzle['id']}-{repetition}")
+                run = await run_puzzle(
+                    fitness_function=calculate_board_fitness_single_bitmask,
+                    solve_function=genetic_algorithm.solve_using_genetic_algorithm,
+                    arguments=arguments,
+                    puzzle=puzzle,
+                    calls=calls,
+                )
+                runs.append(run)
+                print(dumps(run), flush=True)
+    finally:
+        await close_solver_functions_session(None)
+
+    for summary in summarize_runs(runs):
+        print(dumps(summary), flush=True)
+
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser(description="genetic algorithm solver end to end benchmark")
+    parser.add_argument("--corpus", default=os.path.join(BENCHMARKS_PATH, "puzzle_corpus.json"))
+    parser.add_argument("--sizes", type=int, nargs="+", default=None)
+    parser.add_argument("--backend", choices=["local", "http"], default="local")
+    parser.add_argument("--generations", type=int, default=200)
+    parser.add_argument("--population", type=int, default=100)
+    parser.add_argument("--crossover", type=float, default=0.6)
+    parser.add_argument("--mutation", type=float, default=0.3)
+    parser.add_argument("--deadline-ms", type=int, default=None)
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace-memory", action="store_true")
+    parser.add_argument("--logs", action="store_true")
+    arguments = parser.parse_args()
+
+    # The solver modules read the backend and the buffer size from the environment when they are imported or called.
+
+    os.environ["SOLVER_FUNCTIONS_BACKEND"] = arguments.backend
+    os.environ.setdefault("BUFFER_SIZE", "200")
+    sys.path.insert(0, os.path.dirname(BENCHMARKS_PATH))
+
+    if arguments.logs is False:
+        logging.disable(logging.CRITICAL)
+
+    asyncio.run(run_benchmark(arguments=arguments))
@@ -1,37 +1,155 @@
+from metrics import observe_histogram
+from metrics import increment_counter
+from metrics import describe_metric
+
 from logger import setup_logger
 
-from asyncio.tasks import gather
+from asyncio import FIRST_COMPLETED
+from asyncio import ensure_future
+from asyncio import gather
+from asyncio import wait
+import logging
+import time
 import os
 
 logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
 
+describe_metric(r"buffered_gather_batch_seconds", r"histogram", r"Time spent solving every batch of promises of the buffer.")
+describe_metric(r"buffered_gather_promises_total", r"counter", r"Promises solved by the buffer.")
 
-async def buffered_gather(promises_array: list) -> list:
 
-    """Buffered Gather
+async def timed_promise(index: int, promise) -> tuple:
 
-    This function recives a list of promiese, and then make the requiered tasks using a buffer defined by an
-    environment variable.
+    """Timed Promise
+
+    This function awaits a promise and measures how long it takes to be solved.
 
     Args:
-        promises_array (list): A list with promises.
+        index (int): The position of the promise in the original promises iterable.
+        promise (Awaitable): The promise to await.
 
     Returns:
-        list: A list with the promiese solution.
+        int: The position of the promise in the original promises iterable.
+        float: The promise latency in seconds.
+        Any: The promise solution.
+    """
+
+    start_time = time.perf_counter()
+    result = await promise
+
+    return index, time.perf_counter() - start_time, result
+
+
+def log_latencies(latencies: list) -> None:
+
+    """Log Latencies
+
+    This function logs a summary of the latencies of the promises solved by the buffer, so the buffer size can be tuned, the
+    summary is not calculated if the info records are disabled.
+
+    Args:
+        latencies (list): The latency in seconds of each solved promise.
+    """
+
+    if len(latencies) == 0 or not logger.isEnabledFor(logging.INFO):
+        return
+
+    latencies = sorted(latencies)
+
+    logger.info(
+        msg=f"buffered calls: {len(latencies)}, "
+        + f"mean latency: {1000 * sum(latencies) / len(latencies):.2f} ms, "
+        + f"p50 latency: {1000 * latencies[len(latencies) // 2]:.2f} ms, "
+        + f"p95 latency: {1000 * latencies[int(0.95 * (len(latencies) - 1))]:.2f} ms, "
+        + f"max latency: {1000 * latencies[-1]:.2f} ms"
+    )
+
+
+async def buffered_as_completed(promises_iterable):
+
+    """Buffered As Completed
+
+    This function solves the promises of an iterable using a sliding window defined by an environment variable, the window keeps
+    exactly the buffer size of promises in flight and takes the next promise from the iterable as soon as any promise is solved, so
+    one slow promise doesn't stall the rest and the promises are not built before there is room for them in the window, if a
+    promise fails the promises in flight are cancelled and the error is raised.
+
+    Args:
+        promises_iterable (Iterable): An iterable with promises, it can be a generator.
+
+    Yields:
+        tuple: The position of each promise in the iterable and its solution, in the order in which the promises are solved.
     """
 
     buffer_size = int(os.environ["BUFFER_SIZE"])
-    buffered_promises_array = list()
-    responses = list()
+    promises_iterator = enumerate(promises_iterable)
+    pending_tasks = set()
+    latencies = list()
+    start_time = time.perf_counter()
+
+    logger.debug(msg=f"starting sliding window of {buffer_size} parallel tasks")
 
-    logger.debug(msg=f"starting buffer of {buffer_size} parallel tasks")
+    try:
 
-    for index in range(0, len(promises_array), buffer_size):
-        buffered_promises_array.append(promises_array[index : index + buffer_size])
+        for index, promise in promises_iterator:
+            pending_tasks.add(ensure_future(timed_promise(index, promise)))
+            if len(pending_tasks) >= buffer_size:
+                break
 
-    for promises_array in buffered_promises_array:
-        responses.extend(await gather(*promises_array))
+        while len(pending_tasks) > 0:
+
+            done_tasks, pending_tasks = await wait(pending_tasks, return_when=FIRST_COMPLETED)
+
+            # The errors of all the solved tasks are retrieved before raising the first one, so none of them is left unretrieved.
+
+            failed_tasks = [
+                done_task for done_task in done_tasks if done_task.cancelled() or done_task.exception() is not None
+            ]
+
+            if len(failed_tasks) > 0:
+                failed_tasks[0].result()
+
+            solved_promises = [done_task.result() for done_task in done_tasks]
+
+            for _, promise in zip(range(len(done_tasks)), promises_iterator):
+                pending_tasks.add(ensure_future(timed_promise(*promise)))
+
+            for index, latency, result in solved_promises:
+                latencies.append(latency)
+                yield index, result
+
+    finally:
+
+        for pending_task in pending_tasks:
+            pending_task.cancel()
+
+        await gather(*pending_tasks, return_exceptions=True)
 
     logger.debug(msg=r"parallel tasks ended")
 
-    return responses
+    observe_histogram(r"buffered_gather_batch_seconds", time.perf_counter() - start_time)
+    increment_counter(r"buffered_gather_promises_total", len(latencies))
+
+    log_latencies(latencies=latencies)
+
+
+async def buffered_gather(promises_array) -> list:
+
+    """Buffered Gather
+
+    This function recives an iterable of promises, and then make the requiered tasks using a sliding window defined by an
+    environment variable.
+
+    Args:
+        promises_array (Iterable): An iterable with promises, it can be a generator.
+
+    Returns:
+        list: A list with the promiese solution in the same order of the promises.
+    """
+
+    responses = dict()
+
+    async for index, result in buffered_as_completed(promises_array):
+        responses[index] = result
+
+    return [responses[index] for index in range(len(responses))]
@@ -1,7 +1,69 @@
-from aiohttp import ClientSession
+from general_solvers_functions import calculate_board_fitness_report_bitmask as local_calculate_board_fitness_report
+from general_solvers_functions import calculate_board_fitness_single_bitmask as local_calculate_board_fitness_single
+from general_solvers_functions import board_random_initialization as local_board_random_initialization
+from general_solvers_functions import board_random_mutation as local_board_random_mutation
+from general_solvers_functions import freeze_board
+
+from puzzle_sessions import create_puzzle_session as local_create_puzzle_session
+from puzzle_sessions import delete_puzzle_session as local_delete_puzzle_session
+from puzzle_sessions import get_puzzle_session as local_get_puzzle_session
+
+from solver_functions_session import register_puzzle_session_body
+from solver_functions_session import forget_puzzle_session_body
+from solver_functions_session import post_solver_function
+
+from compute_executor import run_compute
+
 from os import environ
 
-api_key = str(environ["SOLVER_FUNCTIONS_KEY"])
+SOLVER_FUNCTIONS_BACKENDS = ("local", "http")
+
+solver_functions_backend = str(environ.get("SOLVER_FUNCTIONS_BACKEND", "http"))
+
+# An unknown backend would silently use the http backend, so the api doesn't start with it.
+
+if solver_functions_backend not in SOLVER_FUNCTIONS_BACKENDS:
+    raise ValueError(
+        f"the solver functions backend {solver_functions_backend} isn't valid, it should be one of: {', '.join(SOLVER_FUNCTIONS_BACKENDS)}"
+    )
+
+
+def get_local_puzzle(
+    fixed_numbers_board: list, zone_height: int, zone_length: int, session_id: str
+) -> dict:
+
+    """Get Local Puzzle
+
+    This function obtains the puzzle data for calling the general solver functions in process, if a session id is given the puzzle
+    is the data of the respective local puzzle session, in other case the puzzle is built from the given fixed numbers board and
+    zones measures.
+
+    Args:
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+        session_id (str): The puzzle session id.
+
+    Returns:
+        dict: The puzzle data.
+    """
+
+    if session_id is None:
+        return {
+            "fixedNumbersBoard": fixed_numbers_board,
+            "zoneHeight": zone_height,
+            "zoneLength": zone_length,
+            "missingNumbers": None,
+            "candidates": None,
+            "freeCells": None,
+        }
+
+    puzzle = local_get_puzzle_session(session_id=session_id)
+
+    if puzzle is None:
+        raise KeyError(f"the puzzle session doesn't exists: {session_id}")
+
+    return puzzle
 
 
 async def calculate_board_fitness_report(
@@ -25,14 +87,26 @@ async def calculate_board_fitness_report(
         int: Total collisions on the board zones.
     """
 
+    if solver_functions_backend == "local":
+        (
+            total_collisions,
+            zone_collisions,
+            row_collisions,
+            column_collisions,
+        ) = await run_compute(
+            local_calculate_board_fitness_report,
+            work_size=len(board) ** 2,
+            zone_height=zone_height,
+            zone_length=zone_length,
+            board=board,
+        )
+        return total_collisions, column_collisions, row_collisions, zone_collisions
+
     body = {"zoneHeight": zone_height, "zoneLength": zone_length, "board": board}
     url = str(environ["FITNESS_REPORT_SCORE_LINK"])
-    response_body = dict()
-
-    headers = {"Authorization": api_key, "Content-Type": "application/json"}
-    async with ClientSession(headers=headers) as session:
-        async with session.post(url=url, json=body) as response:
-            response_body = await response.json()
+    response_body = await post_solver_function(
+        zone_height=zone_height, zone_length=zone_length, url=url, body=body
+    )
 
     return (
         response_body["totalCollisions"],
@@ -60,75 +134,191 @@ async def calculate_board_fitness_single(
         int: Total collisions on the board.
     """
 
+    if solver_functions_backend == "local":
+        return await run_compute(
+            local_calculate_board_fitness_single,
+            work_size=len(board) ** 2,
+            zone_height=zone_height,
+            zone_length=zone_length,
+            board=board,
+        )
+
     body = {"zoneHeight": zone_height, "zoneLength": zone_length, "board": board}
     url = str(environ["FITNESS_SINGLE_SCORE_LINK"])
-    response_body = dict()
-
-    headers = {"Authorization": api_key, "Content-Type": "application/json"}
-    async with ClientSession(headers=headers) as session:
-        async with session.post(url=url, json=body) as response:
-            response_body = await response.json()
+    response_body = await post_solver_function(
+        zone_height=zone_height, zone_length=zone_length, url=url, body=body
+    )
 
     return response_body["fitnessScore"]
 
 
 async def board_random_initialization(
-    fixed_numbers_board: list, zone_height: int, zone_length: int
-) -> list:
+    fixed_numbers_board: list = None,
+    zone_height: int = 0,
+    zone_length: int = 0,
+    session_id: str = None,
+) -> tuple:
 
     """Board Random Initialization
 
     This function uses the general solver functions api to fill randomly a board based on its initial state, where just the fixed
     numbers are on the board, the white spaces need to be represented with a 0 and just the spaces with zero are changed for random
-    numbers that are not in the board untill the board is filled.
+    numbers that are not in the board untill the board is filled, if a puzzle session id is given the session is used instead of
+    the fixed numbers board and the zones measures.
 
     Args:
         fixed_numbers_board (list): A board representation that includes just the fixed numbers.
         zone_height (int): The zones height.
         zone_length (int): The zones length.
+        session_id (str): The puzzle session id.
 
     Returns:
-        list: A full filled board representation.
+        tuple: A full filled immutable board representation.
     """
 
-    body = {
-        "fixedNumbersBoard": fixed_numbers_board,
-        "zoneHeight": zone_height,
-        "zoneLength": zone_length,
-    }
+    if solver_functions_backend == "local":
+        puzzle = get_local_puzzle(
+            fixed_numbers_board=fixed_numbers_board,
+            zone_height=zone_height,
+            zone_length=zone_length,
+            session_id=session_id,
+        )
+        return await run_compute(
+            local_board_random_initialization,
+            work_size=len(puzzle["fixedNumbersBoard"]) ** 2,
+            fixed_numbers_board=puzzle["fixedNumbersBoard"],
+            missing_numbers=puzzle["missingNumbers"],
+            zone_height=puzzle["zoneHeight"],
+            zone_length=puzzle["zoneLength"],
+            free_cells=puzzle["freeCells"],
+            candidates=puzzle["candidates"],
+        )
+
+    if session_id is not None:
+        body = {"sessionId": session_id}
+    else:
+        body = {
+            "fixedNumbersBoard": fixed_numbers_board,
+            "zoneHeight": zone_height,
+            "zoneLength": zone_length,
+        }
     url = str(environ["RANDOM_INITIALIZATION_LINK"])
-    response_body = dict()
-
-    headers = {"Authorization": api_key, "Content-Type": "application/json"}
-    async with ClientSession(headers=headers) as session:
-        async with session.post(url=url, json=body) as response:
-            response_body = await response.json()
+    response_body = await post_solver_function(
+        zone_height=zone_height, zone_length=zone_length, url=url, body=body
+    )
 
-    return response_body["board"]
+    return freeze_board(response_body["board"])
 
 
-async def board_random_mutation(board: list, fixed_numbers_board: list) -> list:
+async def board_random_mutation(
+    board: list, fixed_numbers_board: list = None, session_id: str = None
+) -> tuple:
 
     """Board Random Mutation
 
     This function uses the general solver functions api to mutate randomly a board based on its initial state, the mutation affect
-    just the not fixed numbers on the board.
+    just the not fixed numbers on the board, if a puzzle session id is given the session is used instead of the fixed numbers
+    board.
 
     Args:
         fixed_numbers_board (list): A board representation that includes just the fixed numbers.
         board (list): A full filled board representation.
+        session_id (str): The puzzle session id.
 
     Returns:
-        list: A full filled board representation with a mutation in one of its rows.
+        tuple: A full filled immutable board representation with a mutation in one of its rows.
     """
 
-    body = {"fixedNumbersBoard": fixed_numbers_board, "board": board}
+    if solver_functions_backend == "local":
+        puzzle = get_local_puzzle(
+            fixed_numbers_board=fixed_numbers_board,
+            session_id=session_id,
+            zone_height=0,
+            zone_length=0,
+        )
+        return await run_compute(
+            local_board_random_mutation,
+            work_size=len(board) ** 2,
+            fixed_numbers_board=puzzle["fixedNumbersBoard"],
+            free_cells=puzzle["freeCells"],
+            candidates=puzzle["candidates"],
+            board=board,
+        )
+
+    if session_id is not None:
+        body = {"sessionId": session_id, "board": board}
+    else:
+        body = {"fixedNumbersBoard": fixed_numbers_board, "board": board}
     url = str(environ["RANDOM_MUTATION_LINK"])
-    response_body = dict()
+    response_body = await post_solver_function(url=url, body=body)
+
+    return freeze_board(response_body["board"])
+
+
+async def create_puzzle_session(
+    fixed_numbers_board: list, zone_height: int, zone_length: int, session_id: str
+) -> str:
+
+    """Create Puzzle Session
+
+    This function uses the general solver functions api to register the fixed numbers board and the zones measures of a puzzle
+    once, so the next calls can reference the puzzle using the session id, the session id is generated by the solver so all the
+    calls of the session can be routed to the same general solver functions server.
+
+    Args:
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+        session_id (str): The puzzle session id.
+
+    Returns:
+        str: The puzzle session id.
+    """
+
+    if solver_functions_backend == "local":
+        return local_create_puzzle_session(
+            fixed_numbers_board=fixed_numbers_board,
+            zone_height=zone_height,
+            zone_length=zone_length,
+            session_id=session_id,
+        )
+
+    body = {
+        "fixedNumbersBoard": fixed_numbers_board,
+        "zoneHeight": zone_height,
+        "zoneLength": zone_length,
+        "sessionId": session_id,
+    }
+    url = str(environ["CREATE_PUZZLE_SESSION_LINK"])
+    response_body = await post_solver_function(
+        zone_height=zone_height, zone_length=zone_length, url=url, body=body
+    )
+
+    register_puzzle_session_body(body=body)
+
+    return response_body["sessionId"]
+
+
+async def delete_puzzle_session(session_id: str) -> bool:
+
+    """Delete Puzzle Session
+
+    This function uses the general solver functions api to remove a puzzle session when the solver doesn't need it anymore.
+
+    Args:
+        session_id (str): The puzzle session id.
+
+    Returns:
+        bool: Indicates if the session existed.
+    """
+
+    if solver_functions_backend == "local":
+        return local_delete_puzzle_session(session_id=session_id)
+
+    forget_puzzle_session_body(session_id=session_id)
 
-    headers = {"Authorization": api_key, "Content-Type": "application/json"}
-    async with ClientSession(headers=headers) as session:
-        async with session.post(url=url, json=body) as response:
-            response_body = await response.json()
+    body = {"sessionId": session_id}
+    url = str(environ["DELETE_PUZZLE_SESSION_LINK"])
+    response_body = await post_solver_function(url=url, body=body)
 
-    return response_body["board"]
+    return response_body["deleted"]
@@ -1,7 +1,17 @@
-from aiohttp import ClientSession
-from os import environ
+from general_solvers_functions import calculate_board_fitness_single_bitmask as local_calculate_board_fitness_single
+from general_solvers_functions import calculate_board_fitness_batch as local_calculate_board_fitness_batch
+from general_solvers_functions import board_random_mutation_delta as local_board_random_mutation_delta
+from general_solvers_functions import evolve_generation as local_evolve_generation
+from general_solvers_functions import freeze_board
+
+from general_solver_functions_access import solver_functions_backend
+from general_solver_functions_access import get_local_puzzle
 
-api_key = str(environ["SOLVER_FUNCTIONS_KEY"])
+from solver_functions_session import post_solver_function
+
+from compute_executor import run_compute
+
+from os import environ
 
 
 async def calculate_board_fitness_single(
@@ -23,13 +33,199 @@ async def calculate_board_fitness_single(
         list: The original board.
     """
 
+    if solver_functions_backend == "local":
+        fitness_score = await run_compute(
+            local_calculate_board_fitness_single,
+            work_size=len(board) ** 2,
+            zone_height=zone_height,
+            zone_length=zone_length,
+            board=board,
+        )
+        return (fitness_score, board)
+
     body = {"zoneHeight": zone_height, "zoneLength": zone_length, "board": board}
     url = str(environ["FITNESS_SINGLE_SCORE_LINK"])
-    response_body = dict()
-
-    headers = {"Authorization": api_key}
-    async with ClientSession(headers=headers) as session:
-        async with session.post(url=url, json=body) as response:
-            response_body = await response.json()
+    response_body = await post_solver_function(
+        zone_height=zone_height, zone_length=zone_length, url=url, body=body
+    )
 
     return (response_body["fitnessScore"], board)
+
+
+async def calculate_board_fitness_batch(
+    boards: list, zone_height: int, zone_length: int
+) -> list:
+
+    """Calculate Board Fitness Batch
+
+    This function uses the general solver functions api to calculate the total of all the collisions of every board in a list of
+    boards using a single request, the result is a list of tuples with the score and the board in the same order of the given boards.
+
+    Args:
+        boards (list): A list of full filled board representations.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: A list of tuples with the total collisions on the board and the original board.
+    """
+
+    if len(boards) == 0:
+        return list()
+
+    if solver_functions_backend == "local":
+        fitness_scores = await run_compute(
+            local_calculate_board_fitness_batch,
+            work_size=sum(len(board) ** 2 for board in boards),
+            zone_height=zone_height,
+            zone_length=zone_length,
+            boards=boards,
+        )
+        return list(zip(fitness_scores, boards))
+
+    body = {"zoneHeight": zone_height, "zoneLength": zone_length, "boards": boards}
+    url = str(environ["FITNESS_BATCH_SCORE_LINK"])
+    response_body = await post_solver_function(
+        zone_height=zone_height, zone_length=zone_length, url=url, body=body
+    )
+
+    return list(zip(response_body["fitnessScores"], boards))
+
+
+async def board_random_mutation_delta(
+    board: list,
+    fitness_score: int,
+    fixed_numbers_board: list = None,
+    zone_height: int = 0,
+    zone_length: int = 0,
+    session_id: str = None,
+) -> tuple:
+
+    """Board Random Mutation Delta
+
+    This function uses the general solver functions api to mutate randomly a board based on its initial state and to update its
+    fitness score with just the collisions that the mutation changes, the result is a tuple with the new score and the new board,
+    if a puzzle session id is given the session is used instead of the fixed numbers board and the zones measures.
+
+    Args:
+        board (list): A full filled board representation.
+        fitness_score (int): Total collisions on the original board.
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+        session_id (str): The puzzle session id.
+
+    Returns:
+        int: Total collisions on the mutated board.
+        tuple: A full filled immutable board representation with a mutation in one of its rows.
+    """
+
+    if solver_functions_backend == "local":
+        puzzle = get_local_puzzle(
+            fixed_numbers_board=fixed_numbers_board,
+            zone_height=zone_height,
+            zone_length=zone_length,
+            session_id=session_id,
+        )
+        board, fitness_score = await run_compute(
+            local_board_random_mutation_delta,
+            work_size=len(board) ** 2,
+            fixed_numbers_board=puzzle["fixedNumbersBoard"],
+            zone_height=puzzle["zoneHeight"],
+            zone_length=puzzle["zoneLength"],
+            free_cells=puzzle["freeCells"],
+            candidates=puzzle["candidates"],
+            fitness_score=fitness_score,
+            board=board,
+        )
+        return (fitness_score, board)
+
+    if session_id is not None:
+        body = {"sessionId": session_id, "fitnessScore": fitness_score, "board": board}
+    else:
+        body = {
+            "fixedNumbersBoard": fixed_numbers_board,
+            "fitnessScore": fitness_score,
+            "zoneHeight": zone_height,
+            "zoneLength": zone_length,
+            "board": board,
+        }
+    url = str(environ["RANDOM_MUTATION_DELTA_LINK"])
+    response_body = await post_solver_function(
+        zone_height=zone_height, zone_length=zone_length, url=url, body=body
+    )
+
+    return (response_body["fitnessScore"], freeze_board(response_body["board"]))
+
+
+async def evolve_generation(
+    population: list,
+    mutation_probability: float,
+    crossover_probability: float,
+    population_size: int,
+    fixed_numbers_board: list = None,
+    zone_height: int = 0,
+    zone_length: int = 0,
+    session_id: str = None,
+) -> list:
+
+    """Evolve Generation
+
+    This function uses the general solver functions api to run the mutation, crossover, ranking and selection of a full genetic
+    algorithm generation in a single request, if a puzzle session id is given the session is used instead of the fixed numbers
+    board and the zones measures.
+
+    Args:
+        population (list): The current population as a list of tuples with the fitness score and the board of each individual.
+        mutation_probability (float): The mutation probability of each individual.
+        crossover_probability (float): The crossover probability of each individual.
+        population_size (int): The number of individuals that are kept for the next generation.
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+        session_id (str): The puzzle session id.
+
+    Returns:
+        list: The next generation as a list of tuples with the fitness score and the board of each individual.
+    """
+
+    if solver_functions_backend == "local":
+        puzzle = get_local_puzzle(
+            fixed_numbers_board=fixed_numbers_board,
+            zone_height=zone_height,
+            zone_length=zone_length,
+            session_id=session_id,
+        )
+        return await run_compute(
+            local_evolve_generation,
+            work_size=sum(len(individual[1]) ** 2 for individual in population),
+            fixed_numbers_board=puzzle["fixedNumbersBoard"],
+            crossover_probability=crossover_probability,
+            mutation_probability=mutation_probability,
+            zone_height=puzzle["zoneHeight"],
+            zone_length=puzzle["zoneLength"],
+            free_cells=puzzle["freeCells"],
+            candidates=puzzle["candidates"],
+            population_size=population_size,
+            population=population,
+        )
+
+    body = {
+        "fitnessScores": [individual[0] for individual in population],
+        "boards": [individual[1] for individual in population],
+        "crossover": crossover_probability,
+        "mutation": mutation_probability,
+        "populationSize": population_size,
+    }
+    if session_id is not None:
+        body["sessionId"] = session_id
+    else:
+        body["fixedNumbersBoard"] = fixed_numbers_board
+        body["zoneHeight"] = zone_height
+        body["zoneLength"] = zone_length
+    url = str(environ["EVOLVE_GENERATION_LINK"])
+    response_body = await post_solver_function(
+        zone_height=zone_height, zone_length=zone_length, url=url, body=body
+    )
+
+    return list(zip(response_body["fitnessScores"], map(freeze_board, response_body["boards"])))
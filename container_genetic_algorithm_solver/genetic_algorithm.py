@@ -1,22 +1,52 @@
-from general_solver_functions_access_custom import calculate_board_fitness_single
+from general_solver_functions_access_custom import calculate_board_fitness_batch
+from general_solver_functions_access_custom import board_random_mutation_delta
+from general_solver_functions_access_custom import evolve_generation
 
 from general_solver_functions_access import board_random_initialization
-from general_solver_functions_access import board_random_mutation
+from general_solver_functions_access import create_puzzle_session
+from general_solver_functions_access import delete_puzzle_session
 
+from general_solvers_functions import propagate_board_constraints
+from general_solvers_functions import freeze_board
+
+from genetic_algorithm_functions import build_generation_progress
+from genetic_algorithm_functions import rank_tournament_members
 from genetic_algorithm_functions import tournament_selection
 from genetic_algorithm_functions import exchange_random_row
 
 from buffered_gather import buffered_gather
 
+from metrics import observe_histogram
+from metrics import increment_counter
+from metrics import describe_metric
+
+from request_timings import measure_phase
+
+from island_model import evolve_islands
+
 from logger import setup_logger
 
-from copy import deepcopy
+from asyncio import TimeoutError
+from asyncio import wait_for
+from os import environ
+from uuid import uuid4
 import itertools
 import random
+import heapq
+import time
 import os
 
 logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
 
+describe_metric(r"genetic_algorithm_generations_total", r"counter", r"Generations evolved by the genetic algorithm.")
+describe_metric(r"genetic_algorithm_solving_seconds", r"histogram", r"Solving time of the genetic algorithm by stop reason.")
+describe_metric(
+    r"genetic_algorithm_generations_per_second",
+    r"histogram",
+    r"Generations evolved per second by every solving of the genetic algorithm.",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000),
+)
+
 
 async def random_decision(probability: float) -> bool:
 
@@ -41,7 +71,7 @@ async def random_decision(probability: float) -> bool:
 
 
 async def crossover(
-    filled_board: list, population: list, crossover_probability: float
+    filled_board: list, tournament_members: list, crossover_probability: float
 ) -> list:
 
     """Crossover
@@ -50,7 +80,7 @@ async def crossover(
 
     Args:
         filled_board (list): A full filled board representation.
-        population (list): All the current population.
+        tournament_members (list): The best individuals of the current population ranked for the generation.
         crossover_probability (float): The crossover probability of the individual.
 
     Returns:
@@ -61,7 +91,7 @@ async def crossover(
 
     if occurrence is True:
 
-        crossover_individual = await tournament_selection(population=population)
+        crossover_individual = await tournament_selection(tournament_members=tournament_members)
         return await exchange_random_row(filled_board, crossover_individual[1])
 
     else:
@@ -70,28 +100,39 @@ async def crossover(
 
 
 async def mutate(
-    filled_board: list, fixed_numbers_board: list, mutation_probability: float
-) -> list:
+    individual: tuple,
+    session_id: str,
+    mutation_probability: float,
+    zone_height: int,
+    zone_length: int,
+) -> tuple:
 
     """Mutate
 
-    This function create a new board mutating the original board based on it's mutation probability.
+    This function create a new individual mutating the original board based on it's mutation probability, the fitness score of the
+    new individual is updated from the original score instead of ranking the mutated board again.
 
     Args:
-        filled_board (list): A full filled board representation.
-        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        individual (tuple): An individual with its fitness score and its full filled board representation.
+        session_id (str): The puzzle session id of the board that is being solved.
         mutation_probability (float): The mutation probability of the individual.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
 
     Returns:
-        list: The mutated board or a None if the board dosn't mutate.
+        tuple: The mutated individual or a None if the board dosn't mutate.
     """
 
     occurrence = await random_decision(probability=mutation_probability)
 
     if occurrence is True:
 
-        return await board_random_mutation(
-            board=filled_board, fixed_numbers_board=fixed_numbers_board
+        return await board_random_mutation_delta(
+            fitness_score=individual[0],
+            session_id=session_id,
+            zone_height=zone_height,
+            zone_length=zone_length,
+            board=individual[1],
         )
 
     else:
@@ -99,109 +140,76 @@ async def mutate(
         return None
 
 
-async def solve_using_genetic_algorithm(
+async def evolve_individuals(
+    population: list,
+    session_id: str,
     genetic_algorithm_crossover: float,
-    genetic_algorithm_generations: int,
     genetic_algorithm_population: int,
     genetic_algorithm_mutation: float,
     zone_height: int,
     zone_length: int,
-    board: list,
 ) -> list:
 
-    """Solve Using Genetic Algorithm
+    """Evolve Individuals
 
-    This function uses a genetic algorithm to solve sudoku boards, its based on chromosomes and threading for solving the board as
-    fast as possible avoiding local highs as much as possible.
+    This function evolves a generation of the population making a general solver functions call for each mutated individual and
+    for each crossed individual, the calls are made in parallel using the buffered gather.
 
     Args:
+        population (list): The current population as a list of tuples with the fitness score and the board of each individual.
+        session_id (str): The puzzle session id of the board that is being solved.
         genetic_algorithm_crossover (float): The crossover probability.
-        genetic_algorithm_generations (int): The generations number.
         genetic_algorithm_population (int): The population number.
         genetic_algorithm_mutation (float): The mutation probability.
         zone_height (int): The zones height.
         zone_length (int): The zones length.
-        board (list): A full filled board representation.
 
     Returns:
-        list: The best finded board.
+        list: The next generation as a list of tuples with the fitness score and the board of each individual.
     """
 
-    logger.debug(msg=r"starting to solve using genetic algorithm")
-
-    fixed_numbers_board = deepcopy(board)
-
-    population = await buffered_gather(
-        [
-            board_random_initialization(
-                fixed_numbers_board=fixed_numbers_board,
-                zone_height=zone_height,
-                zone_length=zone_length,
-            )
-            for _ in itertools.repeat(None, genetic_algorithm_population)
-        ]
-    )
-
-    population = await buffered_gather(
-        [
-            calculate_board_fitness_single(
-                board=individual, zone_height=zone_height, zone_length=zone_length
-            )
-            for individual in population
-        ]
-    )
-
-    for _ in itertools.repeat(None, genetic_algorithm_generations):
-
-        # Creating mutated population.
+    # Creating mutated population.
 
+    with measure_phase(r"mutate"):
         mutated_population = await buffered_gather(
-            [
+            (
                 mutate(
                     mutation_probability=genetic_algorithm_mutation,
-                    fixed_numbers_board=fixed_numbers_board,
-                    filled_board=individual[1],
+                    session_id=session_id,
+                    zone_height=zone_height,
+                    zone_length=zone_length,
+                    individual=individual,
                 )
                 for individual in population
-            ]
-        )
-
-        # Filtering the mutated population.
-
-        mutated_population = [
-            mutation
-            for mutation in filter(
-                lambda mutated_individual: mutated_individual is not None,
-                mutated_population,
             )
-        ]
+        )
 
-        # Ranking the mutated population.
+    # Filtering the mutated population.
 
-        mutated_population = await buffered_gather(
-            [
-                calculate_board_fitness_single(
-                    zone_height=zone_height,
-                    zone_length=zone_length,
-                    board=individual,
-                )
-                for individual in mutated_population
-            ]
+    mutated_population = [
+        mutation
+        for mutation in filter(
+            lambda mutated_individual: mutated_individual is not None,
+            mutated_population,
         )
+    ]
 
-        # Craeting crossover population.
+    # Craeting crossover population, the population is ranked once and all the selections are drawn from that ranking.
 
-        population_copy = deepcopy(population)
+    with measure_phase(r"ranking"):
+        tournament_members = rank_tournament_members(population=population)
+
+    with measure_phase(r"crossover"):
 
         crossover_population = await buffered_gather(
-            [
+            (
                 crossover(
                     crossover_probability=genetic_algorithm_crossover,
-                    population=population_copy,
+                    tournament_members=tournament_members,
                     filled_board=individual[1],
                 )
                 for individual in population
-            ]
+            )
         )
 
         # Filtering the crossover population.
@@ -216,32 +224,292 @@ async def solve_using_genetic_algorithm(
 
         # Ranking the crossover population.
 
-        crossover_population = await buffered_gather(
-            [
-                calculate_board_fitness_single(
-                    zone_height=zone_height,
-                    zone_length=zone_length,
-                    board=individual,
-                )
-                for individual in crossover_population
-            ]
+        crossover_population = await calculate_board_fitness_batch(
+            boards=crossover_population, zone_height=zone_height, zone_length=zone_length
         )
 
-        # Extending and sorting population by individuals rank.
-
-        population.extend(crossover_population)
-        population.extend(mutated_population)
+    # Keeping just the most apt individuals of the extended population, without sorting all of it.
 
-        population = sorted(
-            population, key=lambda individual: individual[0], reverse=False
+    with measure_phase(r"sort"):
+        return heapq.nsmallest(
+            genetic_algorithm_population,
+            itertools.chain(population, crossover_population, mutated_population),
+            key=lambda individual: individual[0],
         )
 
-        # Removing the not apt individuals.
 
-        population = population[:genetic_algorithm_population]
+async def evolve_population(
+    population: list,
+    session_id: str,
+    genetic_algorithm_crossover: float,
+    genetic_algorithm_generations: int,
+    genetic_algorithm_population: int,
+    genetic_algorithm_mutation: float,
+    zone_height: int,
+    zone_length: int,
+    deadline_ms: float = None,
+    target_fitness: int = 0,
+    progress_callback=None,
+    start_time: float = None,
+) -> tuple:
+
+    """Evolve Population
+
+    This function evolves a ranked population during the given generations using the evolution mode defined by an environment
+    variable, the evolution stops before the last generation if the best individual reaches the target fitness or if the deadline
+    is reached, in that case the generation in progress is cancelled and the last complete generation is kept.
+
+    Args:
+        population (list): The population as a list of tuples with the fitness score and the board of each individual sorted by
+        fitness score.
+        session_id (str): The puzzle session id.
+        genetic_algorithm_crossover (float): The crossover probability.
+        genetic_algorithm_generations (int): The generations number.
+        genetic_algorithm_population (int): The population number.
+        genetic_algorithm_mutation (float): The mutation probability.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+        deadline_ms (float): The maximum evolution time in milliseconds from now, there is no deadline if it's not given.
+        target_fitness (int): The collisions number that is good enough for stopping the evolution.
+        progress_callback (Callable): An async function that recives the progress of the population after every generation, the
+        progress is not reported if it's not given.
+        start_time (float): The performance counter value at the start of the solving, used for the progress elapsed time.
+
+    Returns:
+        list: The evolved population sorted by fitness score.
+        str: The stop reason, target_fitness, deadline or generations.
+        int: The number of generations that were evolved.
+    """
+
+    evolution_mode = str(environ.get("EVOLUTION_MODE", "generation"))
+
+    if start_time is None:
+        start_time = time.perf_counter()
+
+    if deadline_ms is None:
+        deadline = None
+    else:
+        deadline = time.perf_counter() + deadline_ms / 1000
+
+    stop_reason, generations_run = "generations", 0
+
+    for _ in itertools.repeat(None, genetic_algorithm_generations):
+
+        if population[0][0] <= target_fitness:
+            stop_reason = "target_fitness"
+            break
+
+        if deadline is None:
+            timeout = None
+        else:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                stop_reason = "deadline"
+                break
 
-        # Increasing generations counter.
+        if evolution_mode == "generation":
 
-    logger.debug(msg=r"ending to solve using genetic algorithm")
+            generation = evolve_generation(
+                crossover_probability=genetic_algorithm_crossover,
+                mutation_probability=genetic_algorithm_mutation,
+                population_size=genetic_algorithm_population,
+                zone_height=zone_height,
+                zone_length=zone_length,
+                session_id=session_id,
+                population=population,
+            )
+
+        else:
+
+            generation = evolve_individuals(
+                genetic_algorithm_population=genetic_algorithm_population,
+                genetic_algorithm_crossover=genetic_algorithm_crossover,
+                genetic_algorithm_mutation=genetic_algorithm_mutation,
+                zone_height=zone_height,
+                zone_length=zone_length,
+                session_id=session_id,
+                population=population,
+            )
+
+        # The generation in progress is cancelled if the deadline arrives, so the last complete generation is kept.
+
+        try:
+            with measure_phase(r"generation"):
+                population = await wait_for(generation, timeout=timeout)
+        except TimeoutError:
+            stop_reason = "deadline"
+            break
+
+        generations_run += 1
+
+        if progress_callback is not None:
+            await progress_callback(
+                build_generation_progress(
+                    generation=generations_run, population=population, start_time=start_time
+                )
+            )
+
+    else:
+
+        if population[0][0] <= target_fitness:
+            stop_reason = "target_fitness"
+
+    return population, stop_reason, generations_run
+
+
+async def solve_using_genetic_algorithm(
+    genetic_algorithm_crossover: float,
+    genetic_algorithm_generations: int,
+    genetic_algorithm_population: int,
+    genetic_algorithm_mutation: float,
+    zone_height: int,
+    zone_length: int,
+    board: list,
+    deadline_ms: int = None,
+    target_fitness: int = 0,
+    progress_callback=None,
+    islands: int = 1,
+    migration_interval: int = 10,
+) -> tuple:
+
+    """Solve Using Genetic Algorithm
+
+    This function uses a genetic algorithm to solve sudoku boards, its based on chromosomes and threading for solving the board as
+    fast as possible avoiding local highs as much as possible, the evolution stops before the last generation if the best board
+    reaches the target fitness or if the deadline is reached, in both cases the best board found so far is returned, if more than
+    one island is requested the population is divided in islands that evolve in parallel processes, before the evolution the
+    naked and hidden singles of the board are filled by constraint propagation if it's enabled by an environment variable, and if
+    the propagation fills the full board it's returned without evolving any generation.
+
+    Args:
+        genetic_algorithm_crossover (float): The crossover probability.
+        genetic_algorithm_generations (int): The generations number.
+        genetic_algorithm_population (int): The population number.
+        genetic_algorithm_mutation (float): The mutation probability.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+        board (list): A full filled board representation.
+        deadline_ms (int): The maximum solving time in milliseconds, there is no deadline if it's not given.
+        target_fitness (int): The collisions number that is good enough for stopping the evolution.
+        progress_callback (Callable): An async function that recives the progress of the population after the initialization and
+        after every generation, or after every migration epoch if the population evolves in islands, the progress is not reported
+        if it's not given.
+        islands (int): The number of islands.
+        migration_interval (int): The generations that every island evolves between two migrations.
+
+    Returns:
+        list: The best finded board.
+        str: The stop reason, propagation, target_fitness, deadline or generations.
+        int: The number of generations that were evolved.
+    """
+
+    logger.debug(msg=r"starting to solve using genetic algorithm")
+
+    start_time = time.perf_counter()
+
+    fixed_numbers_board = freeze_board(board)
+
+    # Filling the cells that have just one legal number, the rest of the cells keep their candidates in the puzzle session.
+
+    if str(environ.get("CONSTRAINT_PROPAGATION", "enabled")) == "enabled":
+
+        with measure_phase(r"propagation"):
+            fixed_numbers_board = propagate_board_constraints(
+                fixed_numbers_board=fixed_numbers_board,
+                zone_height=zone_height,
+                zone_length=zone_length,
+            )
+
+        if all(number != 0 for row in fixed_numbers_board for number in row):
+            logger.debug(msg=r"board solved by constraint propagation")
+            return fixed_numbers_board, "propagation", 0
+
+    # Registering the fixed numbers board once, so the next calls can reference it using the session id.
+
+    session_id = await create_puzzle_session(
+        fixed_numbers_board=fixed_numbers_board,
+        zone_height=zone_height,
+        zone_length=zone_length,
+        session_id=uuid4().hex,
+    )
+
+    try:
+
+        with measure_phase(r"initialization"):
+
+            population = await buffered_gather(
+                (
+                    board_random_initialization(
+                        zone_height=zone_height,
+                        zone_length=zone_length,
+                        session_id=session_id,
+                    )
+                    for _ in itertools.repeat(None, genetic_algorithm_population)
+                )
+            )
+
+            population = await calculate_board_fitness_batch(
+                boards=population, zone_height=zone_height, zone_length=zone_length
+            )
+            population.sort(key=lambda individual: individual[0])
+
+        if progress_callback is not None:
+            await progress_callback(
+                build_generation_progress(generation=0, population=population, start_time=start_time)
+            )
+
+        if deadline_ms is not None:
+            deadline_ms = deadline_ms - 1000 * (time.perf_counter() - start_time)
+
+        evolution_parameters = {
+            "genetic_algorithm_generations": genetic_algorithm_generations,
+            "genetic_algorithm_population": genetic_algorithm_population,
+            "genetic_algorithm_crossover": genetic_algorithm_crossover,
+            "genetic_algorithm_mutation": genetic_algorithm_mutation,
+            "zone_height": zone_height,
+            "zone_length": zone_length,
+            "session_id": session_id,
+            "target_fitness": target_fitness,
+            "deadline_ms": deadline_ms,
+        }
+
+        if islands > 1:
+
+            population, stop_reason, generations_run = await evolve_islands(
+                migration_interval=migration_interval,
+                progress_callback=progress_callback,
+                evolve_function=evolve_population,
+                evolution_parameters=evolution_parameters,
+                start_time=start_time,
+                population=population,
+                islands=islands,
+            )
+
+        else:
+
+            population, stop_reason, generations_run = await evolve_population(
+                progress_callback=progress_callback,
+                start_time=start_time,
+                population=population,
+                **evolution_parameters,
+            )
+
+    finally:
+
+        await delete_puzzle_session(session_id=session_id)
+
+    # The generations per second are measured from the solving start, so they include the population initialization.
+
+    solving_time = time.perf_counter() - start_time
+
+    increment_counter(r"genetic_algorithm_generations_total", generations_run)
+    observe_histogram(r"genetic_algorithm_solving_seconds", solving_time, stop_reason=stop_reason)
+
+    if generations_run > 0:
+        observe_histogram(r"genetic_algorithm_generations_per_second", generations_run / solving_time)
+
+    logger.debug(
+        msg=f"ending to solve using genetic algorithm, stop reason: {stop_reason}, generations: {generations_run}"
+    )
 
-    return population[0][1]
+    return population[0][1], stop_reason, generations_run
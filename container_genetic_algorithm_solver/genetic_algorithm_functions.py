@@ -1,18 +1,22 @@
-from copy import deepcopy
+from general_solvers_functions import replace_board_row
+
 import random
+import heapq
+import time
 
 
-async def tournament_selection(population: list) -> tuple:
+def rank_tournament_members(population: list) -> list:
 
-    """Roulette Selection
+    """Rank Tournament Members
 
-    This function is used to select an individual from all the population based on it's fitness score for making the crossover.
+    This function ranks the population once per generation and returns the best half of it, the tournament selections of the
+    generation are drawn from these members, so the population is not sorted again on every selection.
 
     Args:
-        population (list): The probability of the event occurrence.
+        population (list): The population as a list of tuples with the fitness score and the board of each individual.
 
     Returns:
-        tuple: An individual chromosome representation for the crossover.
+        list: The best individuals of the population sorted by fitness score.
     """
 
     tournament_size = len(population) // 2
@@ -20,19 +24,32 @@ async def tournament_selection(population: list) -> tuple:
     if tournament_size == 0:
         tournament_size = 2
 
-    population = sorted(population, key=lambda individual: individual[0])
+    return heapq.nsmallest(tournament_size, population, key=lambda individual: individual[0])
+
+
+async def tournament_selection(tournament_members: list) -> tuple:
+
+    """Tournament Selection
+
+    This function is used to select an individual from the tournament members of the generation for making the crossover.
 
-    tournament_members = population[:tournament_size]
+    Args:
+        tournament_members (list): The best individuals of the population ranked for the generation.
+
+    Returns:
+        tuple: An individual chromosome representation for the crossover.
+    """
 
     return random.choice(tournament_members)
 
 
-async def exchange_random_row(individual_1: list, individual_2: list) -> list:
+async def exchange_random_row(individual_1: list, individual_2: list) -> tuple:
 
     """Exchange Random Row
 
     This function is used for making the crossover between two individuals, in picks a random row an exchange it between the two
-    given individuals.
+    given individuals, the given individuals and their fitness scores are not modified, the new individual shares its rows with
+    them and just allocates the tuple of rows.
 
     Args:
         individual_1 (list): The representation of the first individual.
@@ -44,9 +61,34 @@ async def exchange_random_row(individual_1: list, individual_2: list) -> list:
 
     exchange_index = random.randrange(len(individual_1))
 
-    individual_1[exchange_index], individual_2[exchange_index] = (
-        deepcopy(individual_2[exchange_index]),
-        deepcopy(individual_1[exchange_index]),
+    individual_1, individual_2 = random.choice([(individual_1, individual_2), (individual_2, individual_1)])
+
+    return replace_board_row(
+        board=individual_1, row_index=exchange_index, row=tuple(individual_2[exchange_index])
     )
 
-    return random.choice([individual_1, individual_2])
+
+def build_generation_progress(generation: int, population: list, start_time: float) -> dict:
+
+    """Build Generation Progress
+
+    This function summarizes the state of the population after a generation for reporting the solving progress.
+
+    Args:
+        generation (int): The number of generations evolved so far.
+        population (list): The population as a list of tuples with the fitness score and the board of each individual.
+        start_time (float): The performance counter value at the start of the solving.
+
+    Returns:
+        dict: The generation number, the best, worst and mean fitness of the population and the elapsed milliseconds.
+    """
+
+    fitness_scores = [individual[0] for individual in population]
+
+    return {
+        "generation": generation,
+        "bestFitness": min(fitness_scores),
+        "worstFitness": max(fitness_scores),
+        "meanFitness": round(sum(fitness_scores) / len(fitness_scores), 4),
+        "elapsedMs": round(1000 * (time.perf_counter() - start_time), 3),
+    }
@@ -0,0 +1,372 @@
+from genetic_algorithm_functions import build_generation_progress
+
+from request_timings import merge_request_timings
+from request_timings import get_request_timings
+from request_timings import run_timed_function
+
+from general_solver_functions_access import solver_functions_backend
+
+from solver_functions_session import close_solver_functions_session
+import solver_functions_session
+
+from puzzle_sessions import create_puzzle_session
+from puzzle_sessions import delete_puzzle_session
+from puzzle_sessions import get_puzzle_session
+
+import compute_executor
+
+from logger import setup_logger
+
+from concurrent.futures import ProcessPoolExecutor
+from asyncio import get_event_loop
+from multiprocessing import get_context
+from functools import partial
+from asyncio import gather
+from aiohttp import web
+from os import environ
+import asyncio
+import time
+import os
+
+logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
+
+inherited_sessions = list()
+
+island_executor = None
+
+
+def get_max_islands() -> int:
+
+    """Get Max Islands
+
+    This function returns the maximum number of islands of a solve, defined by an environment variable or by the number of cores
+    if the variable is not defined.
+
+    Returns:
+        int: The maximum number of islands.
+    """
+
+    return int(environ.get("MAX_ISLANDS", str(os.cpu_count() or 1)))
+
+
+def initialize_island_worker() -> None:
+
+    """Initialize Island Worker
+
+    This function prepares a new island worker process, the http client session inherited from the api process belongs to the api
+    event loop, so every worker opens its own session when it needs it, the inherited session is kept referenced because
+    collecting it would close the connections that the api process shares with the worker, the inherited compute executor
+    belongs to the api process too, so the worker runs the local solver functions inline.
+    """
+
+    inherited_sessions.append(solver_functions_session.solver_functions_session)
+    solver_functions_session.solver_functions_session = None
+    compute_executor.compute_executor = None
+
+
+async def open_island_executor(_: web.Application) -> None:
+
+    """Open Island Executor
+
+    This function opens the process pool used for evolving the islands at the api startup, so all the solves share the same
+    island workers instead of starting new ones, the pool has a worker for every island that a solve can use and it's not opened
+    if the solves can't use more than one island.
+
+    Args:
+        _ (web.Application): The api that is starting.
+    """
+
+    global island_executor
+
+    max_islands = get_max_islands()
+
+    if max_islands > 1:
+
+        logger.debug(msg=f"opening island executor with {max_islands} processes")
+
+        # The fork context is used explicitly because the api server starts the api when it's imported.
+
+        island_executor = ProcessPoolExecutor(
+            max_workers=max_islands,
+            mp_context=get_context("fork"),
+            initializer=initialize_island_worker,
+        )
+
+
+async def close_island_executor(_: web.Application) -> None:
+
+    """Close Island Executor
+
+    This function closes the island process pool at the api shutdown.
+
+    Args:
+        _ (web.Application): The api that is shutting down.
+    """
+
+    global island_executor
+
+    if island_executor is not None:
+        logger.debug(msg=r"closing island executor")
+        island_executor.shutdown(wait=True)
+        island_executor = None
+
+
+async def evolve_island_epoch(
+    evolve_function, population: list, evolution_parameters: dict, fixed_numbers_board: list = None
+) -> tuple:
+
+    """Evolve Island Epoch
+
+    This function evolves the population of an island during an epoch and closes the worker http client session at the end,
+    because the session belongs to the epoch event loop, if a fixed numbers board is given the puzzle session is created in the
+    worker during the epoch, because the local solver functions backend keeps the sessions in the process memory.
+
+    Args:
+        evolve_function (Callable): The async function that evolves a population.
+        population (list): The island population sorted by fitness score.
+        evolution_parameters (dict): The evolve function parameters.
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+
+    Returns:
+        list: The evolved island population sorted by fitness score.
+        str: The stop reason, target_fitness, deadline or generations.
+        int: The number of generations that were evolved.
+    """
+
+    if fixed_numbers_board is not None:
+        create_puzzle_session(
+            fixed_numbers_board=fixed_numbers_board,
+            zone_height=evolution_parameters["zone_height"],
+            zone_length=evolution_parameters["zone_length"],
+            session_id=evolution_parameters["session_id"],
+        )
+
+    try:
+        return await evolve_function(population=population, **evolution_parameters)
+    finally:
+        if fixed_numbers_board is not None:
+            delete_puzzle_session(session_id=evolution_parameters["session_id"])
+        await close_solver_functions_session(None)
+
+
+def run_island_epoch(
+    evolve_function, population: list, evolution_parameters: dict, fixed_numbers_board: list = None
+) -> tuple:
+
+    """Run Island Epoch
+
+    This function is the entry point of the island worker processes, it runs an island epoch in a new event loop.
+
+    Args:
+        evolve_function (Callable): The async function that evolves a population.
+        population (list): The island population sorted by fitness score.
+        evolution_parameters (dict): The evolve function parameters.
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+
+    Returns:
+        list: The evolved island population sorted by fitness score.
+        str: The stop reason, target_fitness, deadline or generations.
+        int: The number of generations that were evolved.
+    """
+
+    return asyncio.run(
+        evolve_island_epoch(
+            fixed_numbers_board=fixed_numbers_board,
+            evolution_parameters=evolution_parameters,
+            evolve_function=evolve_function,
+            population=population,
+        )
+    )
+
+
+def migrate_individuals(islands_populations: list, migration_size: int) -> list:
+
+    """Migrate Individuals
+
+    This function makes a ring migration between the islands, the best individuals of every island replace the worst individuals
+    of the next island, the last island sends its best individuals to the first one.
+
+    Args:
+        islands_populations (list): The population of every island sorted by fitness score.
+        migration_size (int): The number of individuals that every island sends to the next one.
+
+    Returns:
+        list: The population of every island after the migration sorted by fitness score.
+    """
+
+    migrants = [island_population[:migration_size] for island_population in islands_populations]
+
+    return [
+        sorted(
+            island_population[: len(island_population) - migration_size]
+            + migrants[island_index - 1],
+            key=lambda individual: individual[0],
+        )
+        for island_index, island_population in enumerate(islands_populations)
+    ]
+
+
+async def evolve_islands(
+    evolve_function,
+    population: list,
+    evolution_parameters: dict,
+    islands: int,
+    migration_interval: int,
+    progress_callback=None,
+    start_time: float = None,
+) -> tuple:
+
+    """Evolve Islands
+
+    This function divides the population in islands that evolve in parallel worker processes, every island evolves during the
+    migration interval generations and then the best individuals migrate to the next island, the epochs are repeated until the
+    generations are completed, an island reaches the target fitness or the deadline is reached, the number of islands is limited
+    by an environment variable and the number of migrants is defined by other one, if the population evolves as a single island
+    it's evolved in the api process.
+
+    Args:
+        evolve_function (Callable): The async function that evolves a population.
+        population (list): The population as a list of tuples with the fitness score and the board of each individual sorted by
+        fitness score.
+        evolution_parameters (dict): The evolve function parameters, the generations, population and deadline are the solving
+        totals.
+        islands (int): The number of islands.
+        migration_interval (int): The generations that every island evolves between two migrations.
+        progress_callback (Callable): An async function that recives the progress of all the islands after every migration epoch
+        instead of every generation, because the generations are evolved in the worker processes, the progress is not reported if
+        it's not given.
+        start_time (float): The performance counter value at the start of the solving, used for the progress elapsed time.
+
+    Returns:
+        list: The evolved population of all the islands sorted by fitness score.
+        str: The stop reason, target_fitness, deadline or generations.
+        int: The number of generations that were evolved.
+    """
+
+    islands = min(islands, get_max_islands())
+    islands = max(1, min(islands, len(population) // 2))
+    migration_size = int(environ.get("MIGRATION_SIZE", "2"))
+
+    if start_time is None:
+        start_time = time.perf_counter()
+
+    if islands == 1 or island_executor is None:
+        return await evolve_function(
+            progress_callback=progress_callback,
+            start_time=start_time,
+            population=population,
+            **evolution_parameters,
+        )
+
+    generations = evolution_parameters["genetic_algorithm_generations"]
+    deadline_ms = evolution_parameters["deadline_ms"]
+    target_fitness = evolution_parameters["target_fitness"]
+    islands_start_time = time.perf_counter()
+
+    # The ranked population is dealt between the islands, so every island starts with good and bad individuals, the islands sizes
+    # differ at most by one individual and every island keeps its size during the evolution.
+
+    islands_populations = [population[island_index::islands] for island_index in range(islands)]
+    migration_size = min(migration_size, len(islands_populations[-1]) - 1)
+
+    logger.debug(msg=f"evolving {islands} islands of {len(islands_populations[-1])} individuals or more")
+
+    # The island workers are started once for all the solves, so with the local solver functions backend they don't have the
+    # puzzle sessions created after that, and the fixed numbers board of the session is sent with every epoch.
+
+    if solver_functions_backend == "local":
+        fixed_numbers_board = get_puzzle_session(session_id=evolution_parameters["session_id"])["fixedNumbersBoard"]
+    else:
+        fixed_numbers_board = None
+
+    stop_reason, generations_run = "generations", 0
+
+    while generations_run < generations:
+
+        if min(island_population[0][0] for island_population in islands_populations) <= target_fitness:
+            stop_reason = "target_fitness"
+            break
+
+        if deadline_ms is None:
+            remaining_ms = None
+        else:
+            remaining_ms = deadline_ms - 1000 * (time.perf_counter() - islands_start_time)
+            if remaining_ms <= 0:
+                stop_reason = "deadline"
+                break
+
+        epoch_parameters = {
+            **evolution_parameters,
+            "genetic_algorithm_generations": min(migration_interval, generations - generations_run),
+            "deadline_ms": remaining_ms,
+        }
+
+        # The workers don't share the request timings, so when the request is timed they measure the epoch phases and send
+        # them with the epoch result.
+
+        if get_request_timings() is None:
+            island_epoch_function = run_island_epoch
+        else:
+            island_epoch_function = partial(run_timed_function, run_island_epoch)
+
+        epochs = await gather(
+            *[
+                get_event_loop().run_in_executor(
+                    island_executor,
+                    partial(
+                        island_epoch_function,
+                        evolution_parameters={
+                            **epoch_parameters,
+                            "genetic_algorithm_population": len(island_population),
+                        },
+                        fixed_numbers_board=fixed_numbers_board,
+                        evolve_function=evolve_function,
+                        population=island_population,
+                    ),
+                )
+                for island_population in islands_populations
+            ]
+        )
+
+        if island_epoch_function is not run_island_epoch:
+            for _, worker_timings in epochs:
+                merge_request_timings(timings=worker_timings)
+            epochs = [epoch for epoch, _ in epochs]
+
+        islands_populations = [epoch[0] for epoch in epochs]
+        generations_run += max(epoch[2] for epoch in epochs)
+
+        if progress_callback is not None:
+            await progress_callback(
+                build_generation_progress(
+                    population=[individual for island in islands_populations for individual in island],
+                    generation=generations_run,
+                    start_time=start_time,
+                )
+            )
+
+        if any(epoch[1] == "target_fitness" for epoch in epochs):
+            stop_reason = "target_fitness"
+            break
+
+        if any(epoch[1] == "deadline" for epoch in epochs):
+            stop_reason = "deadline"
+            break
+
+        # Ring migration of the best individuals between the islands.
+
+        islands_populations = migrate_individuals(
+            islands_populations=islands_populations, migration_size=migration_size
+        )
+
+    else:
+
+        if min(island_population[0][0] for island_population in islands_populations) <= target_fitness:
+            stop_reason = "target_fitness"
+
+    population = sorted(
+        [individual for island_population in islands_populations for individual in island_population],
+        key=lambda individual: individual[0],
+    )
+
+    return population, stop_reason, generations_run
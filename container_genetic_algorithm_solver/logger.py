@@ -1,24 +1,61 @@
+from logging.handlers import QueueListener
+from logging.handlers import QueueHandler
+from os import environ
+from queue import Queue
+import itertools
 import logging
+import random
+import atexit
+import os
 
+queue_handler = None
+queue_listener = None
 
-def setup_logger(logger_name: str) -> logging:
 
-    """Setup Logger
+class LogSamplingFilter(logging.Filter):
 
-    This function is used to obtain a logging object in anny function.
+    """Log Sampling Filter
 
-    Args:
-        logger_name (str): The logger name.
+    This filter keeps just a random fraction of the debug and info records, defined by an environment variable, the warning,
+    error and critical records are always kept.
+    """
 
-    Returns:
-        logging: The new logger.
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or random.random() < self.sample_rate
+
+
+class BoardStamp:
+
+    """Board Stamp
+
+    This class wraps a board for logging its string representation, the representation is just built if the record is emitted, so
+    the boards of the disabled or discarded records are never converted to strings.
     """
 
-    logger = logging.getLogger(logger_name)
-    logger.setLevel(logging.DEBUG)
+    __slots__ = ("board",)
+
+    def __init__(self, board: list):
+        self.board = board
+
+    def __str__(self) -> str:
+        return get_board_stamp(self.board)
+
+
+def start_queue_listener() -> None:
+
+    """Start Queue Listener
+
+    This function creates the queue shared by all the loggers of the process and starts the listener thread that writes the queued
+    records to the console, so the logging calls just put the records in the queue and never wait for the console.
+    """
+
+    global queue_listener
 
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.DEBUG)
 
     formatter = logging.Formatter(
         fmt="[%(asctime)s]:%(levelname)s:%(name)s - %(message)s",
@@ -26,7 +63,63 @@ def setup_logger(logger_name: str) -> logging:
 
     console_handler.setFormatter(formatter)
 
-    logger.addHandler(console_handler)
+    queue_handler.queue = Queue(-1)
+    queue_listener = QueueListener(queue_handler.queue, console_handler)
+    queue_listener.start()
+
+
+def stop_queue_listener() -> None:
+
+    """Stop Queue Listener
+
+    This function writes the records that are still in the queue and stops the listener thread when the process exits.
+    """
+
+    if queue_listener is not None:
+        queue_listener.stop()
+
+
+def setup_queue_handler() -> None:
+
+    """Setup Queue Handler
+
+    This function creates the queue handler shared by all the loggers of the process and starts its listener, the processes
+    created by fork don't inherit the listener thread, so they start their own listener with a new queue.
+    """
+
+    global queue_handler
+
+    queue_handler = QueueHandler(Queue(-1))
+    queue_handler.addFilter(LogSamplingFilter(sample_rate=float(environ.get("LOG_SAMPLE_RATE", "1"))))
+
+    start_queue_listener()
+
+    atexit.register(stop_queue_listener)
+    os.register_at_fork(after_in_child=start_queue_listener)
+
+
+def setup_logger(logger_name: str) -> logging:
+
+    """Setup Logger
+
+    This function is used to obtain a logging object in anny function, the logging level is defined by an environment variable
+    and the records are written to the console by the queue listener thread.
+
+    Args:
+        logger_name (str): The logger name.
+
+    Returns:
+        logging: The new logger.
+    """
+
+    if queue_handler is None:
+        setup_queue_handler()
+
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(str(environ.get("LOG_LEVEL", "DEBUG")).upper())
+
+    if queue_handler not in logger.handlers:
+        logger.addHandler(queue_handler)
 
     return logger
 
@@ -44,10 +137,4 @@ def get_board_stamp(board: list) -> str:
         str: The board string representation.
     """
 
-    board_stamp = ""
-
-    for row in board:
-        for element in row:
-            board_stamp += str(element)
-
-    return board_stamp
+    return "".join(map(str, itertools.chain.from_iterable(board)))
@@ -0,0 +1,219 @@
+from aiohttp.web_request import Request
+from contextlib import contextmanager
+from bisect import bisect_left
+from aiohttp import web
+import time
+
+METRICS_CONTENT_TYPE = r"text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+metrics_descriptions = dict()
+metrics_samples = dict()
+
+
+def describe_metric(name: str, metric_type: str, description: str, buckets: tuple = LATENCY_BUCKETS) -> None:
+
+    """Describe Metric
+
+    This function registers a metric with its type and description, the metrics must be described before being updated, the
+    histograms also register the upper bounds of their buckets.
+
+    Args:
+        name (str): The metric name.
+        metric_type (str): The metric type, counter, gauge or histogram.
+        description (str): The metric description.
+        buckets (tuple): The upper bounds of the histogram buckets in increasing order.
+    """
+
+    metrics_descriptions[name] = {"type": metric_type, "description": description, "buckets": buckets}
+    metrics_samples.setdefault(name, dict())
+
+
+def increment_counter(name: str, value: float = 1, **labels) -> None:
+
+    """Increment Counter
+
+    This function adds a value to the sample of a counter with the given labels.
+
+    Args:
+        name (str): The metric name.
+        value (float): The value added to the counter.
+        **labels (str): The sample labels.
+    """
+
+    samples = metrics_samples[name]
+    labels_key = tuple(sorted(labels.items()))
+    samples[labels_key] = samples.get(labels_key, 0) + value
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+
+    """Set Gauge
+
+    This function sets the value of the sample of a gauge with the given labels.
+
+    Args:
+        name (str): The metric name.
+        value (float): The gauge value.
+        **labels (str): The sample labels.
+    """
+
+    metrics_samples[name][tuple(sorted(labels.items()))] = value
+
+
+def observe_histogram(name: str, value: float, **labels) -> None:
+
+    """Observe Histogram
+
+    This function counts a value in the bucket of the sample of a histogram with the given labels, the values greater than the
+    last bucket upper bound are just counted in the infinite bucket.
+
+    Args:
+        name (str): The metric name.
+        value (float): The observed value.
+        **labels (str): The sample labels.
+    """
+
+    buckets = metrics_descriptions[name]["buckets"]
+    samples = metrics_samples[name]
+    labels_key = tuple(sorted(labels.items()))
+
+    if labels_key not in samples:
+        samples[labels_key] = {"buckets": [0] * (len(buckets) + 1), "sum": 0.0, "count": 0}
+
+    sample = samples[labels_key]
+    sample["buckets"][bisect_left(buckets, value)] += 1
+    sample["sum"] += value
+    sample["count"] += 1
+
+
+@contextmanager
+def measure_duration(name: str, **labels):
+
+    """Measure Duration
+
+    This function measures the duration of the block of a with statement in seconds and observes it in a histogram, the duration
+    is observed even if the block raises an exception.
+
+    Args:
+        name (str): The histogram name.
+        **labels (str): The sample labels.
+    """
+
+    start_time = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        observe_histogram(name, time.perf_counter() - start_time, **labels)
+
+
+def format_labels(labels: tuple) -> str:
+
+    """Format Labels
+
+    This function formats the labels of a sample using the prometheus text format, the labels values are escaped.
+
+    Args:
+        labels (tuple): The sample labels as sorted name and value pairs.
+
+    Returns:
+        str: The formatted labels or an empty string if the sample doesn't have labels.
+    """
+
+    if len(labels) == 0:
+        return ""
+
+    formatted_labels = list()
+
+    for label_name, label_value in labels:
+        label_value = str(label_value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        formatted_labels.append(f'{label_name}="{label_value}"')
+
+    return "{" + ",".join(formatted_labels) + "}"
+
+
+def render_metrics() -> str:
+
+    """Render Metrics
+
+    This function renders all the described metrics and their samples using the prometheus text format, the histograms buckets
+    are rendered as cumulative counts.
+
+    Returns:
+        str: The metrics exposition.
+    """
+
+    lines = list()
+
+    for name, metric_description in metrics_descriptions.items():
+
+        lines.append(f'# HELP {name} {metric_description["description"]}')
+        lines.append(f'# TYPE {name} {metric_description["type"]}')
+
+        for labels, sample in metrics_samples[name].items():
+
+            if metric_description["type"] != "histogram":
+                lines.append(f"{name}{format_labels(labels)} {sample}")
+                continue
+
+            cumulative_count = 0
+
+            for upper_bound, bucket_count in zip(metric_description["buckets"] + ("+Inf",), sample["buckets"]):
+                cumulative_count += bucket_count
+                lines.append(f"{name}_bucket{format_labels(labels + (('le', upper_bound),))} {cumulative_count}")
+
+            lines.append(f'{name}_sum{format_labels(labels)} {sample["sum"]}')
+            lines.append(f'{name}_count{format_labels(labels)} {sample["count"]}')
+
+    return "\n".join(lines) + "\n"
+
+
+describe_metric(r"http_requests_total", r"counter", r"Requests answered by the api by method, route and status code.")
+describe_metric(r"http_request_duration_seconds", r"histogram", r"Requests latency of the api by method and route.")
+describe_metric(r"http_requests_in_flight", r"gauge", r"Requests that the api is answering.")
+describe_metric(r"request_body_parse_seconds", r"histogram", r"Time spent deserializing the requests bodies.")
+describe_metric(r"authorization_check_seconds", r"histogram", r"Time spent checking the requests authorization.")
+
+set_gauge(r"http_requests_in_flight", 0)
+
+
+@web.middleware
+async def metrics_middleware(request: Request, handler) -> web.StreamResponse:
+
+    """Metrics Middleware
+
+    This function measures every request answered by the api, it counts the requests by method, route and status code, observes
+    their latency and keeps the count of requests in flight, the route is the path template of the matched resource so the paths
+    with ids don't create a sample per id.
+
+    Args:
+        request (Request): Any http request made to the api.
+        handler (Callable): The next handler of the request.
+
+    Returns:
+        web.StreamResponse: The response of the handler.
+    """
+
+    resource = request.match_info.route.resource
+    route = resource.canonical if resource is not None else r"unmatched"
+    status = 500
+
+    metrics_samples[r"http_requests_in_flight"][()] += 1
+    start_time = time.perf_counter()
+
+    try:
+        response = await handler(request)
+        status = response.status
+        return response
+
+    except web.HTTPException as http_exception:
+        status = http_exception.status
+        raise
+
+    finally:
+        metrics_samples[r"http_requests_in_flight"][()] -= 1
+        observe_histogram(
+            r"http_request_duration_seconds", time.perf_counter() - start_time, method=request.method, route=route
+        )
+        increment_counter(r"http_requests_total", method=request.method, route=route, status=status)
@@ -0,0 +1,258 @@
+from board_codec import MSGPACK_CONTENT_TYPE
+from board_codec import JSON_CONTENT_TYPE
+from board_codec import decode_body
+from board_codec import encode_body
+
+from metrics import measure_duration
+from metrics import describe_metric
+
+from request_timings import measure_phase
+
+from logger import setup_logger
+
+from urllib.parse import urlparse
+from aiohttp import ClientTimeout
+from aiohttp import ClientSession
+from aiohttp import TCPConnector
+from aiohttp import web
+from os import environ
+import os
+
+logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
+
+describe_metric(r"solver_function_call_seconds", r"histogram", r"Latency of the general solver functions api calls by path.")
+
+solver_functions_session = None
+puzzle_sessions_bodies = dict()
+
+
+class SolverFunctionError(Exception):
+
+    """Solver Function Error
+
+    This exception is raised when a general solver functions api path answers with a status code that is not a success code.
+    """
+
+    def __init__(self, url: str, status: int, reason: str):
+        super().__init__(f"the solver function {url} answered with the status {status}: {reason}")
+        self.status = status
+
+
+def build_solver_functions_session() -> ClientSession:
+
+    """Build Solver Functions Session
+
+    This function builds a http client session with a bounded pool of keep alive connections for making the requests to the
+    general solver functions api, the pool size and the timeouts are defined by environment variables.
+
+    Returns:
+        ClientSession: A new http client session.
+    """
+
+    pool_size = int(environ.get("SOLVER_FUNCTIONS_POOL_SIZE", "100"))
+    keepalive_timeout = float(environ.get("SOLVER_FUNCTIONS_KEEPALIVE_TIMEOUT", "60"))
+    connect_timeout = float(environ.get("SOLVER_FUNCTIONS_CONNECT_TIMEOUT", "10"))
+    total_timeout = float(environ.get("SOLVER_FUNCTIONS_TOTAL_TIMEOUT", "60"))
+
+    logger.debug(msg=f"building solver functions session with a pool of {pool_size} connections")
+
+    connector = TCPConnector(limit=pool_size, keepalive_timeout=keepalive_timeout)
+    timeout = ClientTimeout(total=total_timeout, connect=connect_timeout)
+    headers = {"Authorization": str(environ["SOLVER_FUNCTIONS_KEY"])}
+
+    return ClientSession(connector=connector, timeout=timeout, headers=headers)
+
+
+def get_solver_functions_session() -> ClientSession:
+
+    """Get Solver Functions Session
+
+    This function returns the process wide http client session used for accessing the general solver functions api, if the session
+    was not opened at the api startup it's opened in the first use.
+
+    Returns:
+        ClientSession: The process wide http client session.
+    """
+
+    global solver_functions_session
+
+    if solver_functions_session is None or solver_functions_session.closed:
+        solver_functions_session = build_solver_functions_session()
+
+    return solver_functions_session
+
+
+async def open_solver_functions_session(_: web.Application) -> None:
+
+    """Open Solver Functions Session
+
+    This function opens the process wide http client session at the api startup.
+
+    Args:
+        _ (web.Application): The api that is starting.
+    """
+
+    logger.debug(msg=r"opening solver functions session")
+
+    get_solver_functions_session()
+
+
+async def close_solver_functions_session(_: web.Application) -> None:
+
+    """Close Solver Functions Session
+
+    This function closes the process wide http client session and its connections pool at the api shutdown.
+
+    Args:
+        _ (web.Application): The api that is shutting down.
+    """
+
+    global solver_functions_session
+
+    logger.debug(msg=r"closing solver functions session")
+
+    if solver_functions_session is not None:
+        await solver_functions_session.close()
+        solver_functions_session = None
+
+
+def register_puzzle_session_body(body: dict) -> None:
+
+    """Register Puzzle Session Body
+
+    This function keeps the body used for creating a puzzle session, so the session can be created again if the general solver
+    functions server that stores it loses it.
+
+    Args:
+        body (dict): The create puzzle session request body with the session id.
+    """
+
+    puzzle_sessions_bodies[body["sessionId"]] = body
+
+
+def forget_puzzle_session_body(session_id: str) -> None:
+
+    """Forget Puzzle Session Body
+
+    This function removes the body used for creating a puzzle session when the session is deleted.
+
+    Args:
+        session_id (str): The puzzle session id.
+    """
+
+    puzzle_sessions_bodies.pop(session_id, None)
+
+
+async def send_solver_function_request(
+    url: str, body: dict, zone_height: int = 0, zone_length: int = 0
+) -> tuple:
+
+    """Send Solver Function Request
+
+    This function makes a request to a general solver functions api path using the process wide http client session, the body is
+    sent using the wire format defined by an environment variable, json by default or msgpack with packed boards.
+
+    Args:
+        url (str): The general solver functions api path url.
+        body (dict): The request body.
+        zone_height (int): The zones height of the boards in the body.
+        zone_length (int): The zones length of the boards in the body.
+
+    Returns:
+        int: The response status code.
+        str: The response reason.
+        bytes: The raw response body.
+        str: The response content type.
+    """
+
+    if str(environ.get("SOLVER_FUNCTIONS_WIRE_FORMAT", "json")) == "msgpack":
+        content_type = MSGPACK_CONTENT_TYPE
+    else:
+        content_type = JSON_CONTENT_TYPE
+
+    headers = {"Content-Type": content_type, "Accept": content_type}
+
+    # The puzzle session id is also sent as a header so the load balancer can route all the session calls to the same server.
+
+    if "sessionId" in body:
+        headers["X-Session-Id"] = body["sessionId"]
+    data = encode_body(
+        body=body,
+        content_type=content_type,
+        zone_height=zone_height,
+        zone_length=zone_length,
+    )
+
+    session = get_solver_functions_session()
+
+    path = urlparse(url).path
+
+    with measure_duration(r"solver_function_call_seconds", path=path), measure_phase(f"solver_function:{path}"):
+        async with session.post(url=url, data=data, headers=headers) as response:
+            raw_body = await response.read()
+
+    return response.status, response.reason, raw_body, response.content_type
+
+
+async def post_solver_function(
+    url: str, body: dict, zone_height: int = 0, zone_length: int = 0
+) -> dict:
+
+    """Post Solver Function
+
+    This function makes a request to a general solver functions api path and deserializes the response using its own content
+    type, the puzzle sessions are stored in memory by each general solver functions server, so if a session call answers that
+    the session doesn't exists because it expired, was evicted or its server changed, the session is created again with the same
+    id and the call is retried, and if the session is lost again the call is sent with the fixed numbers board inline.
+
+    Args:
+        url (str): The general solver functions api path url.
+        body (dict): The request body.
+        zone_height (int): The zones height of the boards in the body.
+        zone_length (int): The zones length of the boards in the body.
+
+    Returns:
+        dict: The deserialized response body.
+
+    Raises:
+        SolverFunctionError: If the general solver functions api answers with a status code that is not a success code.
+    """
+
+    session_body = puzzle_sessions_bodies.get(body.get("sessionId"))
+
+    status, reason, raw_body, content_type = await send_solver_function_request(
+        zone_height=zone_height, zone_length=zone_length, url=url, body=body
+    )
+
+    if status == 404 and session_body is not None and session_body is not body:
+
+        logger.warning(msg=f'puzzle session {body["sessionId"]} not found, creating it again')
+
+        await post_solver_function(
+            zone_height=session_body["zoneHeight"],
+            zone_length=session_body["zoneLength"],
+            url=str(environ["CREATE_PUZZLE_SESSION_LINK"]),
+            body=session_body,
+        )
+
+        status, reason, raw_body, content_type = await send_solver_function_request(
+            zone_height=zone_height, zone_length=zone_length, url=url, body=body
+        )
+
+    if status == 404 and session_body is not None and session_body is not body:
+
+        logger.warning(msg=f'puzzle session {body["sessionId"]} lost again, sending the fixed numbers board inline')
+
+        inline_body = {key: value for key, value in body.items() if key != "sessionId"}
+        inline_body["fixedNumbersBoard"] = session_body["fixedNumbersBoard"]
+        inline_body["zoneHeight"] = session_body["zoneHeight"]
+        inline_body["zoneLength"] = session_body["zoneLength"]
+
+        status, reason, raw_body, content_type = await send_solver_function_request(
+            zone_height=zone_height, zone_length=zone_length, url=url, body=inline_body
+        )
+
+    if not 200 <= status < 300:
+        raise SolverFunctionError(url=url, status=status, reason=reason)
+
+    return decode_body(raw_body=raw_body, content_type=content_type)
@@ -0,0 +1,234 @@
+from logger import setup_logger
+
+from asyncio import CancelledError
+from asyncio import PriorityQueue
+from collections import OrderedDict
+from asyncio import create_task
+from itertools import count
+from asyncio import gather
+from os import environ
+from uuid import uuid4
+import time
+import os
+
+logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
+
+solver_jobs = OrderedDict()
+jobs_sequence = count()
+jobs_workers = list()
+jobs_queue = None
+
+
+class JobsQueueFull(Exception):
+
+    """Jobs Queue Full
+
+    This exception is raised when a job is submitted and its puzzles don't fit in the jobs queue capacity.
+    """
+
+
+def evict_solver_jobs() -> None:
+
+    """Evict Solver Jobs
+
+    This function removes the finished jobs whose results were not fetched during the jobs time to live, and the oldest finished
+    jobs if there are more jobs than the jobs capacity, the jobs that are still solving are never evicted, both limits are defined
+    by environment variables.
+    """
+
+    jobs_capacity = int(environ.get("JOBS_CAPACITY", "1000"))
+    current_time = time.monotonic()
+
+    finished_jobs = [job_id for job_id, job in solver_jobs.items() if job["expiration"] is not None]
+
+    for job_id in finished_jobs:
+        if solver_jobs[job_id]["expiration"] > current_time and len(solver_jobs) <= jobs_capacity:
+            continue
+        logger.debug(msg=f"evicting solver job: {job_id}")
+        del solver_jobs[job_id]
+
+
+def submit_solver_job(puzzles: list, priority: int = 0) -> str:
+
+    """Submit Solver Job
+
+    This function registers a new job and puts each one of its puzzles in the jobs priority queue, the puzzles with the lower
+    priority value are solved first and the puzzles with the same priority are solved in submission order.
+
+    Args:
+        puzzles (list): The solve using genetic algorithm function parameters of each puzzle.
+        priority (int): The job priority.
+
+    Returns:
+        str: The job id.
+    """
+
+    queue_capacity = int(environ.get("JOBS_QUEUE_CAPACITY", "10000"))
+
+    if jobs_queue.qsize() + len(puzzles) > queue_capacity:
+        raise JobsQueueFull(f"the jobs queue can't take {len(puzzles)} puzzles more")
+
+    job_id = uuid4().hex
+
+    solver_jobs[job_id] = {
+        "status": "queued",
+        "priority": priority,
+        "results": [None] * len(puzzles),
+        "completedPuzzles": 0,
+        "failedPuzzles": 0,
+        "submissionTime": time.monotonic(),
+        "expiration": None,
+    }
+
+    for puzzle_index, solver_parameters in enumerate(puzzles):
+        jobs_queue.put_nowait((priority, next(jobs_sequence), job_id, puzzle_index, solver_parameters))
+
+    evict_solver_jobs()
+
+    logger.debug(msg=f"solver job submitted: {job_id} with {len(puzzles)} puzzles")
+
+    return job_id
+
+
+def get_solver_job(job_id: str) -> dict:
+
+    """Get Solver Job
+
+    This function returns the data of a job.
+
+    Args:
+        job_id (str): The job id.
+
+    Returns:
+        dict: The job data or None if the job doesn't exists or expired.
+    """
+
+    evict_solver_jobs()
+
+    return solver_jobs.get(job_id)
+
+
+def get_jobs_queue_size() -> int:
+
+    """Get Jobs Queue Size
+
+    This function returns the number of puzzles that are waiting in the jobs queue.
+
+    Returns:
+        int: The queued puzzles or zero if the jobs queue was not created yet.
+    """
+
+    if jobs_queue is None:
+        return 0
+
+    return jobs_queue.qsize()
+
+
+def delete_solver_job(job_id: str) -> bool:
+
+    """Delete Solver Job
+
+    This function removes a job, its puzzles that are still in the queue are skipped by the workers.
+
+    Args:
+        job_id (str): The job id.
+
+    Returns:
+        bool: Indicates if the job existed.
+    """
+
+    logger.debug(msg=f"deleting solver job: {job_id}")
+
+    return solver_jobs.pop(job_id, None) is not None
+
+
+async def run_jobs_worker(solve_puzzle) -> None:
+
+    """Run Jobs Worker
+
+    This function takes the puzzles from the jobs queue in priority order and solves them one by one, the result of each puzzle
+    is stored in its job, if a puzzle fails its result is an error and the rest of the job puzzles are still solved.
+
+    Args:
+        solve_puzzle (Callable): The async function that solves a puzzle from its parameters and returns the response body dict.
+    """
+
+    while True:
+
+        _, _, job_id, puzzle_index, solver_parameters = await jobs_queue.get()
+
+        try:
+
+            job = solver_jobs.get(job_id)
+
+            if job is None:
+                logger.debug(msg=f"solver job {job_id} doesn't exists, puzzle skipped")
+                continue
+
+            job["status"] = "running"
+
+            try:
+                job["results"][puzzle_index] = await solve_puzzle(solver_parameters)
+
+            except CancelledError:
+                raise
+
+            except Exception:
+                logger.exception(msg=f"exception solving the puzzle {puzzle_index} of the job {job_id}")
+                job["results"][puzzle_index] = {"error": r"internal error inside the solver server"}
+                job["failedPuzzles"] += 1
+
+            job["completedPuzzles"] += 1
+
+            if job["completedPuzzles"] == len(job["results"]):
+                logger.debug(msg=f"solver job completed: {job_id}")
+                job["status"] = "completed"
+                job["expiration"] = time.monotonic() + float(environ.get("JOBS_TTL", "3600"))
+
+        finally:
+
+            jobs_queue.task_done()
+
+
+async def open_solver_jobs(_, solve_puzzle) -> None:
+
+    """Open Solver Jobs
+
+    This function creates the jobs priority queue and starts the bounded pool of workers at the api startup, the number of workers
+    is defined by an environment variable.
+
+    Args:
+        _ (web.Application): The api that is starting.
+        solve_puzzle (Callable): The async function that solves a puzzle from its parameters and returns the response body dict.
+    """
+
+    global jobs_queue
+
+    jobs_workers_number = int(environ.get("JOBS_WORKERS", "2"))
+
+    logger.debug(msg=f"starting {jobs_workers_number} solver jobs workers")
+
+    jobs_queue = PriorityQueue()
+
+    for _ in range(jobs_workers_number):
+        jobs_workers.append(create_task(run_jobs_worker(solve_puzzle=solve_puzzle)))
+
+
+async def close_solver_jobs(_) -> None:
+
+    """Close Solver Jobs
+
+    This function stops the jobs workers at the api cleanup, the puzzles that are still in the queue are discarded.
+
+    Args:
+        _ (web.Application): The api that is stopping.
+    """
+
+    logger.debug(msg=r"stopping solver jobs workers")
+
+    for jobs_worker in jobs_workers:
+        jobs_worker.cancel()
+
+    await gather(*jobs_workers, return_exceptions=True)
+
+    jobs_workers.clear()
@@ -12,6 +12,9 @@ const script_firm = "api";
 const error_firm = "err";
 const end_firm = "end";
 
+const ndjson_content_type = "application/x-ndjson";
+const debug_timings_header = "X-Debug-Timings";
+
 const api = express();
 
 api.use(express.json());
@@ -29,9 +32,13 @@ api.use(express.json());
  * @param origin_url {string} The url that generates the original request.
  * @param response {express.response} The express response object.
  * @param health_test_url {string} The solver health test url.
+ * @param stream {boolean} Indicates if the solver progress should be streamed as newline delimited json, the solver response is 
+ * piped to the client and the solver request is closed if the client disconnects.
+ * @param debug_timings {string} The debug timings header value of the original request, it's forwarded to the solver and the 
+ * solver server timing header is sent back to the client, it's undefined if the original request doesn't have the header.
  * @returns {express.response} The response from the solver or from the method if the solver fails.
  */
-async function proxy_redirect(authorization, body, destination_url, origin_url, response, health_test_url) {
+async function proxy_redirect(authorization, body, destination_url, origin_url, response, health_test_url, stream = false, debug_timings = undefined) {
 
     // Control variables.
 
@@ -69,11 +76,19 @@ async function proxy_redirect(authorization, body, destination_url, origin_url,
         print_log(`starting to solve using: ${destination_url}`, script_firm);
         print_log(`making request to: ${destination_url}`, script_firm);
 
+        const solver_headers = {
+            "Content-Type": "application/json",
+            "Authorization": authorization,
+            "Accept": stream == true ? ndjson_content_type : "application/json",
+        };
+
+        if (debug_timings !== undefined) {
+            solver_headers[debug_timings_header] = debug_timings;
+        }
+
         const solver_response = await axios({
-            headers: {
-                "Content-Type": "application/json",
-                "Authorization": authorization,
-            },
+            headers: solver_headers,
+            responseType: stream == true ? "stream" : "json",
             url: destination_url,
             method: "post",
             data: body,
@@ -82,6 +97,9 @@ async function proxy_redirect(authorization, body, destination_url, origin_url,
                 `there was an error while requesting to: ${destination_url}`,
                 error_firm
             );
+            if (error.response) {
+                return error.response;
+            }
             return {
                 statusText: "request to solver failed, please use other solver or request it later",
                 status: 500,
@@ -92,7 +110,17 @@ async function proxy_redirect(authorization, body, destination_url, origin_url,
         print_log(`response code from: ${destination_url} is: ${solver_response.status}`, script_firm);
         print_log(`routing from: ${destination_url} to: ${origin_url}`, script_firm);
 
-        if (solver_response.status == 200) {
+        if (solver_response.headers && solver_response.headers["server-timing"]) {
+            response.set("Server-Timing", solver_response.headers["server-timing"]);
+        }
+
+        if (solver_response.status == 200 && stream == true) {
+            response.statusMessage = "ok";
+            response.status(solver_response.status);
+            response.set({ "Content-Type": ndjson_content_type, "X-Accel-Buffering": "no" });
+            response.on("close", () => solver_response.data.destroy());
+            return solver_response.data.pipe(response);
+        } else if (solver_response.status == 200) {
             response.statusMessage = "ok";
             return response.status(solver_response.status).json(solver_response.data);
         } else {
@@ -118,7 +146,7 @@ async function proxy_redirect(authorization, body, destination_url, origin_url,
  * @param response {express.response} The express response object.
  * @returns {express.response} The response from the solver or from the function if the solver fails.
  */
-api.post(["/hill_climbing", "/genetic_algorithm", "/simulated_annealing", "/neuronal_network"], async (request, response) => {
+api.post(["/hill_climbing", "/genetic_algorithm", "/simulated_annealing", "/neuronal_network", "/exact_solver"], async (request, response) => {
 
     // Try catch for keep the api running even if something goes wrong.
 
@@ -184,7 +212,9 @@ api.post(["/hill_climbing", "/genetic_algorithm", "/simulated_annealing", "/neur
                         destination_url,
                         origin_url,
                         response,
-                        health_test_url
+                        health_test_url,
+                        (request.get("Accept") || "").includes(ndjson_content_type),
+                        request.get(debug_timings_header)
                     );
 
                 } else if (original_path == "/simulated_annealing") {
@@ -212,6 +242,21 @@ api.post(["/hill_climbing", "/genetic_algorithm", "/simulated_annealing", "/neur
                         response,
                         health_test_url
                     );
+
+                } else if (original_path == "/exact_solver") {
+                    health_test_url = process.env.EXACT_SOLVER_HEALTH_TEST_LINK;
+                    destination_url = process.env.EXACT_SOLVER_LINK;
+                    authorization = process.env.EXACT_SOLVER_KEY;
+                    return proxy_redirect(
+                        authorization,
+                        request.body,
+                        destination_url,
+                        origin_url,
+                        response,
+                        health_test_url,
+                        false,
+                        request.get(debug_timings_header)
+                    );
                 }
 
             } else if (valid_request_body == false) {
@@ -243,6 +288,136 @@ api.post(["/hill_climbing", "/genetic_algorithm", "/simulated_annealing", "/neur
 
 });
 
+/**
+ * This function is the incharge of act as a proxy for the solver jobs requests, it forwards the request to the genetic algorithm 
+ * solver jobs path and returns the response code, the status message and the body from the solver.
+ * 
+ * @param method {string} The http method of the request.
+ * @param body {object} The request body, it's undefined for the requests without body.
+ * @param destination_url {string} The solver jobs url.
+ * @param origin_url {string} The url that generates the original request.
+ * @param response {express.response} The express response object.
+ * @returns {express.response} The response from the solver or from the method if the solver fails.
+ */
+async function proxy_jobs_request(method, body, destination_url, origin_url, response) {
+
+    print_log(`making ${method} request to: ${destination_url}`, script_firm);
+
+    const solver_response = await axios({
+        headers: {
+            "Content-Type": "application/json",
+            "Authorization": process.env.GENETIC_ALGORITHM_SOLVER_KEY,
+        },
+        url: destination_url,
+        method: method,
+        data: body,
+    }).catch(function (error) {
+        print_log(
+            `there was an error while requesting to: ${destination_url}`,
+            error_firm
+        );
+        if (error.response) {
+            return error.response;
+        }
+        return {
+            statusText: "request to solver failed, please request it later",
+            status: 500,
+        };
+    });
+
+    print_log(`response code from: ${destination_url} is: ${solver_response.status}`, script_firm);
+    print_log(`routing from: ${destination_url} to: ${origin_url}`, script_firm);
+
+    response.statusMessage = solver_response.statusText.toLowerCase();
+
+    if (solver_response.data && solver_response.status < 300) {
+        return response.status(solver_response.status).json(solver_response.data);
+    } else {
+        return response.status(solver_response.status).end();
+    }
+
+}
+
+/**
+ * This function receives the solver jobs requests, the jobs submissions are validated puzzle by puzzle with the same body 
+ * validations of the solver paths and the jobs status, results and deletion requests are forwarded with the job id path.
+ * 
+ * @param request {express.request} The express request object.
+ * @param response {express.response} The express response object.
+ * @returns {express.response} The response from the solver or from the function if the validations fail.
+ */
+api.all(["/jobs", "/jobs/:job_id", "/jobs/:job_id/results"], async (request, response) => {
+
+    // Try catch for keep the api running even if something goes wrong.
+
+    try {
+
+        print_log(`new request received at: ${request.path}`, script_firm);
+
+        const origin_url = request.protocol + "://" + request.get("host") + request.originalUrl;
+        const destination_url = process.env.GENETIC_ALGORITHM_JOBS_LINK + request.path.slice("/jobs".length);
+
+        // Validating request header.
+
+        const [valid_request_header, header_validation_message] =
+        check_header_request_mandatory_requirements(request.headers);
+
+        if (valid_request_header == false) {
+            print_log(
+                `request header validation failed: ${header_validation_message}`,
+                script_firm
+            );
+            response.statusMessage = header_validation_message.toLowerCase();
+            return response.status(400).end();
+        }
+
+        if (request.method == "POST" && request.path == "/jobs") {
+
+            // Validating every puzzle of the job with the solver paths body validations.
+
+            const puzzles = request.body && Array.isArray(request.body.puzzles) ? request.body.puzzles : [];
+
+            if (puzzles.length == 0) {
+                response.statusMessage = "the puzzles must be a non empty list of puzzles";
+                return response.status(400).end();
+            }
+
+            for (let puzzle_index = 0; puzzle_index < puzzles.length; puzzle_index++) {
+                const [valid_request_body, body_validation_message] =
+                check_body_request_mandatory_requirements(puzzles[puzzle_index]);
+                if (valid_request_body == false) {
+                    print_log(
+                        `puzzle ${puzzle_index} validation failed: ${body_validation_message}`,
+                        script_firm
+                    );
+                    response.statusMessage = `puzzle ${puzzle_index}: ${body_validation_message.toLowerCase()}`;
+                    return response.status(400).end();
+                }
+            }
+
+            return proxy_jobs_request("post", request.body, destination_url, origin_url, response);
+
+        } else if (request.method == "GET" && request.path != "/jobs") {
+            return proxy_jobs_request("get", undefined, destination_url, origin_url, response);
+
+        } else if (request.method == "DELETE" && request.params.job_id && !request.path.endsWith("/results")) {
+            return proxy_jobs_request("delete", undefined, destination_url, origin_url, response);
+        }
+
+        response.statusMessage = "method not allowed";
+        return response.status(405).end();
+
+    } catch (error) {
+        const error_stack = error.stack.split("\n");
+        for (let error_index = 0; error_index < error_stack.length; error_index++) {
+            print_log(error_stack[error_index].trim(), error_firm);
+        }
+        response.statusMessage = "internal server error";
+        return response.status(500).end();
+    }
+
+});
+
 const server = api.listen(process.env.ACCESS_PORT);
 
 let connections = [];
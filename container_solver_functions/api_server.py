@@ -1,33 +1,180 @@
-from general_solvers_functions import calculate_board_fitness_report
-from general_solvers_functions import calculate_board_fitness_single
+from general_solvers_functions import calculate_board_fitness_report_batch
 from general_solvers_functions import board_random_initialization
+from general_solvers_functions import board_random_mutation_delta
 from general_solvers_functions import board_random_mutation
+from general_solvers_functions import evolve_generation
 
-from logger import get_board_stamp
+from board_codec import MSGPACK_CONTENT_TYPE
+from board_codec import JSON_CONTENT_TYPE
+from board_codec import decode_body
+from board_codec import encode_body
+
+from compute_executor import close_compute_executor
+from compute_executor import open_compute_executor
+from compute_executor import run_compute
+
+from fitness_cache import get_fitness_reports
+from fitness_cache import fitness_cache
+
+from exact_solver import solve_board_exactly
+
+from puzzle_sessions import create_puzzle_session
+from puzzle_sessions import delete_puzzle_session
+from puzzle_sessions import get_puzzle_session
+from puzzle_sessions import puzzle_sessions
+
+from metrics import METRICS_CONTENT_TYPE
+from metrics import metrics_middleware
+from metrics import measure_duration
+from metrics import describe_metric
+from metrics import render_metrics
+from metrics import set_gauge
+
+from request_timings import request_timings_middleware
+from request_timings import measure_phase
+
+from logger import BoardStamp
 from logger import setup_logger
 
 from aiohttp.web_request import Request
 from http import HTTPStatus
 from aiohttp import web
-from json import dumps
 from os import environ
 import os
 
 api_routes = web.RouteTableDef()
-api = web.Application()
+api = web.Application(middlewares=[metrics_middleware, request_timings_middleware])
 
 logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
 
 
-async def check_request_mandatory_requirements(request: Request) -> bool:
+async def read_request_body(request: Request) -> dict:
+
+    """Read Request Body
+
+    This function deserializes the body of a request made to any path of this api using the request content type, the bodies can
+    be sent as json or as msgpack with packed boards.
+
+    Args:
+        request (Request): An http request made from any solver for accessing any solver general function.
+
+    Returns:
+        dict: The deserialized request body.
+    """
+
+    raw_body = await request.read()
+
+    with measure_duration(r"request_body_parse_seconds"), measure_phase(r"parse"):
+        return decode_body(raw_body=raw_body, content_type=request.content_type)
+
+
+def build_response(
+    request: Request, response_dict: dict, zone_height: int = 0, zone_length: int = 0
+) -> web.Response:
+
+    """Build Response
+
+    This function serializes the response body using msgpack with packed boards if the request accepts it and json in any other
+    case, and packages it in a 200 response.
+
+    Args:
+        request (Request): The http request that is being answered.
+        response_dict (dict): The response body.
+        zone_height (int): The zones height of the boards in the response body.
+        zone_length (int): The zones length of the boards in the response body.
+
+    Returns:
+        web.Response: A 200 response with the serialized body.
+    """
+
+    if MSGPACK_CONTENT_TYPE in request.headers.get("Accept", ""):
+        content_type = MSGPACK_CONTENT_TYPE
+    else:
+        content_type = JSON_CONTENT_TYPE
+
+    headers = {"Content-Type": content_type}
+
+    with measure_phase(r"serialize"):
+        body = encode_body(
+            body=response_dict,
+            content_type=content_type,
+            zone_height=zone_height,
+            zone_length=zone_length,
+        )
+
+    return web.Response(
+        body=body,
+        headers=headers,
+        status=HTTPStatus.OK,
+    )
+
+
+def read_request_puzzle(request_body: dict) -> dict:
+
+    """Read Request Puzzle
+
+    This function obtains the puzzle that a request references, if the request body has a session id the puzzle is the data of
+    the respective puzzle session, in other case the puzzle is built from the fixed numbers board and the zones measures of the
+    request body.
+
+    Args:
+        request_body (dict): The deserialized request body.
+
+    Returns:
+        dict: The puzzle data or None if the referenced puzzle session doesn't exists.
+    """
+
+    if "sessionId" in request_body:
+        logger.info(msg=f'puzzle session: {request_body["sessionId"]}')
+        return get_puzzle_session(session_id=request_body["sessionId"])
+
+    logger.info(r"fixed board stamp: %s", BoardStamp(request_body["fixedNumbersBoard"]))
+
+    return {
+        "fixedNumbersBoard": request_body["fixedNumbersBoard"],
+        "zoneHeight": request_body.get("zoneHeight", 0),
+        "zoneLength": request_body.get("zoneLength", 0),
+        "missingNumbers": None,
+        "candidates": None,
+        "freeCells": None,
+    }
+
+
+async def compute_fitness_reports(boards: list, zone_height: int, zone_length: int) -> list:
+
+    """Compute Fitness Reports
+
+    This function calculates the fitness reports of a list of boards using the compute executor.
+
+    Args:
+        boards (list): A list of full filled board representations.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: Total, zone, row and column collisions of each board.
+    """
+
+    return await run_compute(
+        calculate_board_fitness_report_batch,
+        work_size=sum(len(board) ** 2 for board in boards),
+        zone_height=zone_height,
+        zone_length=zone_length,
+        boards=boards,
+    )
+
+
+async def check_request_mandatory_requirements(request: Request, access_key_variable: str = r"ACCESS_KEY") -> bool:
 
     """Check Request Mandatory Requirements
 
     This function is the incharge of checking if the requests made to any path of this api have all the mandatory requirements, its
-    main function is to check the security parameters as the Authorization.
+    main function is to check the security parameters as the Authorization, the valid key is read from the given environment
+    variable, so the paths that are exposed to other services can use their own key.
 
     Args:
         request (Request): An http request made from any solver for accessing any solver general function.
+        access_key_variable (str): The environment variable that contains the valid access key.
 
     Returns:
         bool: A boolean that indicates if the request is valid or not.
@@ -38,9 +185,9 @@ async def check_request_mandatory_requirements(request: Request) -> bool:
     # Request general validations.
 
     try:
-        await request.json()
+        await read_request_body(request)
         request_header_keys = [key for key in request.headers.keys()]
-        api_key = str(environ["ACCESS_KEY"])
+        api_key = str(environ[access_key_variable])
         request_headers = request.headers
         continue_process = True
         logger.debug(msg=r"the request headers and body are correct")
@@ -51,19 +198,21 @@ async def check_request_mandatory_requirements(request: Request) -> bool:
 
     # Authorization header validations.
 
-    if continue_process is True:
-        if "Authorization" in request_header_keys:
-            logger.debug(msg=r"the authorization header exists")
-        else:
-            logger.error(msg=r"the authorization header dosn't exists")
-            continue_process = False
+    with measure_duration(r"authorization_check_seconds"), measure_phase(r"auth"):
 
-    if continue_process is True:
-        if api_key == request_headers["Authorization"]:
-            logger.debug(msg=r"the authorization header is valid")
-        else:
-            logger.error(msg=r"the authorization header isn't valid")
-            continue_process = False
+        if continue_process is True:
+            if "Authorization" in request_header_keys:
+                logger.debug(msg=r"the authorization header exists")
+            else:
+                logger.error(msg=r"the authorization header dosn't exists")
+                continue_process = False
+
+        if continue_process is True:
+            if api_key == request_headers["Authorization"]:
+                logger.debug(msg=r"the authorization header is valid")
+            else:
+                logger.error(msg=r"the authorization header isn't valid")
+                continue_process = False
 
     logger.debug(msg=r"headers and body validation ended successfully")
 
@@ -95,28 +244,30 @@ async def get_board_fitness_single(request: Request) -> web.Response:
 
         if continue_process is True:
 
-            logger.debug(msg=r"parsing request body to json")
-            request_body = await request.json()
-            logger.debug(msg=r"request body successfully parsed to json")
-            logger.info(msg=f'board stamp: {get_board_stamp(request_body["board"])}')
+            logger.debug(msg=r"parsing request body")
+            request_body = await read_request_body(request)
+            logger.debug(msg=r"request body successfully parsed")
+            logger.info(r"board stamp: %s", BoardStamp(request_body["board"]))
 
-            fitness_score = calculate_board_fitness_single(
-                zone_height=request_body["zoneHeight"],
-                zone_length=request_body["zoneLength"],
-                board=request_body["board"],
-            )
+            fitness_score = (
+                await get_fitness_reports(
+                    zone_height=request_body["zoneHeight"],
+                    zone_length=request_body["zoneLength"],
+                    compute=compute_fitness_reports,
+                    boards=[request_body["board"]],
+                )
+            )[0][0]
 
             response_dict = {
                 "fitnessScore": fitness_score,
             }
 
-            headers = {"Content-Type": "application/json"}
-
             logger.debug(msg=r"request body successfully processed, sending response to the solver")
-            return web.Response(
-                body=dumps(obj=response_dict, indent=None),
-                headers=headers,
-                status=HTTPStatus.OK,
+            return build_response(
+                zone_height=request_body["zoneHeight"],
+                zone_length=request_body["zoneLength"],
+                response_dict=response_dict,
+                request=request,
             )
 
         else:
@@ -159,21 +310,24 @@ async def get_board_fitness_report(request: Request) -> web.Response:
 
         if continue_process is True:
 
-            logger.debug(msg=r"parsing request body to json")
-            request_body = await request.json()
-            logger.debug(msg=r"request body successfully parsed to json")
-            logger.info(msg=f'board stamp: {get_board_stamp(request_body["board"])}')
+            logger.debug(msg=r"parsing request body")
+            request_body = await read_request_body(request)
+            logger.debug(msg=r"request body successfully parsed")
+            logger.info(r"board stamp: %s", BoardStamp(request_body["board"]))
 
             (
                 total_collisions,
                 zone_collisions,
                 row_collisions,
                 column_collisions,
-            ) = calculate_board_fitness_report(
-                zone_height=request_body["zoneHeight"],
-                zone_length=request_body["zoneLength"],
-                board=request_body["board"],
-            )
+            ) = (
+                await get_fitness_reports(
+                    zone_height=request_body["zoneHeight"],
+                    zone_length=request_body["zoneLength"],
+                    compute=compute_fitness_reports,
+                    boards=[request_body["board"]],
+                )
+            )[0]
 
             response_dict = {
                 "columnCollisions": column_collisions,
@@ -182,13 +336,12 @@ async def get_board_fitness_report(request: Request) -> web.Response:
                 "rowCollisions": row_collisions,
             }
 
-            headers = {"Content-Type": "application/json"}
-
             logger.debug(msg=r"request body successfully processed, sending response to the solver")
-            return web.Response(
-                body=dumps(obj=response_dict, indent=None),
-                headers=headers,
-                status=HTTPStatus.OK,
+            return build_response(
+                zone_height=request_body["zoneHeight"],
+                zone_length=request_body["zoneLength"],
+                response_dict=response_dict,
+                request=request,
             )
 
         else:
@@ -205,6 +358,71 @@ async def get_board_fitness_report(request: Request) -> web.Response:
         )
 
 
+@api_routes.post(r"/calculate_board_fitness_batch")
+async def get_board_fitness_batch(request: Request) -> web.Response:
+
+    """Get Board Fitness Batch
+
+    This function calculates the count of all the collisions of every board in a list of boards and packages the scores in a json
+    file on the response body, the scores keep the order of the boards in the request.
+
+    Args:
+        request (Request): An http request made from any solver for accessing this functionality.
+
+    Returns:
+        web.Response: The response of the api, 400 for unauthorized requests, 500 if the api fails or 200 with the response in a
+        json body if everything goes right.
+    """
+
+    try:
+
+        logger.debug(
+            msg=r"new request recived at: /calculate_board_fitness_batch path"
+        )
+
+        continue_process = await check_request_mandatory_requirements(request)
+
+        if continue_process is True:
+
+            logger.debug(msg=r"parsing request body")
+            request_body = await read_request_body(request)
+            logger.debug(msg=r"request body successfully parsed")
+            logger.info(msg=f'boards in batch: {len(request_body["boards"])}')
+
+            fitness_reports = await get_fitness_reports(
+                zone_height=request_body["zoneHeight"],
+                zone_length=request_body["zoneLength"],
+                compute=compute_fitness_reports,
+                boards=request_body["boards"],
+            )
+            fitness_scores = [fitness_report[0] for fitness_report in fitness_reports]
+
+            response_dict = {
+                "fitnessScores": fitness_scores,
+            }
+
+            logger.debug(msg=r"request body successfully processed, sending response to the solver")
+            return build_response(
+                zone_height=request_body["zoneHeight"],
+                zone_length=request_body["zoneLength"],
+                response_dict=response_dict,
+                request=request,
+            )
+
+        else:
+            return web.Response(
+                status=HTTPStatus.BAD_REQUEST,
+            )
+
+    except:
+
+        logger.exception(msg=r"exception in the calculate_board_fitness_batch api")
+
+        return web.Response(
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+
 @api_routes.post(r"/board_random_initialization")
 async def get_random_initialization(request: Request) -> web.Response:
 
@@ -228,30 +446,40 @@ async def get_random_initialization(request: Request) -> web.Response:
 
         if continue_process is True:
 
-            logger.debug(msg=r"parsing request body to json")
-            request_body = await request.json()
-            logger.debug(msg=r"request body successfully parsed to json")
-            logger.info(
-                msg=f'fixed board stamp: {get_board_stamp(request_body["fixedNumbersBoard"])}'
-            )
-
-            board = board_random_initialization(
-                fixed_numbers_board=request_body["fixedNumbersBoard"],
-                zone_height=request_body["zoneHeight"],
-                zone_length=request_body["zoneLength"],
+            logger.debug(msg=r"parsing request body")
+            request_body = await read_request_body(request)
+            logger.debug(msg=r"request body successfully parsed")
+
+            puzzle = read_request_puzzle(request_body=request_body)
+
+            if puzzle is None:
+                logger.error(msg=r"the puzzle session doesn't exists")
+                return web.Response(
+                    reason=r"the puzzle session doesn't exists",
+                    status=HTTPStatus.NOT_FOUND,
+                )
+
+            board = await run_compute(
+                board_random_initialization,
+                work_size=len(puzzle["fixedNumbersBoard"]) ** 2,
+                fixed_numbers_board=puzzle["fixedNumbersBoard"],
+                missing_numbers=puzzle["missingNumbers"],
+                zone_height=puzzle["zoneHeight"],
+                zone_length=puzzle["zoneLength"],
+                free_cells=puzzle["freeCells"],
+                candidates=puzzle["candidates"],
             )
 
             response_dict = {
                 "board": board,
             }
 
-            headers = {"Content-Type": "application/json"}
-
             logger.debug(msg=r"request body successfully processed, sending response to the solver")
-            return web.Response(
-                body=dumps(obj=response_dict, indent=None),
-                headers=headers,
-                status=HTTPStatus.OK,
+            return build_response(
+                zone_height=puzzle["zoneHeight"],
+                zone_length=puzzle["zoneLength"],
+                response_dict=response_dict,
+                request=request,
             )
 
         else:
@@ -291,30 +519,463 @@ async def get_random_mutation(request: Request) -> web.Response:
 
         if continue_process is True:
 
-            logger.debug(msg=r"parsing request body to json")
-            request_body = await request.json()
-            logger.debug(msg=r"request body successfully parsed to json")
-            logger.info(msg=f'board stamp: {get_board_stamp(request_body["board"])}')
-            logger.info(
-                msg=f'fixed board stamp: {get_board_stamp(request_body["fixedNumbersBoard"])}'
+            logger.debug(msg=r"parsing request body")
+            request_body = await read_request_body(request)
+            logger.debug(msg=r"request body successfully parsed")
+            logger.info(r"board stamp: %s", BoardStamp(request_body["board"]))
+
+            puzzle = read_request_puzzle(request_body=request_body)
+
+            if puzzle is None:
+                logger.error(msg=r"the puzzle session doesn't exists")
+                return web.Response(
+                    reason=r"the puzzle session doesn't exists",
+                    status=HTTPStatus.NOT_FOUND,
+                )
+
+            with measure_phase(r"compute"):
+                board = board_random_mutation(
+                    fixed_numbers_board=puzzle["fixedNumbersBoard"],
+                    free_cells=puzzle["freeCells"],
+                    candidates=puzzle["candidates"],
+                    board=request_body["board"],
+                )
+
+            response_dict = {
+                "board": board,
+            }
+
+            logger.debug(msg=r"request body successfully processed, sending response to the solver")
+            return build_response(
+                zone_height=puzzle["zoneHeight"],
+                zone_length=puzzle["zoneLength"],
+                response_dict=response_dict,
+                request=request,
             )
 
-            board = board_random_mutation(
-                fixed_numbers_board=request_body["fixedNumbersBoard"],
-                board=request_body["board"],
+        else:
+            return web.Response(
+                status=HTTPStatus.BAD_REQUEST,
             )
 
+    except:
+
+        logger.exception(msg=r"exception in the board_random_mutation api")
+
+        return web.Response(
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+
+@api_routes.post(r"/board_random_mutation_delta")
+async def get_random_mutation_delta(request: Request) -> web.Response:
+
+    """Get Random Mutation Delta
+
+    This function mutate the board, updates the fitness score of the board with the collisions that the mutation changes and
+    package the mutated board and its fitness score in the response body.
+
+    Args:
+        request (Request): An http request made from any solver for accessing this functionality.
+
+    Returns:
+        web.Response: The response of the api, 400 for unauthorized requests, 500 if the api fails or 200 with the response in a
+        json body if everything goes right.
+    """
+
+    try:
+
+        logger.debug(msg=r"new request recived at: /board_random_mutation_delta path")
+
+        continue_process = await check_request_mandatory_requirements(request)
+
+        if continue_process is True:
+
+            logger.debug(msg=r"parsing request body")
+            request_body = await read_request_body(request)
+            logger.debug(msg=r"request body successfully parsed")
+            logger.info(r"board stamp: %s", BoardStamp(request_body["board"]))
+
+            puzzle = read_request_puzzle(request_body=request_body)
+
+            if puzzle is None:
+                logger.error(msg=r"the puzzle session doesn't exists")
+                return web.Response(
+                    reason=r"the puzzle session doesn't exists",
+                    status=HTTPStatus.NOT_FOUND,
+                )
+
+            with measure_phase(r"compute"):
+                board, fitness_score = board_random_mutation_delta(
+                    fixed_numbers_board=puzzle["fixedNumbersBoard"],
+                    fitness_score=request_body["fitnessScore"],
+                    zone_height=puzzle["zoneHeight"],
+                    zone_length=puzzle["zoneLength"],
+                    free_cells=puzzle["freeCells"],
+                    candidates=puzzle["candidates"],
+                    board=request_body["board"],
+                )
+
             response_dict = {
+                "fitnessScore": fitness_score,
                 "board": board,
             }
 
-            headers = {"Content-Type": "application/json"}
+            logger.debug(msg=r"request body successfully processed, sending response to the solver")
+            return build_response(
+                zone_height=puzzle["zoneHeight"],
+                zone_length=puzzle["zoneLength"],
+                response_dict=response_dict,
+                request=request,
+            )
+
+        else:
+            return web.Response(
+                status=HTTPStatus.BAD_REQUEST,
+            )
+
+    except:
+
+        logger.exception(msg=r"exception in the board_random_mutation_delta api")
+
+        return web.Response(
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+
+@api_routes.post(r"/evolve_generation")
+async def get_evolved_generation(request: Request) -> web.Response:
+
+    """Get Evolved Generation
+
+    This function runs the mutation, crossover, ranking and selection of a full genetic algorithm generation and package the
+    boards and the fitness scores of the next generation in the response body.
+
+    Args:
+        request (Request): An http request made from any solver for accessing this functionality.
+
+    Returns:
+        web.Response: The response of the api, 400 for unauthorized requests, 500 if the api fails or 200 with the response in a
+        json body if everything goes right.
+    """
+
+    try:
+
+        logger.debug(msg=r"new request recived at: /evolve_generation path")
+
+        continue_process = await check_request_mandatory_requirements(request)
+
+        if continue_process is True:
+
+            logger.debug(msg=r"parsing request body")
+            request_body = await read_request_body(request)
+            logger.debug(msg=r"request body successfully parsed")
+            logger.info(msg=f'individuals in population: {len(request_body["boards"])}')
+
+            puzzle = read_request_puzzle(request_body=request_body)
+
+            if puzzle is None:
+                logger.error(msg=r"the puzzle session doesn't exists")
+                return web.Response(
+                    reason=r"the puzzle session doesn't exists",
+                    status=HTTPStatus.NOT_FOUND,
+                )
+
+            population = await run_compute(
+                evolve_generation,
+                work_size=sum(len(board) ** 2 for board in request_body["boards"]),
+                population=list(zip(request_body["fitnessScores"], request_body["boards"])),
+                population_size=request_body.get("populationSize", len(request_body["boards"])),
+                crossover_probability=request_body["crossover"],
+                mutation_probability=request_body["mutation"],
+                fixed_numbers_board=puzzle["fixedNumbersBoard"],
+                zone_height=puzzle["zoneHeight"],
+                zone_length=puzzle["zoneLength"],
+                free_cells=puzzle["freeCells"],
+                candidates=puzzle["candidates"],
+            )
+
+            response_dict = {
+                "fitnessScores": [individual[0] for individual in population],
+                "boards": [individual[1] for individual in population],
+            }
+
+            logger.debug(msg=r"request body successfully processed, sending response to the solver")
+            return build_response(
+                zone_height=puzzle["zoneHeight"],
+                zone_length=puzzle["zoneLength"],
+                response_dict=response_dict,
+                request=request,
+            )
+
+        else:
+            return web.Response(
+                status=HTTPStatus.BAD_REQUEST,
+            )
+
+    except:
+
+        logger.exception(msg=r"exception in the evolve_generation api")
+
+        return web.Response(
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+
+@api_routes.post(r"/create_puzzle_session")
+async def get_puzzle_session_id(request: Request) -> web.Response:
+
+    """Get Puzzle Session Id
+
+    This function registers the fixed numbers board and the zones measures of a puzzle in a new puzzle session and package the
+    session id in the response body, the solvers can use the session id instead of the fixed numbers board in the next requests.
+
+    Args:
+        request (Request): An http request made from any solver for accessing this functionality.
+
+    Returns:
+        web.Response: The response of the api, 400 for unauthorized requests, 500 if the api fails or 200 with the response in a
+        json body if everything goes right.
+    """
+
+    try:
+
+        logger.debug(msg=r"new request recived at: /create_puzzle_session path")
+
+        continue_process = await check_request_mandatory_requirements(request)
+
+        if continue_process is True:
+
+            logger.debug(msg=r"parsing request body")
+            request_body = await read_request_body(request)
+            logger.debug(msg=r"request body successfully parsed")
+            logger.info(r"fixed board stamp: %s", BoardStamp(request_body["fixedNumbersBoard"]))
+
+            session_id = create_puzzle_session(
+                fixed_numbers_board=request_body["fixedNumbersBoard"],
+                session_id=request_body.get("sessionId"),
+                zone_height=request_body["zoneHeight"],
+                zone_length=request_body["zoneLength"],
+            )
+
+            response_dict = {
+                "sessionId": session_id,
+            }
+
+            logger.debug(msg=r"request body successfully processed, sending response to the solver")
+            return build_response(
+                response_dict=response_dict,
+                request=request,
+            )
+
+        else:
+            return web.Response(
+                status=HTTPStatus.BAD_REQUEST,
+            )
+
+    except:
+
+        logger.exception(msg=r"exception in the create_puzzle_session api")
+
+        return web.Response(
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+
+@api_routes.post(r"/delete_puzzle_session")
+async def get_puzzle_session_deletion(request: Request) -> web.Response:
+
+    """Get Puzzle Session Deletion
+
+    This function removes a puzzle session and package in the response body if the session existed.
+
+    Args:
+        request (Request): An http request made from any solver for accessing this functionality.
+
+    Returns:
+        web.Response: The response of the api, 400 for unauthorized requests, 500 if the api fails or 200 with the response in a
+        json body if everything goes right.
+    """
+
+    try:
+
+        logger.debug(msg=r"new request recived at: /delete_puzzle_session path")
+
+        continue_process = await check_request_mandatory_requirements(request)
+
+        if continue_process is True:
+
+            logger.debug(msg=r"parsing request body")
+            request_body = await read_request_body(request)
+            logger.debug(msg=r"request body successfully parsed")
+
+            deleted = delete_puzzle_session(session_id=request_body["sessionId"])
+
+            response_dict = {
+                "deleted": deleted,
+            }
 
             logger.debug(msg=r"request body successfully processed, sending response to the solver")
+            return build_response(
+                response_dict=response_dict,
+                request=request,
+            )
+
+        else:
             return web.Response(
-                body=dumps(obj=response_dict, indent=None),
-                headers=headers,
-                status=HTTPStatus.OK,
+                status=HTTPStatus.BAD_REQUEST,
+            )
+
+    except:
+
+        logger.exception(msg=r"exception in the delete_puzzle_session api")
+
+        return web.Response(
+            status=HTTPStatus.INTERNAL_SERVER_ERROR,
+        )
+
+
+@api_routes.get(r"/health_test")
+async def health_test(_: Request) -> web.Response:
+
+    """Health Test
+
+    This function is incharge of response all the health check petitions that the middle proxy makes for checking if the exact
+    solver is active before making a solver request.
+
+    Returns:
+        web.Response: A 200 status code.
+    """
+
+    logger.debug(r"health test request received")
+
+    return web.Response(
+        reason=r"ok",
+        status=HTTPStatus.OK,
+    )
+
+
+describe_metric(r"fitness_cache_size", r"gauge", r"Fitness reports stored in the fitness cache.")
+describe_metric(r"puzzle_sessions", r"gauge", r"Puzzle sessions stored in the api.")
+
+
+@api_routes.get(r"/metrics")
+async def get_metrics(_: Request) -> web.Response:
+
+    """Get Metrics
+
+    This function exposes the api metrics using the prometheus text format, the fitness cache size and the puzzle sessions gauges
+    are updated from their current state before rendering them.
+
+    Returns:
+        web.Response: A 200 status code and the metrics exposition in the response body.
+    """
+
+    set_gauge(r"fitness_cache_size", len(fitness_cache))
+    set_gauge(r"puzzle_sessions", len(puzzle_sessions))
+
+    return web.Response(
+        body=render_metrics(),
+        headers={"Content-Type": METRICS_CONTENT_TYPE},
+        status=HTTPStatus.OK,
+    )
+
+
+@api_routes.post(r"/exact_solver")
+async def get_exact_solution(request: Request) -> web.Response:
+
+    """Get Exact Solution
+
+    This function solves a board using the exact backtracking solver and packages the solution in a json file on the response body
+    using the same request and response schema of the genetic algorithm solver, the search explores at most the node limit given
+    in the request body or defined by an environment variable.
+
+    Args:
+        request (Request): An http request made from the middle proxy for accessing this functionality.
+
+    Returns:
+        web.Response: The response of the api, 400 for unauthorized requests, 422 if the board doesn't have solution or the node
+        limit is reached, 500 if the api fails or 200 with the response in a json body if everything goes right.
+    """
+
+    try:
+
+        logger.debug(
+            msg=r"new request recived at: /exact_solver path"
+        )
+
+        # The exact solver is called by the middle proxies, so it uses its own key instead of the solver functions key.
+
+        continue_process = await check_request_mandatory_requirements(
+            request, access_key_variable=r"EXACT_SOLVER_KEY"
+        )
+
+        if continue_process is True:
+
+            logger.debug(msg=r"parsing request body")
+            request_body = await read_request_body(request)
+            logger.debug(msg=r"request body successfully parsed")
+            logger.info(r"board stamp: %s", BoardStamp(request_body["initial_board"]))
+
+            node_limit = int(environ.get("EXACT_SOLVER_NODE_LIMIT", "200000"))
+
+            if type(request_body.get("nodeLimit")) is int and request_body["nodeLimit"] > 0:
+                logger.info(msg=r"node limit value valid, establishing node limit value")
+                node_limit = request_body["nodeLimit"]
+
+            # The node limit is the upper bound of the search work, so long searches are sent to the compute executor.
+
+            solution_board, search_result, explored_nodes = await run_compute(
+                solve_board_exactly,
+                work_size=node_limit,
+                fixed_numbers_board=request_body["initial_board"],
+                zone_height=request_body["zone_height"],
+                zone_length=request_body["zone_length"],
+                node_limit=node_limit,
+            )
+
+            logger.info(msg=f"exact search result: {search_result}, explored nodes: {explored_nodes}")
+
+            if search_result == "unsolvable":
+                return web.Response(
+                    reason=r"the board doesn't have solution",
+                    status=HTTPStatus.UNPROCESSABLE_ENTITY,
+                )
+
+            if search_result == "node_limit":
+                return web.Response(
+                    reason=r"the node limit was reached before finding a solution",
+                    status=HTTPStatus.UNPROCESSABLE_ENTITY,
+                )
+
+            (
+                total_collisions,
+                zone_collisions,
+                row_collisions,
+                column_collisions,
+            ) = (
+                await get_fitness_reports(
+                    zone_height=request_body["zone_height"],
+                    zone_length=request_body["zone_length"],
+                    compute=compute_fitness_reports,
+                    boards=[solution_board],
+                )
+            )[0]
+
+            response_dict = {
+                "totalCollisions": total_collisions,
+                "columnCollisions": column_collisions,
+                "rowCollisions": row_collisions,
+                "zoneCollisions": zone_collisions,
+                "solutionBoard": solution_board,
+                "stopReason": search_result,
+                "exploredNodes": explored_nodes,
+            }
+
+            logger.debug(msg=r"request body successfully processed, sending response to the middle proxy")
+            return build_response(
+                response_dict=response_dict,
+                request=request,
             )
 
         else:
@@ -324,12 +985,14 @@ async def get_random_mutation(request: Request) -> web.Response:
 
     except:
 
-        logger.exception(msg=r"exception in the board_random_mutation api")
+        logger.exception(msg=r"exception in the exact_solver api")
 
         return web.Response(
             status=HTTPStatus.INTERNAL_SERVER_ERROR,
         )
 
 
+api.on_startup.append(open_compute_executor)
+api.on_cleanup.append(close_compute_executor)
 api.add_routes(api_routes)
 web.run_app(app=api, port=int(environ["ACCESS_PORT"]))
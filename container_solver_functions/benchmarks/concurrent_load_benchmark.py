@@ -0,0 +1,124 @@
+from aiohttp import ClientSession
+from argparse import ArgumentParser
+from random import randint
+from json import dumps
+import asyncio
+import time
+
+
+def build_random_boards(boards: int, zone_height: int, zone_length: int) -> list:
+
+    """Build Random Boards
+
+    This function builds full filled boards with random numbers in the board range.
+
+    Args:
+        boards (int): The number of boards.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: The random boards.
+    """
+
+    board_size = zone_height * zone_length
+
+    return [
+        [[randint(1, board_size) for _ in range(board_size)] for _ in range(board_size)]
+        for _ in range(boards)
+    ]
+
+
+async def run_benchmark(
+    url: str,
+    key: str,
+    requests: int,
+    concurrency: int,
+    boards: int,
+    zone_height: int,
+    zone_length: int,
+) -> dict:
+
+    """Run Benchmark
+
+    This function sends batch fitness requests to a running solver functions api keeping a fixed number of requests in flight and
+    measures the throughput and the latency of the api under that concurrent load.
+
+    Args:
+        url (str): The batch fitness path url of the api.
+        key (str): The solver functions access key.
+        requests (int): The total number of requests.
+        concurrency (int): The number of requests in flight.
+        boards (int): The number of boards in each request.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        dict: The benchmark results.
+    """
+
+    body = {
+        "boards": build_random_boards(boards, zone_height, zone_length),
+        "zoneHeight": zone_height,
+        "zoneLength": zone_length,
+    }
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = list()
+    failures = 0
+
+    async def make_request(session: ClientSession) -> None:
+        nonlocal failures
+        async with semaphore:
+            start_time = time.perf_counter()
+            async with session.post(url=url, json=body) as response:
+                await response.read()
+                if response.status != 200:
+                    failures += 1
+            latencies.append(time.perf_counter() - start_time)
+
+    async with ClientSession(headers={"Authorization": key}) as session:
+        start_time = time.perf_counter()
+        await asyncio.gather(*[make_request(session) for _ in range(requests)])
+        elapsed_time = time.perf_counter() - start_time
+
+    latencies.sort()
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "boardsPerRequest": boards,
+        "boardSize": zone_height * zone_length,
+        "failures": failures,
+        "elapsedSeconds": round(elapsed_time, 4),
+        "requestsPerSecond": round(requests / elapsed_time, 2),
+        "boardsPerSecond": round(requests * boards / elapsed_time, 2),
+        "p50LatencyMs": round(1000 * latencies[len(latencies) // 2], 2),
+        "p95LatencyMs": round(1000 * latencies[int(0.95 * (len(latencies) - 1))], 2),
+    }
+
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser(description="solver functions api concurrent load benchmark")
+    parser.add_argument("--url", default="http://localhost:3000/calculate_board_fitness_batch")
+    parser.add_argument("--key", required=True)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--boards", type=int, default=200)
+    parser.add_argument("--zone-height", type=int, default=3)
+    parser.add_argument("--zone-length", type=int, default=3)
+    arguments = parser.parse_args()
+
+    results = asyncio.run(
+        run_benchmark(
+            url=arguments.url,
+            key=arguments.key,
+            requests=arguments.requests,
+            concurrency=arguments.concurrency,
+            boards=arguments.boards,
+            zone_height=arguments.zone_height,
+            zone_length=arguments.zone_length,
+        )
+    )
+
+    print(dumps(results))
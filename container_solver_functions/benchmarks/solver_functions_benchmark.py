@@ -0,0 +1,388 @@
+from argparse import ArgumentParser
+from json import dumps
+import logging
+import random
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import general_solvers_functions as solvers_functions
+
+BOARD_ZONES = {4: (2, 2), 6: (2, 3), 9: (3, 3), 12: (3, 4), 16: (4, 4), 20: (4, 5), 25: (5, 5)}
+
+
+def build_solved_board(zone_height: int, zone_length: int) -> list:
+
+    """Build Solved Board
+
+    This function builds a solved board from the shifted rows pattern with the numbers randomly relabeled.
+
+    Args:
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: A full filled board without collisions.
+    """
+
+    board_size = zone_height * zone_length
+    numbers = random.sample(range(1, board_size + 1), board_size)
+
+    return [
+        [numbers[(zone_length * (row % zone_height) + row // zone_height + column) % board_size] for column in range(board_size)]
+        for row in range(board_size)
+    ]
+
+
+def build_fixed_numbers_board(solved_board: list, fill_ratio: float) -> list:
+
+    """Build Fixed Numbers Board
+
+    This function keeps a random fraction of the cells of a solved board and empties the others.
+
+    Args:
+        solved_board (list): A full filled board without collisions.
+        fill_ratio (float): The fraction of kept cells.
+
+    Returns:
+        list: A board representation that includes just the fixed numbers.
+    """
+
+    return [[number if random.random() < fill_ratio else 0 for number in row] for row in solved_board]
+
+
+def build_random_boards(boards: int, board_size: int) -> list:
+
+    """Build Random Boards
+
+    This function builds full filled boards where every row is a random permutation of the board numbers, like the boards of a
+    genetic algorithm population.
+
+    Args:
+        boards (int): The number of boards.
+        board_size (int): The board size.
+
+    Returns:
+        list: The random boards.
+    """
+
+    return [
+        [random.sample(range(1, board_size + 1), board_size) for _ in range(board_size)] for _ in range(boards)
+    ]
+
+
+def measure(function, arguments: list, min_time: float) -> float:
+
+    """Measure
+
+    This function calls a function with every one of the given arguments repeatedly until the minimum time is reached and returns
+    the mean time of a call in microseconds.
+
+    Args:
+        function (Callable): The measured function.
+        arguments (list): The keyword arguments of every call.
+        min_time (float): The minimum measuring time in seconds.
+
+    Returns:
+        float: The mean time of a call in microseconds.
+    """
+
+    calls, start_time = 0, time.perf_counter()
+
+    while True:
+        for function_arguments in arguments:
+            function(**function_arguments)
+        calls += len(arguments)
+        elapsed_time = time.perf_counter() - start_time
+        if elapsed_time >= min_time:
+            return 1e6 * elapsed_time / calls
+
+
+def is_valid_filled_board(board: list, fixed_numbers_board: list) -> bool:
+
+    """Is Valid Filled Board
+
+    This function checks the invariants that every filled board of the solver functions keeps, the fixed numbers are in their
+    positions and every row has all the board numbers once.
+
+    Args:
+        board (list): A full filled board representation.
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+
+    Returns:
+        bool: Indicates if the board keeps the invariants.
+    """
+
+    board_numbers = list(range(1, len(board) + 1))
+
+    return all(
+        sorted(row) == board_numbers
+        and all(fixed_number in (0, number) for number, fixed_number in zip(row, fixed_row))
+        for row, fixed_row in zip(board, fixed_numbers_board)
+    )
+
+
+def benchmark_fitness(board_size: int, arguments) -> list:
+
+    """Benchmark Fitness
+
+    This function benchmarks the reference, bitmask and vectorized fitness implementations, the single score and the report of a
+    board are measured per board and the vectorized engine is measured per board of a population batch, every implementation is
+    checked against the reference results.
+
+    Args:
+        board_size (int): The board size.
+        arguments (Namespace): The benchmark arguments.
+
+    Returns:
+        list: The results of every implementation.
+    """
+
+    zone_height, zone_length = BOARD_ZONES[board_size]
+    zones = {"zone_height": zone_height, "zone_length": zone_length}
+    boards = build_random_boards(arguments.batch, board_size) + [build_solved_board(zone_height, zone_length)]
+    boards_arguments = [{"board": board, **zones} for board in boards]
+
+    reference_scores = [solvers_functions.calculate_board_fitness_single(**board_arguments) for board_arguments in boards_arguments]
+    reference_reports = [
+        tuple(solvers_functions.calculate_board_fitness_report(**board_arguments)) for board_arguments in boards_arguments
+    ]
+
+    implementations = [
+        ("calculate_board_fitness_single", "reference", solvers_functions.calculate_board_fitness_single, reference_scores),
+        ("calculate_board_fitness_single", "bitmask", solvers_functions.calculate_board_fitness_single_bitmask, reference_scores),
+        ("calculate_board_fitness_report", "reference", solvers_functions.calculate_board_fitness_report, reference_reports),
+        ("calculate_board_fitness_report", "bitmask", solvers_functions.calculate_board_fitness_report_bitmask, reference_reports),
+    ]
+
+    results, reference_times = list(), dict()
+
+    for function_name, implementation, function, expected_results in implementations:
+        correct = [
+            tuple(result) if type(expected_results[0]) is tuple else result
+            for result in (function(**board_arguments) for board_arguments in boards_arguments)
+        ] == expected_results
+        microseconds = measure(function=function, arguments=boards_arguments, min_time=arguments.min_time)
+        reference_times.setdefault(function_name, microseconds)
+        results.append(
+            {
+                "function": function_name,
+                "implementation": implementation,
+                "boardSize": board_size,
+                "usPerBoard": round(microseconds, 3),
+                "speedup": round(reference_times[function_name] / microseconds, 2),
+                "correct": correct,
+            }
+        )
+
+    if solvers_functions.numpy is not None:
+
+        batch_arguments = [{"boards": boards, **zones}]
+        correct = [
+            tuple(report) for report in solvers_functions.calculate_board_fitness_report_batch(**batch_arguments[0])
+        ] == reference_reports and solvers_functions.calculate_board_fitness_batch(**batch_arguments[0]) == reference_scores
+
+        for function_name, function in (
+            ("calculate_board_fitness_single", solvers_functions.calculate_board_fitness_batch),
+            ("calculate_board_fitness_report", solvers_functions.calculate_board_fitness_report_batch),
+        ):
+            microseconds = measure(function=function, arguments=batch_arguments, min_time=arguments.min_time) / len(boards)
+            results.append(
+                {
+                    "function": function_name,
+                    "implementation": "vectorized",
+                    "boardSize": board_size,
+                    "usPerBoard": round(microseconds, 3),
+                    "speedup": round(reference_times[function_name] / microseconds, 2),
+                    "correct": correct,
+                }
+            )
+
+    return results
+
+
+def benchmark_initialization(board_size: int, fill_ratio: float, arguments) -> list:
+
+    """Benchmark Initialization
+
+    This function benchmarks the board random initialization from the fixed numbers board alone, with the free cells and missing
+    numbers of the rows and also with the candidates of the cells, every initialized board is checked with the filled board
+    invariants.
+
+    Args:
+        board_size (int): The board size.
+        fill_ratio (float): The fraction of fixed cells.
+        arguments (Namespace): The benchmark arguments.
+
+    Returns:
+        list: The results of every implementation.
+    """
+
+    zone_height, zone_length = BOARD_ZONES[board_size]
+    zones = {"zone_height": zone_height, "zone_length": zone_length}
+    fixed_numbers_board = build_fixed_numbers_board(build_solved_board(zone_height, zone_length), fill_ratio)
+
+    puzzle = {
+        "free_cells": solvers_functions.calculate_board_free_cells(fixed_numbers_board=fixed_numbers_board),
+        "missing_numbers": solvers_functions.calculate_board_missing_numbers(
+            fixed_numbers_board=fixed_numbers_board, **zones
+        ),
+        "candidates": solvers_functions.calculate_board_candidates(fixed_numbers_board=fixed_numbers_board, **zones),
+    }
+
+    implementations = [
+        ("reference", {}),
+        ("free_cells", {"free_cells": puzzle["free_cells"], "missing_numbers": puzzle["missing_numbers"]}),
+        ("candidates", puzzle),
+    ]
+
+    results, reference_time = list(), None
+
+    for implementation, puzzle_arguments in implementations:
+        function_arguments = [{"fixed_numbers_board": fixed_numbers_board, **zones, **puzzle_arguments}]
+        correct = all(
+            is_valid_filled_board(
+                board=solvers_functions.board_random_initialization(**function_arguments[0]),
+                fixed_numbers_board=fixed_numbers_board,
+            )
+            for _ in range(arguments.checks)
+        )
+        microseconds = measure(
+            function=solvers_functions.board_random_initialization,
+            arguments=function_arguments,
+            min_time=arguments.min_time,
+        )
+        reference_time = reference_time or microseconds
+        results.append(
+            {
+                "function": "board_random_initialization",
+                "implementation": implementation,
+                "boardSize": board_size,
+                "fillRatio": fill_ratio,
+                "usPerBoard": round(microseconds, 3),
+                "speedup": round(reference_time / microseconds, 2),
+                "correct": correct,
+            }
+        )
+
+    return results
+
+
+def benchmark_mutation(board_size: int, fill_ratio: float, arguments) -> list:
+
+    """Benchmark Mutation
+
+    This function benchmarks the board random mutation from the fixed numbers board alone, with the free cells of the rows, with
+    the candidates of the cells and the delta mutation that also updates the fitness score, the delta mutation is compared with
+    the mutation followed by the reference fitness of the full board, every mutated board is checked with the filled board
+    invariants and the delta scores are checked against the reference fitness.
+
+    Args:
+        board_size (int): The board size.
+        fill_ratio (float): The fraction of fixed cells.
+        arguments (Namespace): The benchmark arguments.
+
+    Returns:
+        list: The results of every implementation.
+    """
+
+    zone_height, zone_length = BOARD_ZONES[board_size]
+    zones = {"zone_height": zone_height, "zone_length": zone_length}
+    fixed_numbers_board = build_fixed_numbers_board(build_solved_board(zone_height, zone_length), fill_ratio)
+    free_cells = solvers_functions.calculate_board_free_cells(fixed_numbers_board=fixed_numbers_board)
+    candidates = solvers_functions.calculate_board_candidates(fixed_numbers_board=fixed_numbers_board, **zones)
+
+    boards = [
+        solvers_functions.board_random_initialization(fixed_numbers_board=fixed_numbers_board, **zones)
+        for _ in range(arguments.checks)
+    ]
+    fitness_scores = [solvers_functions.calculate_board_fitness_single(board=board, **zones) for board in boards]
+
+    def board_random_mutation_rescored(fitness_score: int, zone_height: int, zone_length: int, **mutation_arguments) -> tuple:
+        mutated_board = solvers_functions.board_random_mutation(**mutation_arguments)
+        return mutated_board, solvers_functions.calculate_board_fitness_single(
+            board=mutated_board, zone_height=zone_height, zone_length=zone_length
+        )
+
+    implementations = [
+        ("reference", solvers_functions.board_random_mutation, {}),
+        ("free_cells", solvers_functions.board_random_mutation, {"free_cells": free_cells}),
+        ("candidates", solvers_functions.board_random_mutation, {"free_cells": free_cells, "candidates": candidates}),
+        ("rescored", board_random_mutation_rescored, {"free_cells": free_cells, **zones}),
+        ("delta", solvers_functions.board_random_mutation_delta, {"free_cells": free_cells, **zones}),
+    ]
+
+    results, reference_time = list(), None
+
+    for implementation, function, puzzle_arguments in implementations:
+
+        function_arguments = [
+            {"board": board, "fixed_numbers_board": fixed_numbers_board, **puzzle_arguments} for board in boards
+        ]
+
+        if implementation in ("rescored", "delta"):
+            for board_arguments, fitness_score in zip(function_arguments, fitness_scores):
+                board_arguments["fitness_score"] = fitness_score
+
+        correct = True
+
+        for board_arguments in function_arguments:
+            mutated_board = function(**board_arguments)
+            if implementation in ("rescored", "delta"):
+                mutated_board, mutated_fitness_score = mutated_board
+                correct = correct and mutated_fitness_score == solvers_functions.calculate_board_fitness_single(
+                    board=mutated_board, **zones
+                )
+            correct = correct and is_valid_filled_board(board=mutated_board, fixed_numbers_board=fixed_numbers_board)
+
+        microseconds = measure(function=function, arguments=function_arguments, min_time=arguments.min_time)
+        reference_time = reference_time or microseconds
+        results.append(
+            {
+                "function": "board_random_mutation",
+                "implementation": implementation,
+                "boardSize": board_size,
+                "fillRatio": fill_ratio,
+                "usPerBoard": round(microseconds, 3),
+                "speedup": round(reference_time / microseconds, 2),
+                "correct": correct,
+            }
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser(description="general solver functions micro benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", choices=sorted(BOARD_ZONES), default=sorted(BOARD_ZONES))
+    parser.add_argument("--fill-ratios", type=float, nargs="+", default=[0.2, 0.4, 0.6])
+    parser.add_argument("--batch", type=int, default=200)
+    parser.add_argument("--checks", type=int, default=50)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--logs", action="store_true")
+    arguments = parser.parse_args()
+
+    random.seed(arguments.seed)
+
+    if arguments.logs is False:
+        logging.disable(logging.CRITICAL)
+
+    all_correct = True
+
+    for board_size in arguments.sizes:
+
+        results = benchmark_fitness(board_size=board_size, arguments=arguments)
+
+        for fill_ratio in arguments.fill_ratios:
+            results += benchmark_initialization(board_size=board_size, fill_ratio=fill_ratio, arguments=arguments)
+            results += benchmark_mutation(board_size=board_size, fill_ratio=fill_ratio, arguments=arguments)
+
+        for result in results:
+            all_correct = all_correct and result["correct"]
+            print(dumps(result), flush=True)
+
+    sys.exit(0 if all_correct else 1)
@@ -0,0 +1,121 @@
+from msgpack import unpackb
+from msgpack import packb
+from json import dumps
+from json import loads
+
+MSGPACK_CONTENT_TYPE = r"application/msgpack"
+JSON_CONTENT_TYPE = r"application/json"
+
+BOARD_KEYS = ("board", "fixedNumbersBoard", "solutionBoard")
+BOARDS_KEYS = ("boards",)
+
+
+def encode_board(board: list, zone_height: int = 0, zone_length: int = 0) -> bytes:
+
+    """Encode Board
+
+    This function packs a board in a flat byte array, the first three bytes are a header with the board size, the zones height and
+    the zones length, and the next bytes are the board numbers row by row, the zones measures are zero when they are unknown.
+
+    Args:
+        board (list): A board representation.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        bytes: The packed board.
+    """
+
+    header = bytes((len(board), zone_height, zone_length))
+
+    return header + bytes(number for row in board for number in row)
+
+
+def decode_board(packed_board: bytes) -> list:
+
+    """Decode Board
+
+    This function unpacks a board packed with the encode board function to its normal representation.
+
+    Args:
+        packed_board (bytes): The packed board.
+
+    Returns:
+        list: The board normal representation.
+    """
+
+    board_size = packed_board[0]
+    numbers = packed_board[3:]
+
+    return [
+        list(numbers[row_index : row_index + board_size])
+        for row_index in range(0, board_size * board_size, board_size)
+    ]
+
+
+def encode_body(
+    body: dict, content_type: str, zone_height: int = 0, zone_length: int = 0
+) -> bytes:
+
+    """Encode Body
+
+    This function serializes a request or response body using the given content type, for msgpack bodies every board is sent as a
+    packed board instead of a nested list, for any other content type the body is serialized as json.
+
+    Args:
+        body (dict): The body to serialize.
+        content_type (str): The content type of the serialized body.
+        zone_height (int): The zones height of the boards in the body.
+        zone_length (int): The zones length of the boards in the body.
+
+    Returns:
+        bytes: The serialized body.
+    """
+
+    if content_type != MSGPACK_CONTENT_TYPE:
+        return dumps(obj=body, indent=None).encode()
+
+    packed_body = dict(body)
+
+    for key in BOARD_KEYS:
+        if key in packed_body:
+            packed_body[key] = encode_board(packed_body[key], zone_height, zone_length)
+
+    for key in BOARDS_KEYS:
+        if key in packed_body:
+            packed_body[key] = [
+                encode_board(board, zone_height, zone_length) for board in packed_body[key]
+            ]
+
+    return packb(packed_body, use_bin_type=True)
+
+
+def decode_body(raw_body: bytes, content_type: str) -> dict:
+
+    """Decode Body
+
+    This function deserializes a request or response body using its content type, the packed boards of the msgpack bodies are
+    unpacked to their normal representation, for any other content type the body is deserialized as json.
+
+    Args:
+        raw_body (bytes): The serialized body.
+        content_type (str): The content type of the serialized body.
+
+    Returns:
+        dict: The deserialized body.
+    """
+
+    if content_type != MSGPACK_CONTENT_TYPE:
+        return loads(raw_body)
+
+    body = unpackb(raw_body, raw=False)
+
+    for key in BOARD_KEYS:
+        if key in body:
+            body[key] = decode_board(body[key])
+
+    for key in BOARDS_KEYS:
+        if key in body:
+            body[key] = [decode_board(board) for board in body[key]]
+
+    return body
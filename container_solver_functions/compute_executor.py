@@ -0,0 +1,119 @@
+from request_timings import merge_request_timings
+from request_timings import get_request_timings
+from request_timings import run_timed_function
+from request_timings import measure_phase
+
+from logger import setup_logger
+
+from concurrent.futures import ProcessPoolExecutor
+from asyncio import get_event_loop
+from multiprocessing import get_context
+from functools import partial
+from aiohttp import web
+from os import environ
+import os
+
+logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
+
+compute_executor = None
+
+
+def get_available_cores() -> int:
+
+    """Get Available Cores
+
+    This function returns the number of cores that the container can use, the process affinity is used when it's available
+    because it respects the cores assigned to the container.
+
+    Returns:
+        int: The number of available cores.
+    """
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+async def open_compute_executor(_: web.Application) -> None:
+
+    """Open Compute Executor
+
+    This function opens the process pool used for running the cpu bound general solver functions out of the event loop at the api
+    startup, the pool is opened just when the executor mode environment variable is process and its size is defined by an
+    environment variable or by the available cores of the container if the variable is not defined or it's empty.
+
+    Args:
+        _ (web.Application): The api that is starting.
+    """
+
+    global compute_executor
+
+    if str(environ.get("EXECUTOR_MODE", "inline")) == "process":
+
+        executor_workers = int(environ.get("EXECUTOR_WORKERS") or get_available_cores())
+
+        logger.debug(msg=f"opening compute executor with {executor_workers} processes")
+
+        # The fork context is used explicitly because the api server starts the api when it's imported.
+
+        compute_executor = ProcessPoolExecutor(
+            max_workers=executor_workers, mp_context=get_context("fork")
+        )
+
+
+async def close_compute_executor(_: web.Application) -> None:
+
+    """Close Compute Executor
+
+    This function closes the process pool at the api shutdown.
+
+    Args:
+        _ (web.Application): The api that is shutting down.
+    """
+
+    global compute_executor
+
+    if compute_executor is not None:
+        logger.debug(msg=r"closing compute executor")
+        compute_executor.shutdown(wait=True)
+        compute_executor = None
+
+
+async def run_compute(function, work_size: int, **kwargs):
+
+    """Run Compute
+
+    This function runs a general solver function in the process pool if the executor is open and the work size reaches the
+    executor threshold defined by an environment variable, in any other case the function runs inline on the event loop because
+    for small works sending the arguments to other process costs more than the work itself.
+
+    Args:
+        function (Callable): The general solver function.
+        work_size (int): The number of board positions that the function is going to process.
+        **kwargs: The general solver function arguments.
+
+    Returns:
+        Any: The general solver function result.
+    """
+
+    executor_threshold = int(environ.get("EXECUTOR_THRESHOLD", "2000"))
+
+    with measure_phase(r"compute"):
+
+        if compute_executor is None or work_size < executor_threshold:
+            return function(**kwargs)
+
+        if get_request_timings() is None:
+            return await get_event_loop().run_in_executor(
+                compute_executor, partial(function, **kwargs)
+            )
+
+        # The workers don't share the request timings, so they measure the function phases and send them with the result.
+
+        result, worker_timings = await get_event_loop().run_in_executor(
+            compute_executor, partial(run_timed_function, function, **kwargs)
+        )
+        merge_request_timings(timings=worker_timings)
+
+        return result
@@ -0,0 +1,136 @@
+from general_solvers_functions import build_board_units
+
+from logger import setup_logger
+
+import os
+
+logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
+
+
+class NodeLimitReached(Exception):
+
+    """Node Limit Reached
+
+    This exception is raised when the exact solver explores all the allowed nodes without finding a solution.
+    """
+
+
+def solve_board_exactly(
+    fixed_numbers_board: list, zone_height: int, zone_length: int, node_limit: int = None
+) -> tuple:
+
+    """Solve Board Exactly
+
+    This function solves a board using backtracking over bitmasks, the numbers used in every row, column and zone are kept as
+    bitmasks, so the candidates of a cell are the bits that are not used in any of its units, and on every step the free cell with
+    less candidates is filled first (minimum remaining values), so the dead ends are found as soon as possible, the search finds a
+    solution if there is one unless the node limit is reached before.
+
+    Args:
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+        node_limit (int): The maximum number of cells filled during the search, there is no limit if it's not given.
+
+    Returns:
+        list: The solved board or None if the board doesn't have solution or the node limit was reached.
+        str: The search result, solved, unsolvable or node_limit.
+        int: The number of cells filled during the search.
+    """
+
+    logger.debug(msg=r"calculating board exact solution")
+
+    board_size = len(fixed_numbers_board)
+    cells = [number for row in fixed_numbers_board for number in row]
+    full_mask = (1 << (board_size + 1)) - 2
+
+    # Every cell references the row, column and zone bitmasks that contain it.
+
+    units = build_board_units(board_size, zone_height, zone_length)
+    units_masks = [0] * sum(len(unit_group) for unit_group in units)
+    cells_units = [[0, 0, 0] for _ in cells]
+    unit_offset = 0
+
+    for unit_type, unit_group in enumerate(units):
+        for unit_index, unit in enumerate(unit_group):
+            for cell_index in unit:
+                cells_units[cell_index][unit_type] = unit_offset + unit_index
+        unit_offset += len(unit_group)
+
+    for cell_index, number in enumerate(cells):
+        if number != 0:
+            for unit_index in cells_units[cell_index]:
+                if units_masks[unit_index] >> number & 1:
+                    logger.debug(msg=r"fixed numbers repeated, the board doesn't have solution")
+                    return None, "unsolvable", 0
+                units_masks[unit_index] |= 1 << number
+
+    free_cells = [cell_index for cell_index, number in enumerate(cells) if number == 0]
+    explored_nodes = 0
+
+    def search(free_cells: list) -> bool:
+
+        nonlocal explored_nodes
+
+        if len(free_cells) == 0:
+            return True
+
+        # Selecting the free cell with the minimum remaining values.
+
+        best_position, best_candidates, best_count = 0, 0, board_size + 1
+
+        for position, cell_index in enumerate(free_cells):
+            row_unit, column_unit, zone_unit = cells_units[cell_index]
+            candidates = full_mask & ~(
+                units_masks[row_unit] | units_masks[column_unit] | units_masks[zone_unit]
+            )
+            count = bin(candidates).count("1")
+            if count < best_count:
+                best_position, best_candidates, best_count = position, candidates, count
+                if count <= 1:
+                    break
+
+        if best_count == 0:
+            return False
+
+        cell_index = free_cells[best_position]
+        remaining_cells = free_cells[:best_position] + free_cells[best_position + 1 :]
+        row_unit, column_unit, zone_unit = cells_units[cell_index]
+
+        while best_candidates:
+
+            number_bit = best_candidates & -best_candidates
+            best_candidates ^= number_bit
+
+            explored_nodes += 1
+            if node_limit is not None and explored_nodes > node_limit:
+                raise NodeLimitReached()
+
+            units_masks[row_unit] |= number_bit
+            units_masks[column_unit] |= number_bit
+            units_masks[zone_unit] |= number_bit
+
+            if search(remaining_cells):
+                cells[cell_index] = number_bit.bit_length() - 1
+                return True
+
+            units_masks[row_unit] ^= number_bit
+            units_masks[column_unit] ^= number_bit
+            units_masks[zone_unit] ^= number_bit
+
+        return False
+
+    try:
+        solved = search(free_cells)
+    except NodeLimitReached:
+        logger.debug(msg=f"node limit reached after {node_limit} nodes")
+        return None, "node_limit", node_limit
+
+    logger.debug(msg=f"board exact solution calculated, {explored_nodes} nodes explored")
+
+    if solved is False:
+        return None, "unsolvable", explored_nodes
+
+    solution_board = [cells[row_index : row_index + board_size] for row_index in range(0, len(cells), board_size)]
+
+    return solution_board, "solved", explored_nodes
@@ -0,0 +1,151 @@
+from board_codec import encode_board
+
+from metrics import increment_counter
+from metrics import describe_metric
+
+from logger import setup_logger
+
+from collections import OrderedDict
+from os import environ
+import os
+
+logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
+
+fitness_cache = OrderedDict()
+
+describe_metric(r"fitness_cache_hits_total", r"counter", r"Boards whose fitness report was found in the fitness cache.")
+describe_metric(r"fitness_cache_misses_total", r"counter", r"Boards whose fitness report was not found in the fitness cache.")
+
+increment_counter(r"fitness_cache_hits_total", 0)
+increment_counter(r"fitness_cache_misses_total", 0)
+
+
+def build_fitness_cache_key(board: list, zone_height: int, zone_length: int) -> bytes:
+
+    """Build Fitness Cache Key
+
+    This function builds the key of a board in the fitness cache, the key is the packed board with its zones measures in the
+    header, so it's an exact and compact representation of the board that is cheap to hash, the boards with numbers or zones
+    measures that don't fit in a byte can't be packed, so they don't have a key and they are scored without the cache.
+
+    Args:
+        board (list): A full filled board representation.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        bytes: The board key or None if the board can't be packed.
+    """
+
+    try:
+        return encode_board(board=board, zone_height=zone_height, zone_length=zone_length)
+    except (ValueError, TypeError):
+        return None
+
+
+def get_cached_fitness_reports(boards: list, zone_height: int, zone_length: int) -> tuple:
+
+    """Get Cached Fitness Reports
+
+    This function looks for the fitness reports of a list of boards in the fitness cache, the boards found are marked as the most
+    recently used and the hits and misses counters are incremented.
+
+    Args:
+        boards (list): A list of full filled board representations.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: The key of each board or None for the boards that can't be packed.
+        list: The cached fitness report of each board or None for the boards that are not in the cache.
+    """
+
+    keys = [
+        build_fitness_cache_key(board=board, zone_height=zone_height, zone_length=zone_length)
+        for board in boards
+    ]
+    fitness_reports = list()
+    hits = 0
+
+    for key in keys:
+        fitness_report = fitness_cache.get(key) if key is not None else None
+        if fitness_report is not None:
+            hits += 1
+            fitness_cache.move_to_end(key)
+        fitness_reports.append(fitness_report)
+
+    increment_counter(r"fitness_cache_hits_total", hits)
+    increment_counter(r"fitness_cache_misses_total", len(keys) - hits)
+
+    logger.debug(msg=f"fitness cache hits: {hits}, misses: {len(keys) - hits}, size: {len(fitness_cache)}")
+
+    return keys, fitness_reports
+
+
+def store_fitness_reports(keys: list, fitness_reports: list) -> None:
+
+    """Store Fitness Reports
+
+    This function saves fitness reports in the fitness cache and removes the least recently used reports if there are more reports
+    than the cache capacity defined by an environment variable, a zero capacity disables the cache.
+
+    Args:
+        keys (list): The key of each board, the boards without key are not saved.
+        fitness_reports (list): The fitness report of each board.
+    """
+
+    cache_capacity = int(environ.get("FITNESS_CACHE_CAPACITY", "100000"))
+
+    for key, fitness_report in zip(keys, fitness_reports):
+        if key is None:
+            continue
+        fitness_cache[key] = tuple(fitness_report)
+        fitness_cache.move_to_end(key)
+
+    while len(fitness_cache) > cache_capacity:
+        fitness_cache.popitem(last=False)
+
+
+async def get_fitness_reports(compute, boards: list, zone_height: int, zone_length: int) -> list:
+
+    """Get Fitness Reports
+
+    This function returns the fitness report of every board in a list of boards, the reports are taken from the fitness cache
+    when it's possible and just the missing boards are sent to the compute function, the new reports are saved in the cache.
+
+    Args:
+        compute (Callable): An async function that recives a list of boards and their zones measures and returns the boards
+        fitness reports in the same order.
+        boards (list): A list of full filled board representations.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: Total, zone, row and column collisions of each board.
+    """
+
+    keys, fitness_reports = get_cached_fitness_reports(
+        boards=boards, zone_height=zone_height, zone_length=zone_length
+    )
+
+    missing_indexes = [index for index, report in enumerate(fitness_reports) if report is None]
+
+    if len(missing_indexes) > 0:
+
+        # Scoring just the boards that are not in the cache.
+
+        missing_reports = await compute(
+            boards=[boards[index] for index in missing_indexes],
+            zone_height=zone_height,
+            zone_length=zone_length,
+        )
+
+        for index, fitness_report in zip(missing_indexes, missing_reports):
+            fitness_reports[index] = fitness_report
+
+        store_fitness_reports(
+            keys=[keys[index] for index in missing_indexes],
+            fitness_reports=missing_reports,
+        )
+
+    return fitness_reports
@@ -1,12 +1,67 @@
+from request_timings import measure_phase
+
 from logger import setup_logger
 
 from random import randrange
-from copy import deepcopy
+from random import uniform
+from random import shuffle
+from random import choice
+from random import sample
+from functools import lru_cache
+from operator import itemgetter
+from functools import reduce
+from operator import or_
+import itertools
+import heapq
 import os
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
 
+POPCOUNT_TABLE_BITS = 16
+POPCOUNT_TABLE_MASK = (1 << POPCOUNT_TABLE_BITS) - 1
+
+
+def freeze_board(board: list) -> tuple:
+
+    """Freeze Board
+
+    This function converts a board to its immutable representation, a tuple of rows where every row is a tuple, the immutable
+    boards share the rows that they have in common, so a changed row is replaced in a new board instead of being modified.
+
+    Args:
+        board (list): A board representation.
+
+    Returns:
+        tuple: The immutable board representation.
+    """
+
+    return tuple(tuple(row) for row in board)
+
+
+def replace_board_row(board: tuple, row_index: int, row: tuple) -> tuple:
+
+    """Replace Board Row
+
+    This function builds a new immutable board that shares all the rows of the given board except the replaced one, so changing a
+    row allocates just the new row and the tuple of rows instead of copying the full board.
+
+    Args:
+        board (tuple): A board representation.
+        row_index (int): The index of the replaced row.
+        row (tuple): The new row.
+
+    Returns:
+        tuple: The new immutable board representation.
+    """
+
+    return tuple(board[:row_index]) + (row,) + tuple(board[row_index + 1 :])
+
 
 def calculate_board_fitness_single(
     board: list, zone_height: int, zone_length: int
@@ -111,80 +166,1081 @@ def calculate_board_fitness_report(
     return total_collisions, zone_collisions, row_collisions, column_collisions
 
 
-def board_random_initialization(
+@lru_cache(maxsize=64)
+def build_board_units(board_size: int, zone_height: int, zone_length: int) -> tuple:
+
+    """Build Board Units
+
+    This function builds the flat board indexes of the cells of every unit (row, column or zone) of a board geometry, the indexes
+    are built once for every board size and zones measures and then they are taken from the cache.
+
+    Args:
+        board_size (int): The board size.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        tuple: The cells indexes of each row.
+        tuple: The cells indexes of each column.
+        tuple: The cells indexes of each zone.
+    """
+
+    rows = tuple(
+        tuple(range(row * board_size, (row + 1) * board_size)) for row in range(board_size)
+    )
+    columns = tuple(
+        tuple(range(column, board_size * board_size, board_size)) for column in range(board_size)
+    )
+    zones = tuple(
+        tuple(
+            (row + i) * board_size + column + j
+            for i in range(zone_height)
+            for j in range(zone_length)
+        )
+        for row in range(0, board_size, zone_height)
+        for column in range(0, board_size, zone_length)
+    )
+
+    return rows, columns, zones
+
+
+@lru_cache(maxsize=64)
+def build_board_geometry(board_size: int, zone_height: int, zone_length: int) -> tuple:
+
+    """Build Board Geometry
+
+    This function builds the index tables of a board geometry, every unit (row, column or zone) is an item getter that picks the
+    unit cells from the flat board, and the bits table maps every number from zero to the board size to its bit in a bitmask, the
+    tables are built once for every board size and zones measures and then they are taken from the cache.
+
+    Args:
+        board_size (int): The board size.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        tuple: The rows getters.
+        tuple: The columns getters.
+        tuple: The zones getters.
+        dict: The bit of each number.
+    """
+
+    logger.debug(msg=f"building board geometry of size {board_size}, {zone_height}x{zone_length} zones")
+
+    rows, columns, zones = [
+        tuple(itemgetter(*unit) for unit in units)
+        for units in build_board_units(board_size, zone_height, zone_length)
+    ]
+    bits = {number: 1 << number for number in range(board_size + 1)}
+
+    return rows, columns, zones, bits
+
+
+@lru_cache(maxsize=1)
+def build_popcount_table() -> tuple:
+
+    """Build Popcount Table
+
+    This function builds the table with the number of bits turned on in every integer of popcount table bits, the table is built
+    once and then it's taken from the cache.
+
+    Returns:
+        tuple: The number of bits turned on in each integer.
+    """
+
+    popcounts = [0] * (1 << POPCOUNT_TABLE_BITS)
+
+    for mask in range(1, 1 << POPCOUNT_TABLE_BITS):
+        popcounts[mask] = popcounts[mask >> 1] + (mask & 1)
+
+    return tuple(popcounts)
+
+
+def count_mask_bits(mask: int, popcounts: tuple) -> int:
+
+    """Count Mask Bits
+
+    This function counts the bits turned on in a bitmask wider than the popcount table, the bitmask is counted in chunks of popcount
+    table bits.
+
+    Args:
+        mask (int): The bitmask.
+        popcounts (tuple): The popcount table.
+
+    Returns:
+        int: The number of bits turned on in the bitmask.
+    """
+
+    bits = 0
+
+    while mask != 0:
+        bits += popcounts[mask & POPCOUNT_TABLE_MASK]
+        mask >>= POPCOUNT_TABLE_BITS
+
+    return bits
+
+
+def count_units_repetitions_bitmask(masks: list, units: tuple, unit_size: int) -> int:
+
+    """Count Units Repetitions Bitmask
+
+    This function counts the repeated numbers of the units of a board, the bits of the numbers of each unit are joined in a bitmask
+    and the distinct numbers of the unit are the bits turned on in the bitmask, counted with the popcount table.
+
+    Args:
+        masks (list): The bit of the number of every cell of the flat board.
+        units (tuple): The units getters.
+        unit_size (int): The number of cells of each unit.
+
+    Returns:
+        int: The summation of the repetitions of all the units.
+    """
+
+    popcounts = build_popcount_table()
+
+    # The bitmasks have a bit for every number from zero to the unit size, so the small boards need just one table lookup.
+
+    if unit_size < POPCOUNT_TABLE_BITS:
+        return unit_size * len(units) - sum([popcounts[reduce(or_, unit(masks))] for unit in units])
+
+    return unit_size * len(units) - sum([count_mask_bits(reduce(or_, unit(masks)), popcounts) for unit in units])
+
+
+def calculate_board_fitness_report_bitmask(
+    board: list, zone_height: int, zone_length: int
+) -> tuple:
+
+    """Calculate Board Fitness Report Bitmask
+
+    This function calculates the same report of the calculate board fitness report function using integer bitmasks and the cached
+    board geometry instead of building a set for every row, column and zone, the boards with numbers that don't have a bit, out of
+    the range from zero to the board size, are scored by the calculate board fitness report function.
+
+    Args:
+        board (list): A full filled board representation.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        int: Total collisions on the board.
+        int: Total collisions on the board zones.
+        int: Total collisions on the board rows.
+        int: Total collisions on the board columns.
+    """
+
+    rows, columns, zones, bits = build_board_geometry(len(board), zone_height, zone_length)
+    masks = list(map(bits.get, itertools.chain.from_iterable(board)))
+
+    if None in masks:
+        return tuple(
+            calculate_board_fitness_report(board=board, zone_height=zone_height, zone_length=zone_length)
+        )
+
+    row_collisions = count_units_repetitions_bitmask(masks=masks, units=rows, unit_size=len(board))
+    column_collisions = count_units_repetitions_bitmask(masks=masks, units=columns, unit_size=len(board))
+    zone_collisions = count_units_repetitions_bitmask(masks=masks, units=zones, unit_size=len(board))
+
+    total_collisions = zone_collisions + row_collisions + column_collisions
+
+    return total_collisions, zone_collisions, row_collisions, column_collisions
+
+
+def calculate_board_fitness_single_bitmask(
+    board: list, zone_height: int, zone_length: int
+) -> int:
+
+    """Calculate Board Fitness Single Bitmask
+
+    This function calculates the summation of all the collisions on a board using the bitmask kernel.
+
+    Args:
+        board (list): A full filled board representation.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        int: Total collisions on the board.
+    """
+
+    return calculate_board_fitness_report_bitmask(
+        board=board, zone_height=zone_height, zone_length=zone_length
+    )[0]
+
+
+def count_units_repetitions_vectorized(units: "numpy.ndarray") -> "numpy.ndarray":
+
+    """Count Units Repetitions Vectorized
+
+    This function counts the repeated numbers of every unit (row, column or zone) of every board in a population, the units of each
+    board are stored in the last axis of a (P, U, N) array, the numbers of each unit are sorted and the distinct numbers are the
+    positions where the sorted unit changes of value, so the repetitions are the unit size minus its distinct numbers.
+
+    Args:
+        units (numpy.ndarray): A (P, U, N) array with the N numbers of the U units of the P boards.
+
+    Returns:
+        numpy.ndarray: A (P,) array with the summation of the repetitions of all the units of each board.
+    """
+
+    sorted_units = numpy.sort(units, axis=2)
+    distinct_numbers = 1 + numpy.count_nonzero(numpy.diff(sorted_units, axis=2), axis=2)
+
+    return (units.shape[2] - distinct_numbers).sum(axis=1)
+
+
+def calculate_population_fitness_report_vectorized(
+    population: "numpy.ndarray", zone_height: int, zone_length: int
+) -> tuple:
+
+    """Calculate Population Fitness Report Vectorized
+
+    This function calculates all the collisions of every board of a population stored as a (P, N, N) integer array in one pass,
+    using array operations instead of building a set for every row, column and zone of every board, the results are the same of
+    the calculate board fitness report function applied to each board.
+
+    Args:
+        population (numpy.ndarray): A (P, N, N) array with P full filled board representations.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        numpy.ndarray: Total collisions on each board.
+        numpy.ndarray: Total collisions on the zones of each board.
+        numpy.ndarray: Total collisions on the rows of each board.
+        numpy.ndarray: Total collisions on the columns of each board.
+    """
+
+    boards, rows, columns = population.shape
+
+    zones = (
+        population.reshape(
+            boards, rows // zone_height, zone_height, columns // zone_length, zone_length
+        )
+        .transpose(0, 1, 3, 2, 4)
+        .reshape(boards, (rows // zone_height) * (columns // zone_length), zone_height * zone_length)
+    )
+
+    row_collisions = count_units_repetitions_vectorized(units=population)
+    column_collisions = count_units_repetitions_vectorized(units=population.transpose(0, 2, 1))
+    zone_collisions = count_units_repetitions_vectorized(units=zones)
+
+    total_collisions = zone_collisions + row_collisions + column_collisions
+
+    return total_collisions, zone_collisions, row_collisions, column_collisions
+
+
+def build_population_array(boards: list) -> "numpy.ndarray":
+
+    """Build Population Array
+
+    This function stores a list of boards in a (P, N, N) integer array for the vectorized engine, if numpy is not available, if there
+    is just one board or if the boards can't be stored exactly in an integer array, like the boards with decimal numbers or with
+    rows of different sizes, there is no array and the boards are scored with the bitmask kernel.
+
+    Args:
+        boards (list): A list of full filled board representations.
+
+    Returns:
+        numpy.ndarray: A (P, N, N) array with the boards or None if the boards are not scored with the vectorized engine.
+    """
+
+    if numpy is None or len(boards) < 2:
+        return None
+
+    try:
+        population = numpy.asarray(boards)
+    except (ValueError, OverflowError):
+        return None
+
+    if population.ndim != 3 or population.dtype.kind != "i":
+        return None
+
+    # The smaller integers are sorted faster, so the boards are stored as 32 bit integers when their numbers fit.
+
+    if numpy.iinfo(numpy.int32).min <= population.min() and population.max() <= numpy.iinfo(numpy.int32).max:
+        return population.astype(numpy.int32)
+
+    return population
+
+
+def calculate_board_fitness_batch(
+    boards: list, zone_height: int, zone_length: int
+) -> list:
+
+    """Calculate Board Fitness Batch
+
+    This function calculates the summation of all the collisions of every board in a list of boards that share the same zones
+    measures, the scores are returned in the same order of the given boards, if the boards can be stored in a population array all
+    the boards are scored at once with the vectorized engine, if not each board is scored with the bitmask kernel.
+
+    Args:
+        boards (list): A list of full filled board representations.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: Total collisions of each board.
+    """
+
+    logger.debug(msg=f"calculating board fitness batch scores of {len(boards)} boards")
+
+    population = build_population_array(boards=boards)
+
+    if len(boards) == 0:
+        fitness_scores = list()
+
+    elif population is not None:
+        fitness_scores = calculate_population_fitness_report_vectorized(
+            population=population,
+            zone_height=zone_height,
+            zone_length=zone_length,
+        )[0].tolist()
+
+    else:
+        fitness_scores = [
+            calculate_board_fitness_single_bitmask(
+                board=board, zone_height=zone_height, zone_length=zone_length
+            )
+            for board in boards
+        ]
+
+    logger.debug(msg=r"fitness batch scores calculated")
+
+    return fitness_scores
+
+
+def calculate_board_fitness_report_batch(
+    boards: list, zone_height: int, zone_length: int
+) -> list:
+
+    """Calculate Board Fitness Report Batch
+
+    This function calculates the fitness report of every board in a list of boards that share the same zones measures, the
+    reports are returned in the same order of the given boards, if the boards can be stored in a population array all the boards
+    are scored at once with the vectorized engine, if not each board is scored with the bitmask kernel.
+
+    Args:
+        boards (list): A list of full filled board representations.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: Total, zone, row and column collisions of each board.
+    """
+
+    logger.debug(msg=f"calculating board fitness batch reports of {len(boards)} boards")
+
+    population = build_population_array(boards=boards)
+
+    if len(boards) == 0:
+        fitness_reports = list()
+
+    elif population is not None:
+        fitness_reports = list(
+            zip(
+                *[
+                    collisions.tolist()
+                    for collisions in calculate_population_fitness_report_vectorized(
+                        population=population,
+                        zone_height=zone_height,
+                        zone_length=zone_length,
+                    )
+                ]
+            )
+        )
+
+    else:
+        fitness_reports = [
+            calculate_board_fitness_report_bitmask(
+                board=board, zone_height=zone_height, zone_length=zone_length
+            )
+            for board in boards
+        ]
+
+    logger.debug(msg=r"fitness batch reports calculated")
+
+    return fitness_reports
+
+
+def calculate_board_free_cells(fixed_numbers_board: list) -> list:
+
+    """Calculate Board Free Cells
+
+    This function calculates the index of the positions of every row that are not filled with a fixed number.
+
+    Args:
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+
+    Returns:
+        list: A list with the column indexes of the free positions of each row.
+    """
+
+    return [
+        [column_index for column_index, number in enumerate(row) if number == 0]
+        for row in fixed_numbers_board
+    ]
+
+
+def calculate_board_missing_numbers(
     fixed_numbers_board: list, zone_height: int, zone_length: int
 ) -> list:
 
+    """Calculate Board Missing Numbers
+
+    This function calculates the numbers of the board range that are not fixed in every row.
+
+    Args:
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: A list with the missing numbers of each row.
+    """
+
+    return [
+        [number for number in range(1, (zone_height * zone_length) + 1) if number not in row]
+        for row in fixed_numbers_board
+    ]
+
+
+def calculate_candidates_masks(board: list, zone_height: int, zone_length: int) -> list:
+
+    """Calculate Candidates Masks
+
+    This function calculates the candidates of every free cell of a board as a bitmask with the bits of the numbers that are not in
+    the row, column or zone of the cell.
+
+    Args:
+        board (list): A board representation where the free cells are filled with zeros.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: The candidates bitmask of every cell of the flat board, zero for the filled cells.
+    """
+
+    board_size = len(board)
+    cells = [number for row in board for number in row]
+    full_mask = (1 << (board_size + 1)) - 2
+    used_masks = [0] * len(cells)
+
+    for units in build_board_units(board_size, zone_height, zone_length):
+        for unit in units:
+            unit_mask = 0
+            for cell_index in unit:
+                unit_mask |= 1 << cells[cell_index]
+            for cell_index in unit:
+                used_masks[cell_index] |= unit_mask
+
+    return [
+        full_mask & ~used_masks[cell_index] if cells[cell_index] == 0 else 0
+        for cell_index in range(len(cells))
+    ]
+
+
+def calculate_board_candidates(
+    fixed_numbers_board: list, zone_height: int, zone_length: int
+) -> list:
+
+    """Calculate Board Candidates
+
+    This function calculates the legal candidates of every free cell of a board, the numbers that are not fixed in the row, column
+    or zone of the cell.
+
+    Args:
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        list: A list with the candidates of each cell of each row, the fixed cells have no candidates.
+    """
+
+    board_size = len(fixed_numbers_board)
+    candidates_masks = calculate_candidates_masks(
+        board=fixed_numbers_board, zone_height=zone_height, zone_length=zone_length
+    )
+
+    return [
+        [
+            [
+                number
+                for number in range(1, board_size + 1)
+                if candidates_masks[row_index * board_size + column_index] >> number & 1
+            ]
+            for column_index in range(board_size)
+        ]
+        for row_index in range(board_size)
+    ]
+
+
+def propagate_board_constraints(
+    fixed_numbers_board: list, zone_height: int, zone_length: int
+) -> tuple:
+
+    """Propagate Board Constraints
+
+    This function fills the free cells of a board that have just one legal number, the naked singles are the cells with just one
+    candidate and the hidden singles are the cells that are the only place of a unit (row, column or zone) where a number fits,
+    the singles are filled until there are no more, if a cell without candidates or a cell that is the single of two numbers is
+    found the board can't be solved and the propagation stops.
+
+    Args:
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        tuple: A new immutable board representation with the fixed numbers and the filled singles.
+    """
+
+    logger.debug(msg=r"calculating board constraints propagation")
+
+    board_size = len(fixed_numbers_board)
+    board = [list(row) for row in fixed_numbers_board]
+    units = [unit for units in build_board_units(board_size, zone_height, zone_length) for unit in units]
+    peers = [set() for _ in range(board_size * board_size)]
+    filled_cells = 0
+
+    for unit in units:
+        for cell_index in unit:
+            peers[cell_index].update(unit)
+
+    while True:
+
+        candidates_masks = calculate_candidates_masks(
+            board=board, zone_height=zone_height, zone_length=zone_length
+        )
+        singles = dict()
+
+        for cell_index, candidates_mask in enumerate(candidates_masks):
+
+            if candidates_mask == 0 and board[cell_index // board_size][cell_index % board_size] == 0:
+                logger.debug(msg=r"board without solution, constraints propagation stopped")
+                return freeze_board(board)
+
+            # Naked single, the cell has just one candidate.
+
+            if candidates_mask != 0 and candidates_mask & (candidates_mask - 1) == 0:
+                singles[cell_index] = candidates_mask.bit_length() - 1
+
+        for unit in units:
+            for number in range(1, board_size + 1):
+                places = [cell_index for cell_index in unit if candidates_masks[cell_index] >> number & 1]
+
+                # Hidden single, the number fits just in one cell of the unit, if the cell is already the single of other number
+                # two numbers need the same cell and the board can't be solved.
+
+                if len(places) == 1:
+                    if singles.setdefault(places[0], number) != number:
+                        logger.debug(msg=r"board without solution, constraints propagation stopped")
+                        return freeze_board(board)
+
+        if len(singles) == 0:
+            break
+
+        for cell_index, number in singles.items():
+
+            # Two singles of the same round can contradict each other if the board can't be solved.
+
+            if any(board[peer // board_size][peer % board_size] == number for peer in peers[cell_index]):
+                logger.debug(msg=r"board without solution, constraints propagation stopped")
+                return freeze_board(board)
+
+            board[cell_index // board_size][cell_index % board_size] = number
+
+        filled_cells += len(singles)
+
+    logger.debug(msg=f"board constraints propagation calculated, {filled_cells} cells filled")
+
+    return freeze_board(board)
+
+
+def board_random_initialization(
+    fixed_numbers_board: list,
+    zone_height: int,
+    zone_length: int,
+    free_cells: list = None,
+    missing_numbers: list = None,
+    candidates: list = None,
+) -> tuple:
+
     """Board Random Initialization
 
     This function initializes a board that is not full filled, it checks the number range of the rows, columns and zones based on
     the product of the zone measure for filling the white positions with numbers on the range that are not in the row, this
     function fill the board row by row, it does not care the columns, the function just check when filling that the numbers in the
-    rows are not repeated, in this way the collision of the board rows are zero since the board initialization.
+    rows are not repeated, in this way the collision of the board rows are zero since the board initialization, if the free cells
+    and the missing numbers of the rows are given the missing numbers of each row are shuffled into its free cells instead, and if
+    the candidates of the cells are also given every free cell takes a random legal missing number when there is one, starting by
+    the cells with less candidates.
 
     Args:
         fixed_numbers_board (list): A board representation that includes just the fixed numbers.
         zone_height (int): The zones height.
         zone_length (int): The zones length.
+        free_cells (list): The column indexes of the free positions of each row.
+        missing_numbers (list): The missing numbers of each row.
+        candidates (list): The candidates of each cell of each row.
 
     Returns:
-        list: A full filled board representation.
+        tuple: A full filled immutable board representation.
     """
 
     logger.debug(msg=r"calculating board random initialization")
 
-    filled_board = deepcopy(fixed_numbers_board)
+    filled_board = [list(row) for row in fixed_numbers_board]
+
+    if free_cells is not None and missing_numbers is not None and candidates is not None:
+
+        for row_index in range(len(filled_board)):
+            row_numbers = list(missing_numbers[row_index])
+            row_cells = list(free_cells[row_index])
+            shuffle(row_numbers)
+            shuffle(row_cells)
+            row_cells.sort(key=lambda column_index: len(candidates[row_index][column_index]))
+            for column_index in row_cells:
+                legal_numbers = [
+                    number for number in row_numbers if number in candidates[row_index][column_index]
+                ]
+                if len(legal_numbers) > 0:
+                    new_number = choice(legal_numbers)
+                else:
+                    new_number = row_numbers[0]
+                row_numbers.remove(new_number)
+                filled_board[row_index][column_index] = new_number
+
+    elif free_cells is not None and missing_numbers is not None:
 
-    for row_index in range(len(filled_board)):
-        for column_index in range(len(filled_board[row_index])):
-            if filled_board[row_index][column_index] == 0:
-                while True:
-                    new_number = randrange(1, (zone_height * zone_length) + 1)
-                    if new_number not in filled_board[row_index]:
-                        filled_board[row_index][column_index] = new_number
-                        break
+        for row_index in range(len(filled_board)):
+            row_numbers = list(missing_numbers[row_index])
+            shuffle(row_numbers)
+            for column_index, new_number in zip(free_cells[row_index], row_numbers):
+                filled_board[row_index][column_index] = new_number
+
+    else:
+
+        for row_index in range(len(filled_board)):
+            for column_index in range(len(filled_board[row_index])):
+                if filled_board[row_index][column_index] == 0:
+                    while True:
+                        new_number = randrange(1, (zone_height * zone_length) + 1)
+                        if new_number not in filled_board[row_index]:
+                            filled_board[row_index][column_index] = new_number
+                            break
 
     logger.debug(msg=r"board random initialization calculated")
 
-    return filled_board
+    return freeze_board(filled_board)
 
 
-def board_random_mutation(board: list, fixed_numbers_board: list) -> list:
+def select_random_mutation_positions(
+    board: list, fixed_numbers_board: list, free_cells: list = None, candidates: list = None
+) -> tuple:
 
-    """Board Random Mutation
+    """Select Random Mutation Positions
 
-    This function mutates a board representation, the mutation that makes this functions consist in select one random row first,
-    after select the row the function select two random positions of the selected row (columns) and exchange its positions, the
-    positions that the function select in the row have one restriction, the selected positions can not be filled with a fixed
-    number.
+    This function selects the positions that a mutation is going to exchange, first it selects one random row and after that it
+    selects two random positions of the selected row (columns), the selected positions can not be filled with a fixed number, if
+    the free cells of the rows are given the row is selected between the rows that have free positions and the positions are
+    selected directly from the row free cells, and if the candidates of the cells are also given the function tries to select two
+    positions whose numbers are legal candidates of the other position, so the mutation keeps the board inside the legal domains.
 
     Args:
         board (list): A full filled board representation.
         fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        free_cells (list): The column indexes of the free positions of each row.
+        candidates (list): The candidates of each cell of each row.
 
     Returns:
-        list: A full filled board representation with a mutation in one of its rows.
+        int: The selected row index.
+        int: The first selected column index.
+        int: The second selected column index.
     """
 
-    logger.debug(msg=r"calculating board random mutation")
+    if free_cells is not None:
+
+        mutable_rows = [row_index for row_index in range(len(board)) if free_cells[row_index]]
+
+        # A board without free positions can't be mutated, so the same position is exchanged with itself.
+
+        if len(mutable_rows) == 0:
+            return 0, 0, 0
+
+        exchangeable_rows = [row_index for row_index in mutable_rows if len(free_cells[row_index]) > 1]
+
+        if candidates is not None and len(exchangeable_rows) > 0:
+
+            # The legal exchanges are searched a limited number of times, if none is found the last selection is used.
+
+            for _ in range(len(board)):
+                row_index = choice(exchangeable_rows)
+                column_index_1, column_index_2 = sample(free_cells[row_index], 2)
+                if (
+                    board[row_index][column_index_2] in candidates[row_index][column_index_1]
+                    and board[row_index][column_index_1] in candidates[row_index][column_index_2]
+                ):
+                    break
+
+            return row_index, column_index_1, column_index_2
+
+        row_index = choice(mutable_rows)
+
+        return row_index, choice(free_cells[row_index]), choice(free_cells[row_index])
 
     row_index = randrange(len(board))
 
     while True:
         column_index_1 = randrange(len(board[row_index]))
         if fixed_numbers_board[row_index][column_index_1] == 0:
-            number_1 = deepcopy(board[row_index][column_index_1])
             break
 
     while True:
         column_index_2 = randrange(len(board[row_index]))
         if fixed_numbers_board[row_index][column_index_2] == 0:
-            number_2 = deepcopy(board[row_index][column_index_2])
             break
 
-    board[row_index][column_index_1] = number_2
-    board[row_index][column_index_2] = number_1
+    return row_index, column_index_1, column_index_2
+
+
+def calculate_column_collisions(board: list, column_index: int) -> int:
+
+    """Calculate Column Collisions
+
+    This function calculates the collisions of a single column of a board.
+
+    Args:
+        board (list): A full filled board representation.
+        column_index (int): The column index.
+
+    Returns:
+        int: Total collisions on the column.
+    """
+
+    column_set = set(board[row_index][column_index] for row_index in range(len(board)))
+
+    return abs(len(board) - len(column_set))
+
+
+def calculate_zone_collisions(
+    board: list, row_index: int, column_index: int, zone_height: int, zone_length: int
+) -> int:
+
+    """Calculate Zone Collisions
+
+    This function calculates the collisions of the zone that contains a given position of a board.
+
+    Args:
+        board (list): A full filled board representation.
+        row_index (int): The row index of a position inside the zone.
+        column_index (int): The column index of a position inside the zone.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        int: Total collisions on the zone.
+    """
+
+    zone_row = row_index - (row_index % zone_height)
+    zone_column = column_index - (column_index % zone_length)
+
+    zone_set = set()
+    for i in range(zone_height):
+        zone_set.update(board[zone_row + i][zone_column : zone_column + zone_length])
+
+    return abs((zone_length * zone_height) - len(zone_set))
+
+
+def calculate_mutation_collisions(
+    board: list,
+    row_index: int,
+    column_indexes: list,
+    zone_height: int,
+    zone_length: int,
+) -> int:
+
+    """Calculate Mutation Collisions
+
+    This function calculates the collisions of the columns and zones that a mutation in a single row can affect, every column and
+    every zone is counted just once even if more than one of the given positions are inside it.
+
+    Args:
+        board (list): A full filled board representation.
+        row_index (int): The index of the mutated row.
+        column_indexes (list): The indexes of the mutated positions in the row.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+
+    Returns:
+        int: Total collisions on the affected columns and zones.
+    """
+
+    affected_columns = set(column_indexes)
+    affected_zones = set(
+        column_index - (column_index % zone_length) for column_index in affected_columns
+    )
+
+    collisions = 0
+
+    for column_index in affected_columns:
+        collisions += calculate_column_collisions(board=board, column_index=column_index)
+
+    for column_index in affected_zones:
+        collisions += calculate_zone_collisions(
+            board=board,
+            row_index=row_index,
+            column_index=column_index,
+            zone_height=zone_height,
+            zone_length=zone_length,
+        )
+
+    return collisions
+
+
+def exchange_row_positions(row: tuple, column_index_1: int, column_index_2: int) -> tuple:
+
+    """Exchange Row Positions
+
+    This function builds a new row exchanging the numbers of two positions of the given row.
+
+    Args:
+        row (tuple): A board row.
+        column_index_1 (int): The first position.
+        column_index_2 (int): The second position.
+
+    Returns:
+        tuple: The new row.
+    """
+
+    row = list(row)
+    row[column_index_1], row[column_index_2] = row[column_index_2], row[column_index_1]
+
+    return tuple(row)
+
+
+def board_random_mutation(
+    board: list, fixed_numbers_board: list, free_cells: list = None, candidates: list = None
+) -> tuple:
+
+    """Board Random Mutation
+
+    This function mutates a board representation, the mutation that makes this functions consist in select one random row first,
+    after select the row the function select two random positions of the selected row (columns) and exchange its positions, the
+    positions that the function select in the row have one restriction, the selected positions can not be filled with a fixed
+    number, the given board is not modified, the mutated board shares all the rows with it except the mutated one.
+
+    Args:
+        board (list): A full filled board representation.
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        free_cells (list): The column indexes of the free positions of each row.
+        candidates (list): The candidates of each cell of each row.
+
+    Returns:
+        tuple: A full filled immutable board representation with a mutation in one of its rows.
+    """
+
+    logger.debug(msg=r"calculating board random mutation")
+
+    row_index, column_index_1, column_index_2 = select_random_mutation_positions(
+        fixed_numbers_board=fixed_numbers_board,
+        free_cells=free_cells,
+        candidates=candidates,
+        board=board,
+    )
+
+    board = replace_board_row(
+        board=board,
+        row_index=row_index,
+        row=exchange_row_positions(board[row_index], column_index_1, column_index_2),
+    )
 
     logger.debug(msg=r"board random mutation calculated")
 
     return board
+
+
+def board_random_mutation_delta(
+    board: list,
+    fixed_numbers_board: list,
+    fitness_score: int,
+    zone_height: int,
+    zone_length: int,
+    free_cells: list = None,
+    candidates: list = None,
+) -> tuple:
+
+    """Board Random Mutation Delta
+
+    This function mutates a board representation in the same way that the board random mutation does and calculates the fitness
+    score of the mutated board from the fitness score of the original board, since the mutation exchanges two positions of the
+    same row the row collisions doesn't change, so just the collisions of the two affected columns and their zones are calculated
+    before and after the exchange instead of scanning the full board again.
+
+    Args:
+        board (list): A full filled board representation.
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        fitness_score (int): Total collisions on the original board.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+        free_cells (list): The column indexes of the free positions of each row.
+        candidates (list): The candidates of each cell of each row.
+
+    Returns:
+        tuple: A full filled immutable board representation with a mutation in one of its rows.
+        int: Total collisions on the mutated board.
+    """
+
+    logger.debug(msg=r"calculating board random mutation delta")
+
+    row_index, column_index_1, column_index_2 = select_random_mutation_positions(
+        fixed_numbers_board=fixed_numbers_board,
+        free_cells=free_cells,
+        candidates=candidates,
+        board=board,
+    )
+
+    previous_collisions = calculate_mutation_collisions(
+        board=board,
+        row_index=row_index,
+        column_indexes=[column_index_1, column_index_2],
+        zone_height=zone_height,
+        zone_length=zone_length,
+    )
+
+    board = replace_board_row(
+        board=board,
+        row_index=row_index,
+        row=exchange_row_positions(board[row_index], column_index_1, column_index_2),
+    )
+
+    current_collisions = calculate_mutation_collisions(
+        board=board,
+        row_index=row_index,
+        column_indexes=[column_index_1, column_index_2],
+        zone_height=zone_height,
+        zone_length=zone_length,
+    )
+
+    fitness_score = fitness_score - previous_collisions + current_collisions
+
+    logger.debug(msg=r"board random mutation delta calculated")
+
+    return board, fitness_score
+
+
+def exchange_random_row(board_1: list, board_2: list) -> tuple:
+
+    """Exchange Random Row
+
+    This function makes the crossover between two boards, it picks a random row and exchanges it between the two given boards and
+    returns one of the two new boards, the given boards are not modified, the new board shares its rows with them.
+
+    Args:
+        board_1 (list): The first full filled board representation.
+        board_2 (list): The second full filled board representation.
+
+    Returns:
+        tuple: One of the immutable boards after making the rows exchange.
+    """
+
+    exchange_index = randrange(len(board_1))
+
+    board_1, board_2 = choice([(board_1, board_2), (board_2, board_1)])
+
+    return replace_board_row(board=board_1, row_index=exchange_index, row=tuple(board_2[exchange_index]))
+
+
+def evolve_generation(
+    population: list,
+    fixed_numbers_board: list,
+    zone_height: int,
+    zone_length: int,
+    mutation_probability: float,
+    crossover_probability: float,
+    population_size: int,
+    free_cells: list = None,
+    candidates: list = None,
+) -> list:
+
+    """Evolve Generation
+
+    This function evolves a full generation of a genetic algorithm population, each individual is mutated based on the mutation
+    probability and its score is updated from the original score, after that each individual is crossed based on the crossover
+    probability with an individual selected from the best half of the population and the crossed boards are ranked, finally just
+    the best individuals of the original, mutated and crossed individuals are kept sorted by their scores.
+
+    Args:
+        population (list): The current population as a list of tuples with the fitness score and the board of each individual.
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+        mutation_probability (float): The mutation probability of each individual.
+        crossover_probability (float): The crossover probability of each individual.
+        population_size (int): The number of individuals that are kept for the next generation.
+        free_cells (list): The column indexes of the free positions of each row.
+        candidates (list): The candidates of each cell of each row.
+
+    Returns:
+        list: The next generation as a list of tuples with the fitness score and the board of each individual.
+    """
+
+    logger.debug(msg=r"calculating generation evolution")
+
+    # Creating mutated population.
+
+    mutated_population = list()
+
+    with measure_phase(r"mutate"):
+        for fitness_score, board in population:
+            if uniform(0, 1) <= mutation_probability:
+                mutated_board, mutated_fitness_score = board_random_mutation_delta(
+                    fixed_numbers_board=fixed_numbers_board,
+                    fitness_score=fitness_score,
+                    zone_height=zone_height,
+                    zone_length=zone_length,
+                    free_cells=free_cells,
+                    candidates=candidates,
+                    board=board,
+                )
+                mutated_population.append((mutated_fitness_score, mutated_board))
+
+    # Creating and ranking crossover population.
+
+    tournament_size = len(population) // 2
+
+    if tournament_size == 0:
+        tournament_size = 2
+
+    with measure_phase(r"ranking"):
+        tournament_members = heapq.nsmallest(tournament_size, population, key=lambda individual: individual[0])
+
+    with measure_phase(r"crossover"):
+
+        crossover_boards = [
+            exchange_random_row(board, choice(tournament_members)[1])
+            for _, board in population
+            if uniform(0, 1) <= crossover_probability
+        ]
+
+        crossover_population = list(
+            zip(
+                calculate_board_fitness_batch(
+                    boards=crossover_boards, zone_height=zone_height, zone_length=zone_length
+                ),
+                crossover_boards,
+            )
+        )
+
+    # Keeping just the most apt individuals of the extended population, without sorting all of it.
+
+    with measure_phase(r"sort"):
+        next_population = heapq.nsmallest(
+            population_size,
+            itertools.chain(population, crossover_population, mutated_population),
+            key=lambda individual: individual[0],
+        )
+
+    logger.debug(msg=r"generation evolution calculated")
+
+    return next_population
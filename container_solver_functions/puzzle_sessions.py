@@ -0,0 +1,126 @@
+from general_solvers_functions import calculate_board_missing_numbers
+from general_solvers_functions import calculate_board_candidates
+from general_solvers_functions import calculate_board_free_cells
+
+from logger import setup_logger
+
+from collections import OrderedDict
+from os import environ
+from uuid import uuid4
+import time
+import os
+
+logger = setup_logger(logger_name=os.path.basename(__file__).split(".")[0])
+
+puzzle_sessions = OrderedDict()
+
+
+def evict_puzzle_sessions() -> None:
+
+    """Evict Puzzle Sessions
+
+    This function removes the puzzle sessions that were not used during the sessions time to live, and the least recently used
+    sessions if there are more sessions than the sessions capacity, both limits are defined by environment variables.
+    """
+
+    sessions_capacity = int(environ.get("SESSIONS_CAPACITY", "1000"))
+    current_time = time.monotonic()
+
+    while len(puzzle_sessions) > 0:
+        session_id, session = next(iter(puzzle_sessions.items()))
+        if session["expiration"] > current_time and len(puzzle_sessions) <= sessions_capacity:
+            break
+        logger.debug(msg=f"evicting puzzle session: {session_id}")
+        del puzzle_sessions[session_id]
+
+
+def create_puzzle_session(
+    fixed_numbers_board: list, zone_height: int, zone_length: int, session_id: str = None
+) -> str:
+
+    """Create Puzzle Session
+
+    This function registers the fixed numbers board and the zones measures of a puzzle and derives from them the data that the
+    general solver functions use on every call, like the free cells and the missing numbers of every row and the legal candidates
+    of every cell, so the solvers can reference the puzzle using the session id instead of sending the fixed numbers board on
+    every request.
+
+    Args:
+        fixed_numbers_board (list): A board representation that includes just the fixed numbers.
+        zone_height (int): The zones height.
+        zone_length (int): The zones length.
+        session_id (str): The session id to use, a new one is generated if it's not given.
+
+    Returns:
+        str: The session id.
+    """
+
+    if session_id is None:
+        session_id = uuid4().hex
+
+    puzzle_sessions[session_id] = {
+        "fixedNumbersBoard": fixed_numbers_board,
+        "zoneHeight": zone_height,
+        "zoneLength": zone_length,
+        "freeCells": calculate_board_free_cells(fixed_numbers_board=fixed_numbers_board),
+        "missingNumbers": calculate_board_missing_numbers(
+            fixed_numbers_board=fixed_numbers_board,
+            zone_height=zone_height,
+            zone_length=zone_length,
+        ),
+        "candidates": calculate_board_candidates(
+            fixed_numbers_board=fixed_numbers_board,
+            zone_height=zone_height,
+            zone_length=zone_length,
+        ),
+        "expiration": time.monotonic() + float(environ.get("SESSIONS_TTL", "600")),
+    }
+    puzzle_sessions.move_to_end(session_id)
+
+    evict_puzzle_sessions()
+
+    logger.debug(msg=f"puzzle session created: {session_id}")
+
+    return session_id
+
+
+def get_puzzle_session(session_id: str) -> dict:
+
+    """Get Puzzle Session
+
+    This function returns the data of a puzzle session and extends its time to live.
+
+    Args:
+        session_id (str): The session id.
+
+    Returns:
+        dict: The puzzle session data or None if the session doesn't exists or expired.
+    """
+
+    evict_puzzle_sessions()
+
+    session = puzzle_sessions.get(session_id)
+
+    if session is not None:
+        session["expiration"] = time.monotonic() + float(environ.get("SESSIONS_TTL", "600"))
+        puzzle_sessions.move_to_end(session_id)
+
+    return session
+
+
+def delete_puzzle_session(session_id: str) -> bool:
+
+    """Delete Puzzle Session
+
+    This function removes a puzzle session.
+
+    Args:
+        session_id (str): The session id.
+
+    Returns:
+        bool: Indicates if the session existed.
+    """
+
+    logger.debug(msg=f"deleting puzzle session: {session_id}")
+
+    return puzzle_sessions.pop(session_id, None) is not None
@@ -0,0 +1,250 @@
+from aiohttp.web_request import Request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from aiohttp import web
+from io import StringIO
+import cProfile
+import asyncio
+import pstats
+import time
+
+DEBUG_TIMINGS_HEADER = r"X-Debug-Timings"
+DEBUG_PROFILE_VALUE = r"profile"
+
+request_timings = ContextVar(r"request_timings", default=None)
+profile_lock = None
+
+
+def get_request_timings() -> dict:
+
+    """Get Request Timings
+
+    This function returns the phase timings of the request that is being answered, the timings are just collected for the
+    requests that have the debug timings header.
+
+    Returns:
+        dict: The calls, total milliseconds and maximum milliseconds of every phase or None if the request is not being timed.
+    """
+
+    return request_timings.get()
+
+
+def is_profile_requested(request: Request) -> bool:
+
+    """Is Profile Requested
+
+    This function checks if a request asks for a profile of the solving in the debug timings header.
+
+    Args:
+        request (Request): Any http request made to the api.
+
+    Returns:
+        bool: Indicates if the profile is requested.
+    """
+
+    return request.headers.get(DEBUG_TIMINGS_HEADER, "").strip().lower() == DEBUG_PROFILE_VALUE
+
+
+@contextmanager
+def measure_phase(phase: str):
+
+    """Measure Phase
+
+    This function measures the duration of the block of a with statement and adds it to the timings of the phase in the request
+    that is being answered, nothing is measured if the request is not being timed, so the phases can be marked in any function
+    without slowing down the normal requests.
+
+    Args:
+        phase (str): The phase name.
+    """
+
+    timings = request_timings.get()
+
+    if timings is None:
+        yield
+        return
+
+    start_time = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        elapsed_ms = 1000 * (time.perf_counter() - start_time)
+        phase_timings = timings.setdefault(phase, {"calls": 0, "totalMs": 0.0, "maxMs": 0.0})
+        phase_timings["calls"] += 1
+        phase_timings["totalMs"] += elapsed_ms
+        phase_timings["maxMs"] = max(phase_timings["maxMs"], elapsed_ms)
+
+
+def merge_request_timings(timings: dict) -> None:
+
+    """Merge Request Timings
+
+    This function adds the phase timings measured out of the request context, like the timings returned by a process pool worker,
+    to the timings of the request that is being answered, nothing is merged if the request is not being timed.
+
+    Args:
+        timings (dict): The phase timings to merge.
+    """
+
+    current_timings = request_timings.get()
+
+    if current_timings is None:
+        return
+
+    for phase, phase_timings in timings.items():
+        current_phase_timings = current_timings.setdefault(phase, {"calls": 0, "totalMs": 0.0, "maxMs": 0.0})
+        current_phase_timings["calls"] += phase_timings["calls"]
+        current_phase_timings["totalMs"] += phase_timings["totalMs"]
+        current_phase_timings["maxMs"] = max(current_phase_timings["maxMs"], phase_timings["maxMs"])
+
+
+def run_timed_function(function, **kwargs) -> tuple:
+
+    """Run Timed Function
+
+    This function runs a function measuring its phases in new timings, the context of the request is not copied to the process
+    pool workers, so the pooled functions are run with this function and the api process merges the returned timings in the
+    request timings, the phases of the workers that run at the same time add up their durations.
+
+    Args:
+        function (Callable): The function to run.
+        **kwargs: The function arguments.
+
+    Returns:
+        Any: The function result.
+        dict: The phase timings of the function.
+    """
+
+    timings = dict()
+    timings_token = request_timings.set(timings)
+
+    try:
+        result = function(**kwargs)
+    finally:
+        request_timings.reset(timings_token)
+
+    return result, timings
+
+
+def round_request_timings(timings: dict) -> dict:
+
+    """Round Request Timings
+
+    This function rounds the milliseconds of the phase timings of a request for sending them in a response body.
+
+    Args:
+        timings (dict): The phase timings of a request.
+
+    Returns:
+        dict: The phase timings with the milliseconds rounded to microseconds.
+    """
+
+    return {
+        phase: {
+            "calls": phase_timings["calls"],
+            "totalMs": round(phase_timings["totalMs"], 3),
+            "maxMs": round(phase_timings["maxMs"], 3),
+        }
+        for phase, phase_timings in timings.items()
+    }
+
+
+def build_server_timing_header(timings: dict, total_ms: float) -> str:
+
+    """Build Server Timing Header
+
+    This function formats the phase timings of a request as a server timing header value, the duration of every phase is its
+    total time in milliseconds and the calls are sent in the description.
+
+    Args:
+        timings (dict): The phase timings of a request.
+        total_ms (float): The total time of the request in milliseconds.
+
+    Returns:
+        str: The server timing header value.
+    """
+
+    server_timings = [
+        f'{phase};desc="{phase_timings["calls"]} calls";dur={phase_timings["totalMs"]:.3f}'
+        for phase, phase_timings in timings.items()
+    ]
+    server_timings.append(f"total;dur={total_ms:.3f}")
+
+    return ", ".join(server_timings)
+
+
+async def profile_awaitable(awaitable, entries: int = 25) -> tuple:
+
+    """Profile Awaitable
+
+    This function awaits an awaitable with the python profiler enabled and summarizes the functions with the highest cumulative
+    time, the profiler measures the whole event loop thread, so the other requests answered at the same time are also included,
+    and just one profiler can be enabled in the thread, so the profiled awaitables wait for the previous profile to end.
+
+    Args:
+        awaitable (Awaitable): The profiled awaitable.
+        entries (int): The number of functions in the summary.
+
+    Returns:
+        Any: The awaitable result.
+        str: The profile summary.
+    """
+
+    global profile_lock
+
+    # The lock is created on the first profile so it belongs to the event loop of the api.
+
+    if profile_lock is None:
+        profile_lock = asyncio.Lock()
+
+    async with profile_lock:
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        try:
+            result = await awaitable
+        finally:
+            profiler.disable()
+
+    summary = StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(entries)
+
+    return result, summary.getvalue()
+
+
+@web.middleware
+async def request_timings_middleware(request: Request, handler) -> web.StreamResponse:
+
+    """Request Timings Middleware
+
+    This function collects the phase timings of the requests that have the debug timings header and sends them in the server
+    timing header of the response, the streamed responses send their headers before the phases end, so they don't get the header.
+
+    Args:
+        request (Request): Any http request made to the api.
+        handler (Callable): The next handler of the request.
+
+    Returns:
+        web.StreamResponse: The response of the handler.
+    """
+
+    if DEBUG_TIMINGS_HEADER not in request.headers:
+        return await handler(request)
+
+    timings = dict()
+    timings_token = request_timings.set(timings)
+    start_time = time.perf_counter()
+
+    try:
+        response = await handler(request)
+    finally:
+        request_timings.reset(timings_token)
+
+    if response.prepared is False:
+        response.headers["Server-Timing"] = build_server_timing_header(
+            timings=timings, total_ms=1000 * (time.perf_counter() - start_time)
+        )
+
+    return response
@@ -0,0 +1,6 @@
+import sys
+import os
+
+# The api modules are imported by their file names as in the container, so the api directory is added to the python path.
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
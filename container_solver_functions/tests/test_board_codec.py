@@ -0,0 +1,72 @@
+from board_codec import MSGPACK_CONTENT_TYPE
+from board_codec import JSON_CONTENT_TYPE
+from board_codec import decode_board
+from board_codec import encode_board
+from board_codec import decode_body
+from board_codec import encode_body
+
+import pytest
+
+BOARD = [[0, 3, 0, 4], [4, 0, 3, 2], [1, 0, 0, 0], [0, 0, 2, 1]]
+SOLUTION_BOARD = [[2, 3, 1, 4], [4, 1, 3, 2], [1, 2, 4, 3], [3, 4, 2, 1]]
+
+
+def test_board_round_trip_keeps_the_numbers() -> None:
+
+    """A packed board has the size and zones header and unpacks to the same rows."""
+
+    packed_board = encode_board(BOARD, zone_height=2, zone_length=2)
+
+    assert packed_board[:3] == bytes((4, 2, 2))
+    assert len(packed_board) == 3 + 16
+    assert decode_board(packed_board) == BOARD
+
+
+@pytest.mark.parametrize("content_type", [MSGPACK_CONTENT_TYPE, JSON_CONTENT_TYPE])
+def test_body_round_trip_keeps_the_boards(content_type: str) -> None:
+
+    """The boards and the rest of the body values survive the round trip with both content types."""
+
+    body = {
+        "fixedNumbersBoard": BOARD,
+        "solutionBoard": SOLUTION_BOARD,
+        "boards": [BOARD, SOLUTION_BOARD],
+        "fitnessScores": [14, 0],
+        "sessionId": "a1b2",
+        "mutation": 0.25,
+    }
+
+    raw_body = encode_body(body, content_type=content_type, zone_height=2, zone_length=2)
+
+    assert decode_body(raw_body, content_type=content_type) == body
+
+
+def test_msgpack_body_packs_the_boards() -> None:
+
+    """The msgpack bodies send the boards as packed boards, so they are smaller than the json bodies."""
+
+    body = {"boards": [SOLUTION_BOARD] * 50}
+
+    msgpack_body = encode_body(body, content_type=MSGPACK_CONTENT_TYPE, zone_height=2, zone_length=2)
+    json_body = encode_body(body, content_type=JSON_CONTENT_TYPE)
+
+    assert encode_board(SOLUTION_BOARD, 2, 2) in msgpack_body
+    assert len(msgpack_body) < len(json_body)
+
+
+def test_unknown_content_type_is_json() -> None:
+
+    """Any content type different from msgpack is serialized as json."""
+
+    body = {"board": BOARD}
+
+    assert encode_body(body, content_type=r"text/plain") == encode_body(body, content_type=JSON_CONTENT_TYPE)
+    assert decode_body(b'{"board": [[1]]}', content_type=r"text/plain") == {"board": [[1]]}
+
+
+def test_numbers_out_of_a_byte_are_not_packed() -> None:
+
+    """The packed boards hold numbers up to 255, the bigger ones are rejected instead of being truncated."""
+
+    with pytest.raises(ValueError):
+        encode_board([[256]])
@@ -0,0 +1,100 @@
+from general_solvers_functions import calculate_board_fitness_single
+
+from exact_solver import solve_board_exactly
+
+import pytest
+
+
+def parse_board(rows: str) -> list:
+
+    """Parse Board
+
+    This function builds a board from its rows written as digits separated by spaces.
+    """
+
+    return [[int(number) for number in row] for row in rows.split()]
+
+
+EASY_BOARD = parse_board("530070000 600195000 098000060 800060003 400803001 700020006 060000280 000419005 000080079")
+EASY_SOLUTION = parse_board("534678912 672195348 198342567 859761423 426853791 713924856 961537284 287419635 345286179")
+ESCARGOT_BOARD = parse_board("100007090 030020008 009600500 005300900 010080002 600004000 300000010 040000007 007000300")
+
+
+def keeps_fixed_numbers(board: list, solution_board: list) -> bool:
+
+    """Keeps Fixed Numbers
+
+    This function checks that every fixed number of a board is in the same cell of the solution.
+    """
+
+    return all(
+        number == 0 or number == solution_board[row_index][column_index]
+        for row_index, row in enumerate(board)
+        for column_index, number in enumerate(row)
+    )
+
+
+def test_solves_a_known_puzzle() -> None:
+
+    """A puzzle with a single solution is solved to that solution."""
+
+    solution_board, search_result, explored_nodes = solve_board_exactly(fixed_numbers_board=EASY_BOARD, zone_height=3, zone_length=3)
+
+    assert (solution_board, search_result) == (EASY_SOLUTION, "solved")
+    assert explored_nodes >= sum(number == 0 for row in EASY_BOARD for number in row)
+
+
+def test_solves_a_puzzle_that_needs_search() -> None:
+
+    """A puzzle that the propagation can't solve is solved by the search to a board without collisions."""
+
+    solution_board, search_result, _ = solve_board_exactly(fixed_numbers_board=ESCARGOT_BOARD, zone_height=3, zone_length=3)
+
+    assert search_result == "solved"
+    assert keeps_fixed_numbers(ESCARGOT_BOARD, solution_board)
+    assert calculate_board_fitness_single(board=solution_board, zone_height=3, zone_length=3) == 0
+
+
+@pytest.mark.parametrize("zone_height,zone_length", [(2, 2), (2, 3), (3, 2), (3, 3)])
+def test_solves_empty_boards(zone_height: int, zone_length: int) -> None:
+
+    """An empty board of any zones measures is filled without collisions."""
+
+    board_size = zone_height * zone_length
+    board = [[0] * board_size for _ in range(board_size)]
+
+    solution_board, search_result, _ = solve_board_exactly(fixed_numbers_board=board, zone_height=zone_height, zone_length=zone_length)
+
+    assert search_result == "solved"
+    assert calculate_board_fitness_single(board=solution_board, zone_height=zone_height, zone_length=zone_length) == 0
+
+
+def test_repeated_fixed_numbers_are_unsolvable() -> None:
+
+    """A board with a fixed number repeated in a unit is unsolvable without searching."""
+
+    board = [[1, 0, 0, 1], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+    assert solve_board_exactly(fixed_numbers_board=board, zone_height=2, zone_length=2) == (None, "unsolvable", 0)
+
+
+def test_board_without_solution_is_unsolvable() -> None:
+
+    """A board without repeated fixed numbers but without solution is unsolvable after the search."""
+
+    board = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 2, 4]]
+
+    solution_board, search_result, _ = solve_board_exactly(fixed_numbers_board=board, zone_height=2, zone_length=2)
+
+    assert (solution_board, search_result) == (None, "unsolvable")
+
+
+def test_node_limit_stops_the_search() -> None:
+
+    """The search stops without a solution when the node limit is reached."""
+
+    assert solve_board_exactly(fixed_numbers_board=ESCARGOT_BOARD, zone_height=3, zone_length=3, node_limit=10) == (
+        None,
+        "node_limit",
+        10,
+    )
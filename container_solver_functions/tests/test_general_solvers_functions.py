@@ -0,0 +1,181 @@
+from exact_solver import solve_board_exactly
+
+import general_solvers_functions as solvers_functions
+import random
+
+import pytest
+
+BOARD_ZONES = [(2, 2), (2, 3), (3, 3), (4, 4), (5, 5)]
+
+
+def build_random_board(board_size: int, empty_ratio: float, generator: random.Random) -> list:
+
+    """Build Random Board
+
+    This function builds a board where every row is a random permutation of the board numbers and a fraction of the cells are
+    emptied with zeros.
+    """
+
+    return [
+        [0 if generator.random() < empty_ratio else number for number in generator.sample(range(1, board_size + 1), board_size)]
+        for _ in range(board_size)
+    ]
+
+
+@pytest.mark.parametrize("zone_height,zone_length", BOARD_ZONES)
+@pytest.mark.parametrize("empty_ratio", [0.0, 0.1, 0.5, 1.0])
+def test_fitness_engines_match_the_reference(zone_height: int, zone_length: int, empty_ratio: float) -> None:
+
+    """The bitmask kernel and the vectorized engine give the reference reports, the zeros are counted as distinct numbers."""
+
+    generator = random.Random(zone_height * 100 + zone_length * 10 + int(empty_ratio * 10))
+    board_size = zone_height * zone_length
+    boards = [build_random_board(board_size, empty_ratio, generator) for _ in range(30)]
+    zones = {"zone_height": zone_height, "zone_length": zone_length}
+
+    reference_reports = [tuple(solvers_functions.calculate_board_fitness_report(board=board, **zones)) for board in boards]
+
+    assert [solvers_functions.calculate_board_fitness_report_bitmask(board=board, **zones) for board in boards] == reference_reports
+    assert [tuple(report) for report in solvers_functions.calculate_board_fitness_report_batch(boards=boards, **zones)] == (
+        reference_reports
+    )
+    assert solvers_functions.calculate_board_fitness_batch(boards=boards, **zones) == [report[0] for report in reference_reports]
+    assert [solvers_functions.calculate_board_fitness_single_bitmask(board=board, **zones) for board in boards] == [
+        solvers_functions.calculate_board_fitness_single(board=board, **zones) for board in boards
+    ]
+
+
+def test_empty_board_keeps_the_reference_report() -> None:
+
+    """An empty board scores the zeros as one distinct number in every unit."""
+
+    board = [[0] * 9 for _ in range(9)]
+
+    assert solvers_functions.calculate_board_fitness_report_bitmask(board=board, zone_height=3, zone_length=3) == (216, 72, 72, 72)
+    assert solvers_functions.calculate_board_fitness_report_batch(boards=[board, board], zone_height=3, zone_length=3) == [
+        (216, 72, 72, 72),
+        (216, 72, 72, 72),
+    ]
+
+
+@pytest.mark.parametrize("invalid_number", [-1, 10, 300, 2 ** 40])
+def test_out_of_range_numbers_keep_the_reference_report(invalid_number: int) -> None:
+
+    """The numbers out of the board range are scored as distinct numbers without failing."""
+
+    generator = random.Random(invalid_number)
+    boards = [build_random_board(9, 0.0, generator) for _ in range(3)]
+    boards[0][4][4] = invalid_number
+    boards[1][0][0] = invalid_number
+    boards[1][8][8] = invalid_number
+    zones = {"zone_height": 3, "zone_length": 3}
+
+    reference_reports = [tuple(solvers_functions.calculate_board_fitness_report(board=board, **zones)) for board in boards]
+
+    assert [solvers_functions.calculate_board_fitness_report_bitmask(board=board, **zones) for board in boards] == reference_reports
+    assert [tuple(report) for report in solvers_functions.calculate_board_fitness_report_batch(boards=boards, **zones)] == (
+        reference_reports
+    )
+
+
+def parse_board(rows: str) -> list:
+
+    """Parse Board
+
+    This function builds a board from its rows written as digits separated by spaces.
+    """
+
+    return [[int(number) for number in row] for row in rows.split()]
+
+
+EASY_BOARD = parse_board("530070000 600195000 098000060 800060003 400803001 700020006 060000280 000419005 000080079")
+EASY_SOLUTION = parse_board("534678912 672195348 198342567 859761423 426853791 713924856 961537284 287419635 345286179")
+ESCARGOT_BOARD = parse_board("100007090 030020008 009600500 005300900 010080002 600004000 300000010 040000007 007000300")
+
+
+def has_unit_repetitions(board: list, zone_height: int, zone_length: int) -> bool:
+
+    """Has Unit Repetitions
+
+    This function checks if a number is repeated in a row, column or zone of a board, the empty cells are not numbers.
+    """
+
+    cells = [number for row in board for number in row]
+    units = [unit for units in solvers_functions.build_board_units(len(board), zone_height, zone_length) for unit in units]
+    unit_numbers = [[cells[cell_index] for cell_index in unit if cells[cell_index] != 0] for unit in units]
+
+    return any(len(set(numbers)) != len(numbers) for numbers in unit_numbers)
+
+
+def test_propagation_solves_a_singles_board() -> None:
+
+    """A board that needs just naked and hidden singles is fully solved by the propagation."""
+
+    propagated_board = solvers_functions.propagate_board_constraints(fixed_numbers_board=EASY_BOARD, zone_height=3, zone_length=3)
+
+    assert propagated_board == solvers_functions.freeze_board(EASY_SOLUTION)
+
+
+def test_propagation_stops_without_singles() -> None:
+
+    """A board that needs search keeps its free cells once there are no more singles, and every filled single is right."""
+
+    propagated_board = solvers_functions.propagate_board_constraints(
+        fixed_numbers_board=ESCARGOT_BOARD, zone_height=3, zone_length=3
+    )
+    solution_board, _, _ = solve_board_exactly(fixed_numbers_board=ESCARGOT_BOARD, zone_height=3, zone_length=3)
+
+    assert any(number == 0 for row in propagated_board for number in row)
+    assert all(
+        propagated_board[row_index][column_index] in (fixed_number, solution_board[row_index][column_index])
+        for row_index, row in enumerate(ESCARGOT_BOARD)
+        for column_index, fixed_number in enumerate(row)
+    )
+
+
+@pytest.mark.parametrize("zone_height,zone_length", [(2, 2), (2, 3)])
+def test_propagation_keeps_the_boards_solvable(zone_height: int, zone_length: int) -> None:
+
+    """On random boards, solvable or not, the propagation keeps the fixed numbers, doesn't repeat numbers in the units and
+    doesn't make a solvable board unsolvable."""
+
+    generator = random.Random(zone_height * 10 + zone_length)
+    board_size = zone_height * zone_length
+
+    for _ in range(300):
+
+        board = [[0] * board_size for _ in range(board_size)]
+        for _ in range(generator.randint(1, 2 * board_size)):
+            board[generator.randrange(board_size)][generator.randrange(board_size)] = generator.randint(1, board_size)
+
+        if has_unit_repetitions(board, zone_height, zone_length):
+            continue
+
+        propagated_board = solvers_functions.propagate_board_constraints(
+            fixed_numbers_board=board, zone_height=zone_height, zone_length=zone_length
+        )
+        _, search_result, _ = solve_board_exactly(fixed_numbers_board=board, zone_height=zone_height, zone_length=zone_length)
+        _, propagated_search_result, _ = solve_board_exactly(
+            fixed_numbers_board=propagated_board, zone_height=zone_height, zone_length=zone_length
+        )
+
+        assert all(
+            propagated_board[row_index][column_index] == number
+            for row_index, row in enumerate(board)
+            for column_index, number in enumerate(row)
+            if number != 0
+        )
+        assert not has_unit_repetitions(propagated_board, zone_height, zone_length)
+        assert search_result == "unsolvable" or propagated_search_result == "solved"
+
+
+def test_propagation_stops_when_two_numbers_need_the_same_cell() -> None:
+
+    """The propagation stops at the first round if a cell is the hidden single of two numbers, instead of filling one of them."""
+
+    board = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 2, 4]]
+
+    assert solvers_functions.propagate_board_constraints(fixed_numbers_board=board, zone_height=2, zone_length=2) == (
+        solvers_functions.freeze_board(board)
+    )
+    assert solve_board_exactly(fixed_numbers_board=board, zone_height=2, zone_length=2)[1] == "unsolvable"
@@ -0,0 +1,93 @@
+import puzzle_sessions
+
+from collections import OrderedDict
+
+import pytest
+
+BOARD = [[0, 3, 0, 4], [4, 0, 3, 2], [1, 0, 0, 0], [0, 0, 2, 1]]
+
+
+class FakeClock:
+
+    """Fake Clock
+
+    This class replaces the monotonic clock of the puzzle sessions, so the time to live can be tested without waiting.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+
+    """A fake clock and an empty sessions store, with a capacity of three sessions and a time to live of ten seconds."""
+
+    fake_clock = FakeClock()
+
+    monkeypatch.setattr(puzzle_sessions.time, "monotonic", fake_clock)
+    monkeypatch.setattr(puzzle_sessions, "puzzle_sessions", OrderedDict())
+    monkeypatch.setenv("SESSIONS_CAPACITY", "3")
+    monkeypatch.setenv("SESSIONS_TTL", "10")
+
+    return fake_clock
+
+
+def create_session(session_id: str) -> str:
+
+    """Create Session
+
+    This function creates a 4x4 puzzle session with the given id.
+    """
+
+    return puzzle_sessions.create_puzzle_session(fixed_numbers_board=BOARD, zone_height=2, zone_length=2, session_id=session_id)
+
+
+def test_session_keeps_the_puzzle_data(clock: FakeClock) -> None:
+
+    """A session returns the puzzle and the data derived from it, and it's removed when it's deleted."""
+
+    session_id = puzzle_sessions.create_puzzle_session(fixed_numbers_board=BOARD, zone_height=2, zone_length=2)
+    session = puzzle_sessions.get_puzzle_session(session_id)
+
+    assert session["fixedNumbersBoard"] == BOARD
+    assert (session["zoneHeight"], session["zoneLength"]) == (2, 2)
+    assert puzzle_sessions.delete_puzzle_session(session_id) is True
+    assert puzzle_sessions.delete_puzzle_session(session_id) is False
+    assert puzzle_sessions.get_puzzle_session(session_id) is None
+
+
+def test_sessions_expire_after_the_time_to_live(clock: FakeClock) -> None:
+
+    """A session expires when it's not used during the time to live, and every use extends it."""
+
+    create_session("used")
+    create_session("unused")
+
+    clock.now += 8
+    assert puzzle_sessions.get_puzzle_session("used") is not None
+
+    clock.now += 8
+    assert puzzle_sessions.get_puzzle_session("used") is not None
+    assert puzzle_sessions.get_puzzle_session("unused") is None
+
+    clock.now += 11
+    assert puzzle_sessions.get_puzzle_session("used") is None
+
+
+def test_least_recently_used_sessions_are_evicted(clock: FakeClock) -> None:
+
+    """The least recently used session is evicted when the sessions are more than the capacity."""
+
+    for session_id in ("first", "second", "third"):
+        create_session(session_id)
+
+    assert puzzle_sessions.get_puzzle_session("first") is not None
+
+    create_session("fourth")
+
+    assert list(puzzle_sessions.puzzle_sessions) == ["third", "first", "fourth"]
+    assert puzzle_sessions.get_puzzle_session("second") is None